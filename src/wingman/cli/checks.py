@@ -0,0 +1,10 @@
+"""Status-line helpers shared by the setup wizard and the console."""
+
+from rich.text import Text
+
+
+def make_check(ok: bool, label: str) -> Text:
+    """Build a "✓ label" / "✗ label" status line as a single styled Text."""
+    if ok:
+        return Text.assemble("  ", ("✓", "green"), " ", label)
+    return Text.assemble("  ", ("✗", "red"), " ", label)
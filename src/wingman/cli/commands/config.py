@@ -12,24 +12,9 @@ console = Console()
 
 
 def config(
-    edit: bool = typer.Option(
-        False,
-        "--edit",
-        "-e",
-        help="Open config file in editor",
-    ),
-    show: bool = typer.Option(
-        False,
-        "--show",
-        "-s",
-        help="Show current config",
-    ),
-    path: bool = typer.Option(
-        False,
-        "--path",
-        "-p",
-        help="Show config file path",
-    ),
+    edit: bool = False,
+    show: bool = False,
+    path: bool = False,
 ) -> None:
     """
     View or edit Wingman configuration.
@@ -11,12 +11,7 @@ console = Console()
 
 
 def init(
-    force: bool = typer.Option(
-        False,
-        "--force",
-        "-f",
-        help="Overwrite existing configuration",
-    ),
+    force: bool = False,
 ) -> None:
     """
     Interactive setup wizard for Wingman.
@@ -11,24 +11,9 @@ console = Console()
 
 
 def logs(
-    follow: bool = typer.Option(
-        True,
-        "--follow/--no-follow",
-        "-f/-F",
-        help="Follow log output (stream new lines)",
-    ),
-    lines: int = typer.Option(
-        50,
-        "--lines",
-        "-n",
-        help="Number of lines to show",
-    ),
-    error: bool = typer.Option(
-        False,
-        "--error",
-        "-e",
-        help="Show error log instead of main log",
-    ),
+    follow: bool = True,
+    lines: int = 50,
+    error: bool = False,
 ) -> None:
     """
     View Wingman activity logs.
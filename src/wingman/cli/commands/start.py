@@ -13,12 +13,7 @@ console = Console()
 
 
 def start(
-    foreground: bool = typer.Option(
-        False,
-        "--foreground",
-        "-f",
-        help="Run in foreground instead of as daemon",
-    ),
+    foreground: bool = False,
 ) -> None:
     """
     Start the Wingman bot.
@@ -65,6 +60,9 @@ def start(
         console.print()
 
         try:
+            from wingman.core.agent import install_event_loop_policy
+
+            install_event_loop_policy()
             asyncio.run(_run_foreground(settings))
         except KeyboardInterrupt:
             console.print()
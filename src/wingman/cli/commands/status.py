@@ -72,13 +72,11 @@ def status() -> None:
 
 def _format_uptime(seconds: float) -> str:
     """Format uptime in human-readable format."""
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    elif seconds < 3600:
-        mins = int(seconds / 60)
-        secs = int(seconds % 60)
+    secs = int(seconds)
+    if secs < 60:
+        return f"{secs}s"
+    mins, secs = divmod(secs, 60)
+    if mins < 60:
         return f"{mins}m {secs}s"
-    else:
-        hours = int(seconds / 3600)
-        mins = int((seconds % 3600) / 60)
-        return f"{hours}h {mins}m"
+    hours, mins = divmod(mins, 60)
+    return f"{hours}h {mins}m"
@@ -11,18 +11,8 @@ console = Console()
 
 
 def uninstall(
-    keep_config: bool = typer.Option(
-        False,
-        "--keep-config",
-        "-k",
-        help="Keep configuration files (only remove data and stop daemon)",
-    ),
-    force: bool = typer.Option(
-        False,
-        "--force",
-        "-f",
-        help="Don't ask for confirmation",
-    ),
+    keep_config: bool = False,
+    force: bool = False,
 ) -> None:
     """
     Uninstall Wingman and remove all data.
@@ -160,4 +160,6 @@ class ConsoleApp:
                 console.print(f"[red]Unknown command: /{cmd.command}[/red]")
                 console.print("[dim]Type /help for available commands.[/dim]")
 
+        if self._rpc_client is not None:
+            self._rpc_client.close()
         console.print("[dim]Goodbye.[/dim]")
@@ -76,6 +76,9 @@ class BotCommand(BaseCommand):
                     for e in errors:
                         print_error(e)
                     return
+                from wingman.core.agent import install_event_loop_policy
+
+                install_event_loop_policy()
                 asyncio.run(self._run_foreground(settings))
             except KeyboardInterrupt:
                 console.print("[yellow]Wingman stopped.[/yellow]")
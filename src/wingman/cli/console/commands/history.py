@@ -40,6 +40,7 @@ class ChatsCommand(BaseCommand):
 
         store = MessageStore(db_path)
         chats = store.get_recent_chats(limit)
+        store.close()
 
         if not chats:
             console.print("[dim]No chats found.[/dim]")
@@ -102,6 +103,7 @@ class HistoryCommand(BaseCommand):
 
         store = MessageStore(db_path)
         messages = store.get_recent_messages(chat_id, limit)
+        store.close()
 
         if not messages:
             console.print("[dim]No messages found for this chat.[/dim]")
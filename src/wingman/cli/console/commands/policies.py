@@ -285,7 +285,7 @@ class PoliciesCommand(BaseCommand):
         if group:
             console.print(f"  Group:         {group.name} (category={group.category.value})")
         console.print(f'  Text:          "{text}"')
-        console.print(f"  Is mentioned:  {context.is_mentioned}")
+        console.print(f"  Is mentioned:  {evaluator.check_mentioned(text)}")
         console.print()
 
         if decision.should_respond:
@@ -30,6 +30,7 @@ class StatsCommand(BaseCommand):
 
         store = MessageStore(db_path)
         stats = store.get_stats()
+        store.close()
 
         console.print("\n  [bold]Bot Statistics[/bold]\n")
         console.print(f"  Total messages:   {stats['total_messages']}")
@@ -75,6 +76,7 @@ class ActivityCommand(BaseCommand):
 
         store = MessageStore(db_path)
         activity = store.get_recent_activity(limit)
+        store.close()
 
         if not activity:
             console.print("[dim]No bot activity found.[/dim]")
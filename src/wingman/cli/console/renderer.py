@@ -1,11 +1,32 @@
 """Rich output helpers for the interactive console."""
 
+import os
+import sys
+from functools import lru_cache
+
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
+from rich.text import Text
+
+# Detect terminal capabilities once at import rather than on every print.
+# Off a TTY, leave both to Rich so FORCE_COLOR / NO_COLOR / TTY_COMPATIBLE apply
+_IS_TTY = sys.stdout.isatty()
+if _IS_TTY and os.environ.get("COLORTERM") in ("truecolor", "24bit"):
+    _COLOR_SYSTEM = "truecolor"
+else:
+    _COLOR_SYSTEM = "auto"
 
-console = Console()
+console = Console(
+    force_terminal=True if _IS_TTY else None,
+    color_system=_COLOR_SYSTEM,
+    highlight=False,
+    markup=True,
+    legacy_windows=False,
+)
 
 
 def print_error(message: str) -> None:
@@ -33,13 +54,23 @@ def print_dim(message: str) -> None:
     console.print(f"[dim]{message}[/dim]")
 
 
+@lru_cache(maxsize=1)
+def _yaml_lexer() -> Lexer:
+    """Get the Pygments YAML lexer, resolved once."""
+    return get_lexer_by_name("yaml")
+
+
 def print_yaml(content: str, title: str | None = None) -> None:
-    """Print syntax-highlighted YAML."""
-    syntax = Syntax(content, "yaml", theme="monokai", line_numbers=False)
+    """Print syntax-highlighted YAML (plain text when not writing to a terminal)."""
+    if console.is_terminal:
+        renderable = Syntax(content, _yaml_lexer(), theme="monokai", line_numbers=False)
+    else:
+        renderable = Text(content.rstrip("\n"))
+
     if title:
-        console.print(Panel(syntax, title=title, border_style="blue"))
+        console.print(Panel(renderable, title=title, border_style="blue"))
     else:
-        console.print(syntax)
+        console.print(renderable)
 
 
 def print_panel(content: str, title: str | None = None, border_style: str = "blue") -> None:
@@ -70,13 +101,11 @@ def format_uptime(seconds: float | None) -> str:
     """Format uptime in human-readable format."""
     if seconds is None:
         return "unknown"
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    elif seconds < 3600:
-        mins = int(seconds / 60)
-        secs = int(seconds % 60)
+    secs = int(seconds)
+    if secs < 60:
+        return f"{secs}s"
+    mins, secs = divmod(secs, 60)
+    if mins < 60:
         return f"{mins}m {secs}s"
-    else:
-        hours = int(seconds / 3600)
-        mins = int((seconds % 3600) / 60)
-        return f"{hours}h {mins}m"
+    hours, mins = divmod(mins, 60)
+    return f"{hours}h {mins}m"
@@ -1,24 +1,14 @@
-"""Main CLI entry point for Wingman."""
+"""Main CLI entry point for Wingman.
+
+Subcommand modules are imported inside each command wrapper so that
+`wingman --version`, `wingman --help` and every other invocation only pay
+for the modules they actually run (questionary, yaml, prompt_toolkit, ...).
+"""
 
 import typer
-from rich.console import Console
 
 from wingman import __version__
 
-from .commands import (
-    auth,
-    config,
-    init,
-    logs,
-    start,
-    status,
-    stop,
-    uninstall,
-)
-from .commands import (
-    console as console_cmd,
-)
-
 # Create main app
 app = typer.Typer(
     name="wingman",
@@ -27,19 +17,187 @@ app = typer.Typer(
     rich_markup_mode="rich",
 )
 
-# Rich console for pretty output
-_console = Console()
 
-# Add subcommands
-app.command()(init.init)
-app.command()(auth.auth)
-app.command()(start.start)
-app.command()(stop.stop)
-app.command()(status.status)
-app.command()(logs.logs)
-app.command()(config.config)
-app.command()(console_cmd.console)
-app.command()(uninstall.uninstall)
+@app.command()
+def init(
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Overwrite existing configuration",
+    ),
+) -> None:
+    """
+    Interactive setup wizard for Wingman.
+
+    Sets up OpenAI API key, bot personality, safety settings,
+    and installs the WhatsApp listener.
+    """
+    from .commands.init import init as _init
+
+    _init(force=force)
+
+
+@app.command()
+def auth() -> None:
+    """
+    Connect to WhatsApp by scanning a QR code.
+
+    Starts the WhatsApp listener in interactive mode to display
+    the QR code for authentication.
+    """
+    from .commands.auth import auth as _auth
+
+    _auth()
+
+
+@app.command()
+def start(
+    foreground: bool = typer.Option(
+        False,
+        "--foreground",
+        "-f",
+        help="Run in foreground instead of as daemon",
+    ),
+) -> None:
+    """
+    Start the Wingman bot.
+
+    By default, starts as a background daemon (macOS launchd).
+    Use --foreground to run in the current terminal.
+    """
+    from .commands.start import start as _start
+
+    _start(foreground=foreground)
+
+
+@app.command()
+def stop() -> None:
+    """
+    Stop the running Wingman bot.
+    """
+    from .commands.stop import stop as _stop
+
+    _stop()
+
+
+@app.command()
+def status() -> None:
+    """
+    Check the status of the Wingman bot.
+    """
+    from .commands.status import status as _status
+
+    _status()
+
+
+@app.command()
+def logs(
+    follow: bool = typer.Option(
+        True,
+        "--follow/--no-follow",
+        "-f/-F",
+        help="Follow log output (stream new lines)",
+    ),
+    lines: int = typer.Option(
+        50,
+        "--lines",
+        "-n",
+        help="Number of lines to show",
+    ),
+    error: bool = typer.Option(
+        False,
+        "--error",
+        "-e",
+        help="Show error log instead of main log",
+    ),
+) -> None:
+    """
+    View Wingman activity logs.
+
+    Streams the log file in real-time by default.
+    Use --no-follow to just show recent lines.
+    """
+    from .commands.logs import logs as _logs
+
+    _logs(follow=follow, lines=lines, error=error)
+
+
+@app.command()
+def config(
+    edit: bool = typer.Option(
+        False,
+        "--edit",
+        "-e",
+        help="Open config file in editor",
+    ),
+    show: bool = typer.Option(
+        False,
+        "--show",
+        "-s",
+        help="Show current config",
+    ),
+    path: bool = typer.Option(
+        False,
+        "--path",
+        "-p",
+        help="Show config file path",
+    ),
+) -> None:
+    """
+    View or edit Wingman configuration.
+
+    Without options, shows an overview of config options.
+    """
+    from .commands.config import config as _config
+
+    _config(edit=edit, show=show, path=path)
+
+
+@app.command()
+def console() -> None:
+    """
+    Launch the interactive Wingman console.
+
+    Provides a REPL with /commands for managing configuration,
+    contacts, policies, messaging, and bot lifecycle.
+    """
+    from .commands.console import console as _console
+
+    _console()
+
+
+@app.command()
+def uninstall(
+    keep_config: bool = typer.Option(
+        False,
+        "--keep-config",
+        "-k",
+        help="Keep configuration files (only remove data and stop daemon)",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Don't ask for confirmation",
+    ),
+) -> None:
+    """
+    Uninstall Wingman and remove all data.
+
+    This will:
+    - Stop the running daemon
+    - Remove the launchd service (macOS)
+    - Remove config files (unless --keep-config)
+    - Remove data files (database, auth state)
+    - Remove log files
+
+    After running this, you can run `pip uninstall wingman-ai` to
+    remove the package itself.
+    """
+    from .commands.uninstall import uninstall as _uninstall
+
+    _uninstall(keep_config=keep_config, force=force)
 
 
 @app.callback(invoke_without_command=True)
@@ -55,7 +213,9 @@ def main(
 ) -> None:
     """Wingman - AI-powered personal chat agent."""
     if version:
-        _console.print(f"Wingman v{__version__}")
+        from rich.console import Console
+
+        Console().print(f"Wingman v{__version__}")
         raise typer.Exit()
 
     # If no subcommand, launch interactive console
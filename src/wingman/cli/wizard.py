@@ -1,15 +1,86 @@
 """Interactive setup wizard for Wingman."""
 
+import io
 import re
+import time
 
 import questionary
 import yaml
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from wingman.cli.checks import make_check
 from wingman.config.paths import WingmanPaths
 from wingman.installer import NodeInstaller
 
+# Use the libyaml C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# Prompt validators (questionary runs these on every keystroke)
+_QUIET_HOURS_RE = re.compile(r"\A\d{1,2}-\d{1,2}\Z")
+_POS_INT_RE = re.compile(r"\A[1-9]\d*\Z")
+
+# Choices for the default tone prompt
+_TONE_CHOICES = (
+    questionary.Choice("casual - Relaxed and friendly", value="casual"),
+    questionary.Choice("friendly - Warm and approachable", value="friendly"),
+    questionary.Choice("professional - Polite and formal", value="professional"),
+)
+
+# Template configs are fixed, so they are written verbatim rather than dumped
+_CONTACTS_YAML = """\
+contacts: {}
+defaults:
+  role: unknown
+  tone: neutral
+  allow_proactive: false
+
+# Add contacts like this:
+# contacts:
+#   "+14155551234@s.whatsapp.net":
+#     name: John
+#     role: friend  # girlfriend, sister, friend, family, colleague, unknown
+#     tone: casual  # affectionate, loving, friendly, casual, sarcastic, neutral
+"""
+
+_GROUPS_YAML = """\
+groups: {}
+defaults:
+  category: unknown
+  reply_policy: selective
+
+# Add groups like this:
+# groups:
+#   "120363012345678901@g.us":
+#     name: Family Chat
+#     category: family  # family, friends, work, unknown
+#     reply_policy: always  # always, selective, never
+"""
+
+_POLICIES_YAML = """\
+rules:
+- name: dm_always
+  conditions:
+    is_dm: true
+  action: always
+- name: group_selective
+  conditions:
+    is_group: true
+  action: selective
+fallback:
+  action: selective
+"""
+
+
+def _dump_yaml(data: dict) -> str:
+    """Render a config dict to a YAML string."""
+    buf = io.StringIO()
+    yaml.dump(data, buf, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+    return buf.getvalue()
+
 
 class SetupWizard:
     """Interactive setup wizard for Wingman."""
@@ -17,6 +88,8 @@ class SetupWizard:
     def __init__(self, paths: WingmanPaths, console: Console):
         self.paths = paths
         self.console = console
+        self._installer = NodeInstaller(paths.node_dir)
+        self._version_info: dict | None = None
 
     def run(self) -> bool:
         """Run the setup wizard. Returns True if setup completed successfully."""
@@ -46,47 +119,52 @@ class SetupWizard:
 
     def _check_prerequisites(self) -> bool:
         """Check system prerequisites."""
-        self.console.print("[bold]Step 1/5: Checking prerequisites...[/bold]")
-        self.console.print()
+        self.console.print("[bold]Step 1/5: Checking prerequisites...[/bold]\n")
+
+        all_ok, issues = self._installer.check_prerequisites()
 
-        installer = NodeInstaller(self.paths.node_dir)
-        all_ok, issues = installer.check_prerequisites()
+        # Collect the step's output and render it in one pass
+        lines: list[RenderableType] = []
 
         # Python check (always passes if we're running)
         import sys
 
         python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-        self.console.print(f"  [green]✓[/green] Python {python_version}")
+        lines.append(make_check(True, f"Python {python_version}"))
 
         # Node.js check
-        version_info = installer.get_version_info()
+        version_info = self._get_version_info()
         if version_info["node_version"]:
-            self.console.print(f"  [green]✓[/green] Node.js {version_info['node_version']}")
+            lines.append(make_check(True, f"Node.js {version_info['node_version']}"))
         else:
-            self.console.print("  [red]✗[/red] Node.js not found")
+            lines.append(make_check(False, "Node.js not found"))
 
         # npm check
         if version_info["npm_version"]:
-            self.console.print(f"  [green]✓[/green] npm {version_info['npm_version']}")
+            lines.append(make_check(True, f"npm {version_info['npm_version']}"))
         else:
-            self.console.print("  [red]✗[/red] npm not found")
+            lines.append(make_check(False, "npm not found"))
 
-        self.console.print()
+        lines.append("")
 
         if not all_ok:
-            self.console.print("[red]Prerequisites not met:[/red]")
-            for issue in issues:
-                self.console.print(f"  - {issue}")
-            self.console.print()
-            self.console.print("Please install the missing prerequisites and try again.")
-            return False
+            lines.append("[red]Prerequisites not met:[/red]")
+            lines.extend(f"  - {issue}" for issue in issues)
+            lines.append("")
+            lines.append("Please install the missing prerequisites and try again.")
 
-        return True
+        self.console.print(Group(*lines))
+        return all_ok
+
+    def _get_version_info(self) -> dict:
+        """Get installer version info, querying node/npm only once."""
+        if self._version_info is None:
+            self._version_info = self._installer.get_version_info()
+        return self._version_info
 
     def _get_openai_config(self) -> str | None:
         """Get OpenAI API key from user."""
-        self.console.print("[bold]Step 2/5: OpenAI Configuration[/bold]")
-        self.console.print()
+        self.console.print("[bold]Step 2/5: OpenAI Configuration[/bold]\n")
 
         api_key = questionary.password(
             "Enter your OpenAI API key:", instruction="(starts with 'sk-')"
@@ -114,14 +192,14 @@ class SetupWizard:
                 test_result = self._test_api_key(api_key)
 
             if test_result:
-                self.console.print("  [green]✓[/green] API key is valid")
+                self.console.print(make_check(True, "API key is valid"))
             else:
-                self.console.print("  [red]✗[/red] API key test failed")
+                self.console.print(make_check(False, "API key test failed"))
                 proceed = questionary.confirm("Continue anyway?", default=False).ask()
                 if not proceed:
                     return None
 
-        self.console.print()
+        self.console.line()
         return api_key
 
     def _test_api_key(self, api_key: str) -> bool:
@@ -142,8 +220,7 @@ class SetupWizard:
 
     def _get_personality_config(self) -> tuple[str, str, str]:
         """Get bot personality configuration."""
-        self.console.print("[bold]Step 3/5: Bot Personality[/bold]")
-        self.console.print()
+        self.console.print("[bold]Step 3/5: Bot Personality[/bold]\n")
 
         bot_name = (
             questionary.text("What should your bot be called?", default="Wingman").ask()
@@ -160,27 +237,24 @@ class SetupWizard:
         tone = (
             questionary.select(
                 "Default tone:",
-                choices=[
-                    questionary.Choice("casual - Relaxed and friendly", value="casual"),
-                    questionary.Choice("friendly - Warm and approachable", value="friendly"),
-                    questionary.Choice("professional - Polite and formal", value="professional"),
-                ],
+                choices=list(_TONE_CHOICES),
                 default="casual",
             ).ask()
             or "casual"
         )
 
-        self.console.print()
+        self.console.line()
         return bot_name, personality_desc, tone
 
     def _get_safety_config(self) -> dict:
         """Get safety settings configuration."""
-        self.console.print("[bold]Step 4/5: Safety Settings[/bold]")
-        self.console.print()
+        self.console.print("[bold]Step 4/5: Safety Settings[/bold]\n")
 
         max_replies = (
             questionary.text(
-                "Max replies per hour:", default="30", validate=lambda x: x.isdigit() and int(x) > 0
+                "Max replies per hour:",
+                default="30",
+                validate=lambda x: _POS_INT_RE.match(x) is not None,
             ).ask()
             or "30"
         )
@@ -195,7 +269,7 @@ class SetupWizard:
                 questionary.text(
                     "Quiet hours (start-end, 24h format):",
                     default="0-6",
-                    validate=lambda x: bool(re.match(r"^\d{1,2}-\d{1,2}$", x)),
+                    validate=lambda x: _QUIET_HOURS_RE.match(x) is not None,
                 ).ask()
                 or "0-6"
             )
@@ -204,7 +278,7 @@ class SetupWizard:
             quiet_start = int(parts[0])
             quiet_end = int(parts[1])
 
-        self.console.print()
+        self.console.line()
 
         return {
             "max_replies_per_hour": int(max_replies),
@@ -215,35 +289,40 @@ class SetupWizard:
 
     def _install_node_listener(self) -> bool:
         """Install the Node.js WhatsApp listener."""
-        self.console.print("[bold]Step 5/5: Installing WhatsApp listener...[/bold]")
-        self.console.print()
-
-        installer = NodeInstaller(self.paths.node_dir)
+        self.console.print("[bold]Step 5/5: Installing WhatsApp listener...[/bold]\n")
 
         # Check if already installed
-        if installer.is_installed():
-            self.console.print("  [green]✓[/green] Node.js listener already installed")
-            self.console.print()
+        if self._installer.is_installed():
+            self.console.print(make_check(True, "Node.js listener already installed"))
+            self.console.line()
             return True
 
         with Progress(
             SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
+            TextColumn("{task.description}", style="progress.description", markup=False),
             console=self.console,
+            refresh_per_second=10,
         ) as progress:
             task = progress.add_task("Installing...", total=None)
+            last_update = 0.0
 
             def update_progress(step: str, message: str):
+                # Throttle to ~10 Hz; npm can report far faster than we can render
+                nonlocal last_update
+                now = time.monotonic()
+                if now - last_update < 0.1:
+                    return
+                last_update = now
                 progress.update(task, description=message)
 
-            success = installer.install(progress_callback=update_progress)
+            success = self._installer.install(progress_callback=update_progress)
 
         if success:
-            self.console.print("  [green]✓[/green] Node.js listener installed")
+            self.console.print(make_check(True, "Node.js listener installed"))
         else:
-            self.console.print("  [red]✗[/red] Installation failed")
+            self.console.print(make_check(False, "Installation failed"))
 
-        self.console.print()
+        self.console.line()
         return success
 
     def _generate_configs(
@@ -279,83 +358,11 @@ class SetupWizard:
             },
         }
 
-        with open(self.paths.config_file, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-
-        # Contacts config (template)
-        contacts_config = {
-            "contacts": {
-                "# Add contacts here using their JID": {
-                    "name": "Example Contact",
-                    "role": "friend",
-                    "tone": "casual",
-                }
-            },
-            "defaults": {
-                "role": "unknown",
-                "tone": "neutral",
-                "allow_proactive": False,
-            },
-        }
-
-        # Remove the comment key (it was just for illustration)
-        contacts_config["contacts"] = {}
-
-        with open(self.paths.contacts_config, "w") as f:
-            yaml.dump(contacts_config, f, default_flow_style=False, sort_keys=False)
-            f.write("\n# Add contacts like this:\n")
-            f.write("# contacts:\n")
-            f.write('#   "+14155551234@s.whatsapp.net":\n')
-            f.write("#     name: John\n")
-            f.write(
-                "#     role: friend  # girlfriend, sister, friend, family, colleague, unknown\n"
-            )
-            f.write(
-                "#     tone: casual  # affectionate, loving, friendly, casual, sarcastic, neutral\n"
-            )
-
-        # Groups config (template)
-        groups_config = {
-            "groups": {},
-            "defaults": {
-                "category": "unknown",
-                "reply_policy": "selective",
-            },
-        }
-
-        with open(self.paths.groups_config, "w") as f:
-            yaml.dump(groups_config, f, default_flow_style=False, sort_keys=False)
-            f.write("\n# Add groups like this:\n")
-            f.write("# groups:\n")
-            f.write('#   "120363012345678901@g.us":\n')
-            f.write("#     name: Family Chat\n")
-            f.write("#     category: family  # family, friends, work, unknown\n")
-            f.write("#     reply_policy: always  # always, selective, never\n")
-
-        # Policies config (template)
-        policies_config = {
-            "rules": [
-                {
-                    "name": "dm_always",
-                    "conditions": {
-                        "is_dm": True,
-                    },
-                    "action": "always",
-                },
-                {
-                    "name": "group_selective",
-                    "conditions": {
-                        "is_group": True,
-                    },
-                    "action": "selective",
-                },
-            ],
-            "fallback": {
-                "action": "selective",
-            },
-        }
+        self.paths.config_file.write_text(_dump_yaml(config))
 
-        with open(self.paths.policies_config, "w") as f:
-            yaml.dump(policies_config, f, default_flow_style=False, sort_keys=False)
+        # Template configs
+        self.paths.contacts_config.write_text(_CONTACTS_YAML)
+        self.paths.groups_config.write_text(_GROUPS_YAML)
+        self.paths.policies_config.write_text(_POLICIES_YAML)
 
         self.console.print(f"[dim]Config saved to {self.paths.config_dir}[/dim]")
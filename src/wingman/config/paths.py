@@ -1,5 +1,6 @@
 """XDG-compliant path management for Wingman."""
 
+import os
 from pathlib import Path
 
 from platformdirs import user_cache_dir, user_config_dir, user_data_dir
@@ -14,11 +15,32 @@ class WingmanPaths:
     - data_dir: ~/.local/share/wingman/ - Data files (DB, auth state)
     - cache_dir: ~/.cache/wingman/ - Cache and logs
     - node_dir: ~/.config/wingman/node_listener/ - Installed Node.js listener
+
+    Derived paths are computed once at construction and stored in slots.
     """
 
     APP_NAME = "wingman"
     APP_AUTHOR = "wingman"
 
+    __slots__ = (
+        "_config_dir",
+        "_data_dir",
+        "_cache_dir",
+        "_log_dir",
+        "_node_dir",
+        "_auth_state_dir",
+        "_db_path",
+        "_config_file",
+        "_contacts_config",
+        "_groups_config",
+        "_policies_config",
+        "_personality_config",
+        "_rpc_socket",
+        "_console_history",
+        "_pid_file",
+        "_launchd_plist",
+    )
+
     def __init__(
         self,
         config_dir: Path | None = None,
@@ -37,6 +59,21 @@ class WingmanPaths:
         self._data_dir = data_dir or Path(user_data_dir(self.APP_NAME, self.APP_AUTHOR))
         self._cache_dir = cache_dir or Path(user_cache_dir(self.APP_NAME, self.APP_AUTHOR))
 
+        # Derived paths, computed once
+        self._log_dir = self._cache_dir / "logs"
+        self._node_dir = self._config_dir / "node_listener"
+        self._auth_state_dir = self._data_dir / "auth_state"
+        self._db_path = self._data_dir / "conversations.db"
+        self._config_file = self._config_dir / "config.yaml"
+        self._contacts_config = self._config_dir / "contacts.yaml"
+        self._groups_config = self._config_dir / "groups.yaml"
+        self._policies_config = self._config_dir / "policies.yaml"
+        self._personality_config = self._config_dir / "personality.yaml"
+        self._rpc_socket = self._cache_dir / "wingman.sock"
+        self._console_history = self._cache_dir / "console_history"
+        self._pid_file = self._cache_dir / "wingman.pid"
+        self._launchd_plist = Path.home() / "Library" / "LaunchAgents" / "com.wingman.agent.plist"
+
     @property
     def config_dir(self) -> Path:
         """Config directory (~/.config/wingman/)."""
@@ -55,78 +92,87 @@ class WingmanPaths:
     @property
     def log_dir(self) -> Path:
         """Log directory (~/.cache/wingman/logs/)."""
-        return self._cache_dir / "logs"
+        return self._log_dir
 
     @property
     def node_dir(self) -> Path:
         """Node.js listener directory (~/.config/wingman/node_listener/)."""
-        return self._config_dir / "node_listener"
+        return self._node_dir
 
     @property
     def auth_state_dir(self) -> Path:
         """WhatsApp auth state directory (~/.local/share/wingman/auth_state/)."""
-        return self._data_dir / "auth_state"
+        return self._auth_state_dir
 
     @property
     def db_path(self) -> Path:
         """Database file path (~/.local/share/wingman/conversations.db)."""
-        return self._data_dir / "conversations.db"
+        return self._db_path
 
     @property
     def config_file(self) -> Path:
         """Main config file (~/.config/wingman/config.yaml)."""
-        return self._config_dir / "config.yaml"
+        return self._config_file
 
     @property
     def contacts_config(self) -> Path:
         """Contacts config file (~/.config/wingman/contacts.yaml)."""
-        return self._config_dir / "contacts.yaml"
+        return self._contacts_config
 
     @property
     def groups_config(self) -> Path:
         """Groups config file (~/.config/wingman/groups.yaml)."""
-        return self._config_dir / "groups.yaml"
+        return self._groups_config
 
     @property
     def policies_config(self) -> Path:
         """Policies config file (~/.config/wingman/policies.yaml)."""
-        return self._config_dir / "policies.yaml"
+        return self._policies_config
 
     @property
     def personality_config(self) -> Path:
         """Personality config file (~/.config/wingman/personality.yaml)."""
-        return self._config_dir / "personality.yaml"
+        return self._personality_config
 
     @property
     def rpc_socket(self) -> Path:
         """Unix domain socket for daemon RPC (~/.cache/wingman/wingman.sock)."""
-        return self._cache_dir / "wingman.sock"
+        return self._rpc_socket
 
     @property
     def console_history(self) -> Path:
         """Console command history file (~/.cache/wingman/console_history)."""
-        return self._cache_dir / "console_history"
+        return self._console_history
 
     @property
     def pid_file(self) -> Path:
         """PID file for daemon (~/.cache/wingman/wingman.pid)."""
-        return self._cache_dir / "wingman.pid"
+        return self._pid_file
 
     @property
     def launchd_plist(self) -> Path:
         """Launchd plist file (~/Library/LaunchAgents/com.wingman.agent.plist)."""
-        return Path.home() / "Library" / "LaunchAgents" / "com.wingman.agent.plist"
+        return self._launchd_plist
 
     def ensure_directories(self) -> None:
         """Create all required directories if they don't exist."""
-        for directory in [
-            self._config_dir,
-            self._data_dir,
-            self._cache_dir,
-            self.log_dir,
-            self.auth_state_dir,
-        ]:
-            directory.mkdir(parents=True, exist_ok=True)
+        directories = {
+            str(directory)
+            for directory in [
+                self._config_dir,
+                self._data_dir,
+                self._cache_dir,
+                self.log_dir,
+                self.auth_state_dir,
+            ]
+        }
+
+        # Longest first, so creating a leaf also creates its parents and they
+        # cost one stat each. Always rechecked: directories may be deleted
+        # while the process runs (uninstall, reset, a user clearing data_dir)
+        for directory in sorted(directories, key=len, reverse=True):
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
 
     def config_exists(self) -> bool:
         """Check if the main config file exists."""
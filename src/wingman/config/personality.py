@@ -1,5 +1,8 @@
 """Bot personality configuration."""
 
+import sys
+from functools import lru_cache
+
 from .registry import ContactTone
 
 SYSTEM_PROMPT = """You are Maximus Kekus, a witty and friendly AI assistant chatting on WhatsApp.
@@ -99,11 +102,27 @@ You're chatting with an acquaintance or someone you don't know well.
 }
 
 
+@lru_cache(maxsize=32)
 def get_personality_prompt(bot_name: str = "Maximus") -> str:
     """Get the personality prompt with the bot name substituted."""
     return SYSTEM_PROMPT.replace("Maximus Kekus", bot_name).replace("Maximus", bot_name)
 
 
+@lru_cache(maxsize=32)
+def _get_tone_prompts(bot_name: str) -> dict[ContactTone, str]:
+    """Get the full base + tone prompt for every tone, built once per bot name.
+
+    The strings are interned so every builder and caller shares one copy.
+    """
+    base_prompt = get_personality_prompt(bot_name)
+    return {
+        tone: sys.intern(
+            base_prompt + "\n" + TONE_PROMPTS.get(tone, TONE_PROMPTS[ContactTone.NEUTRAL])
+        )
+        for tone in ContactTone
+    }
+
+
 class RoleBasedPromptBuilder:
     """Builds prompts based on contact role and tone."""
 
@@ -111,6 +130,9 @@ class RoleBasedPromptBuilder:
         self.bot_name = bot_name
         self._base_prompt = get_personality_prompt(bot_name)
 
+        # Base prompt + tone block per tone, shared between builders
+        self._tone_prompts = _get_tone_prompts(bot_name)
+
     def build_prompt(
         self,
         tone: ContactTone,
@@ -126,17 +148,21 @@ class RoleBasedPromptBuilder:
         Returns:
             Complete system prompt with tone-specific additions
         """
-        prompt = self._base_prompt
+        # Base prompt with the tone-specific addition
+        base = self._tone_prompts.get(tone) or self._tone_prompts[ContactTone.NEUTRAL]
+        if not contact_name:
+            return base
 
-        # Add tone-specific prompt
-        tone_addition = TONE_PROMPTS.get(tone, TONE_PROMPTS[ContactTone.NEUTRAL])
-        prompt += "\n" + tone_addition
+        return base + f"\n\n{self.build_contact_note(contact_name)}"
 
-        # Add contact name context if provided
-        if contact_name:
-            prompt += f"\n\nYou're currently chatting with {contact_name}."
+    def build_contact_note(self, contact_name: str) -> str:
+        """
+        Build the line telling the bot who it is chatting with.
 
-        return prompt
+        Kept separate from the tone prompt so callers can send it as its own
+        message and leave the (shared) system prompt untouched.
+        """
+        return f"You're currently chatting with {contact_name}."
 
     def get_tone_instruction(self, tone: ContactTone) -> str:
         """
@@ -2,16 +2,21 @@
 
 import logging
 import os
-import threading
-import time
-from dataclasses import dataclass
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple, TypeVar
 
-import yaml
+from .watcher import ConfigWatcher
+from .yaml_writer import load_yaml
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ContactRole(Enum):
     """Role categories for contacts."""
@@ -52,9 +57,16 @@ class ReplyPolicy(Enum):
     NEVER = "never"  # Never respond
 
 
-@dataclass
+# Value -> member lookups for parsing config strings (KeyError on unknown values)
+_ROLE_MAP = {member.value: member for member in ContactRole}
+_TONE_MAP = {member.value: member for member in ContactTone}
+_CATEGORY_MAP = {member.value: member for member in GroupCategory}
+_POLICY_MAP = {member.value: member for member in ReplyPolicy}
+
+
+@dataclass(frozen=True, slots=True)
 class ContactProfile:
-    """Profile for a known contact."""
+    """Profile for a known contact (immutable: registries share instances)."""
 
     jid: str
     name: str
@@ -68,17 +80,17 @@ class ContactProfile:
     def from_dict(cls, jid: str, data: dict) -> "ContactProfile":
         """Create a ContactProfile from config dict."""
         return cls(
-            jid=jid,
+            jid=sys.intern(str(jid)),
             name=data.get("name", "Unknown"),
-            role=ContactRole(data.get("role", "unknown")),
-            tone=ContactTone(data.get("tone", "neutral")),
+            role=_ROLE_MAP[data.get("role", "unknown")],
+            tone=_TONE_MAP[data.get("tone", "neutral")],
             allow_proactive=data.get("allow_proactive", False),
             cooldown_override=data.get("cooldown_override"),
             imessage_id=data.get("imessage_id"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupConfig:
     """Configuration for a group chat."""
 
@@ -91,14 +103,14 @@ class GroupConfig:
     def from_dict(cls, jid: str, data: dict) -> "GroupConfig":
         """Create a GroupConfig from config dict."""
         return cls(
-            jid=jid,
+            jid=sys.intern(str(jid)),
             name=data.get("name", "Unknown Group"),
-            category=GroupCategory(data.get("category", "unknown")),
-            reply_policy=ReplyPolicy(data.get("reply_policy", "selective")),
+            category=_CATEGORY_MAP[data.get("category", "unknown")],
+            reply_policy=_POLICY_MAP[data.get("reply_policy", "selective")],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactDefaults:
     """Default values for unknown contacts."""
 
@@ -108,7 +120,7 @@ class ContactDefaults:
     cooldown_override: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupDefaults:
     """Default values for unknown groups."""
 
@@ -116,87 +128,186 @@ class GroupDefaults:
     reply_policy: ReplyPolicy = ReplyPolicy.SELECTIVE
 
 
+def _parse_entries(factory: Callable[[str, dict], T], entries: dict, kind: str) -> list[T]:
+    """
+    Parse config entries keyed by JID, skipping invalid ones.
+
+    Args:
+        factory: Builds an entry from (jid, data), e.g. ContactProfile.from_dict
+        entries: Mapping of JID -> config dict from the YAML file
+        kind: Entry kind for log messages ("contact", "group")
+
+    Returns:
+        Parsed entries, in file order
+    """
+    parsed = []
+    for jid, data in entries.items():
+        try:
+            entry = factory(jid, data)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Invalid {kind} config for {jid}: {e}")
+            continue
+        parsed.append(entry)
+        logger.debug(f"Loaded {kind}: {entry.name} ({jid})")
+    return parsed
+
+
+class _ContactTables(NamedTuple):
+    """One loaded contacts config; replaced as a whole on reload."""
+
+    contacts: dict[str, ContactProfile]
+    imessage_lookup: dict[str, str]  # iMessage ID -> primary JID
+    resolve_index: dict[str, ContactProfile]  # Every known key -> profile
+    defaults: ContactDefaults
+    unknown_for: Callable[[str], ContactProfile]  # Default profile per unknown JID
+
+
+class _GroupTables(NamedTuple):
+    """One loaded groups config; replaced as a whole on reload."""
+
+    groups: dict[str, GroupConfig]
+    defaults: GroupDefaults
+
+
+def _make_unknown_resolver(defaults: ContactDefaults) -> Callable[[str], ContactProfile]:
+    """Build a cached JID -> default profile function for unknown contacts.
+
+    Profiles are frozen, so one instance per JID can be shared by callers.
+    """
+    template = ContactProfile(
+        jid="",
+        name="Unknown",
+        role=defaults.role,
+        tone=defaults.tone,
+        allow_proactive=defaults.allow_proactive,
+        cooldown_override=defaults.cooldown_override,
+    )
+
+    @lru_cache(maxsize=4096)
+    def unknown_for(jid: str) -> ContactProfile:
+        return replace(template, jid=jid)
+
+    return unknown_for
+
+
 class ContactRegistry:
     """Registry for resolving contact JIDs to profiles."""
 
     def __init__(self, config_path: Path | None = None, auto_reload: bool = True):
-        self._contacts: dict[str, ContactProfile] = {}
-        self._imessage_lookup: dict[str, str] = {}  # iMessage ID -> primary JID
-        self._defaults = ContactDefaults()
+        self._tables = self._make_tables({}, {}, ContactDefaults())
         self._config_path = config_path
-        self._last_modified: float = 0
-        self._watcher_thread: threading.Thread | None = None
-        self._stop_watcher = threading.Event()
+        self._last_modified_ns: int = 0
+        self._watching = False
 
         if config_path and config_path.exists():
             self._load_config(config_path)
             if auto_reload:
                 self._start_watcher()
 
-    def _load_config(self, config_path: Path) -> None:
+    def _load_config(self, config_path: Path, st: os.stat_result | None = None) -> None:
         """Load contact configuration from YAML file."""
         try:
-            with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
-
-            # Load contacts
-            contacts_data = config.get("contacts", {})
-            for jid, data in contacts_data.items():
-                try:
-                    profile = ContactProfile.from_dict(jid, data)
-                    self._contacts[jid] = profile
-                    logger.debug(f"Loaded contact: {profile.name} ({jid})")
-
-                    # Build iMessage lookup table
-                    if profile.imessage_id:
-                        imessage_key = f"imessage:{profile.imessage_id}"
-                        self._imessage_lookup[imessage_key] = jid
-                        logger.debug(f"Linked iMessage {profile.imessage_id} to {jid}")
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Invalid contact config for {jid}: {e}")
+            if st is None:
+                st = os.stat(config_path)
+            config = load_yaml(config_path, st)
+
+            # Load contacts. New tables are built off to the side and swapped in
+            # with one assignment, so resolve() never sees a half-loaded registry.
+            profiles = _parse_entries(
+                ContactProfile.from_dict, config.get("contacts", {}), "contact"
+            )
+            # Key by the interned JID held on each profile
+            contacts = {profile.jid: profile for profile in profiles}
+
+            # Build iMessage lookup table
+            imessage_lookup = {
+                sys.intern(f"imessage:{profile.imessage_id}"): profile.jid
+                for profile in profiles
+                if profile.imessage_id
+            }
 
             # Load defaults
+            defaults = self._tables.defaults
             defaults_data = config.get("defaults", {})
             if defaults_data:
-                self._defaults = ContactDefaults(
-                    role=ContactRole(defaults_data.get("role", "unknown")),
-                    tone=ContactTone(defaults_data.get("tone", "neutral")),
+                defaults = ContactDefaults(
+                    role=_ROLE_MAP[defaults_data.get("role", "unknown")],
+                    tone=_TONE_MAP[defaults_data.get("tone", "neutral")],
                     allow_proactive=defaults_data.get("allow_proactive", False),
                     cooldown_override=defaults_data.get("cooldown_override"),
                 )
 
-            self._last_modified = os.path.getmtime(config_path)
-            logger.info(f"Loaded {len(self._contacts)} contacts from {config_path}")
+            self._tables = self._make_tables(contacts, imessage_lookup, defaults)
+            self._last_modified_ns = st.st_mtime_ns
+            logger.info(f"Loaded {len(contacts)} contacts from {config_path}")
 
         except Exception as e:
             logger.error(f"Failed to load contacts config: {e}")
 
+    @classmethod
+    def _make_tables(
+        cls,
+        contacts: dict[str, ContactProfile],
+        imessage_lookup: dict[str, str],
+        defaults: ContactDefaults,
+    ) -> _ContactTables:
+        """Bundle a parsed config with the lookups derived from it."""
+        return _ContactTables(
+            contacts=contacts,
+            imessage_lookup=imessage_lookup,
+            resolve_index=cls._build_resolve_index(contacts, imessage_lookup),
+            defaults=defaults,
+            unknown_for=_make_unknown_resolver(defaults),
+        )
+
+    @staticmethod
+    def _build_resolve_index(
+        contacts: dict[str, ContactProfile], imessage_lookup: dict[str, str]
+    ) -> dict[str, ContactProfile]:
+        """
+        Flatten every lookup `resolve` supports into a single dict.
+
+        Entries are added lowest precedence first so later updates win:
+        bare iMessage identifiers, then linked iMessage IDs, then direct JIDs.
+        """
+        linked = {key: contacts[jid] for key, jid in imessage_lookup.items()}
+
+        index: dict[str, ContactProfile] = {}
+        for source in (linked, contacts):
+            for key, profile in source.items():
+                # "imessage:+1415..." is also reachable as bare "+1415..."
+                if key.startswith("imessage:") and "@" not in key:
+                    index[key[len("imessage:") :]] = profile
+        index.update(linked)
+        index.update(contacts)
+        return index
+
     def _start_watcher(self) -> None:
-        """Start background thread to watch for config changes."""
-        if self._watcher_thread is not None:
+        """Subscribe to config changes via the shared watcher."""
+        if self._watching:
             return
-
-        def watch():
-            while not self._stop_watcher.is_set():
-                try:
-                    if self._config_path and self._config_path.exists():
-                        mtime = os.path.getmtime(self._config_path)
-                        if mtime > self._last_modified:
-                            logger.info("Contacts config changed, reloading...")
-                            self._contacts.clear()
-                            self._imessage_lookup.clear()
-                            self._load_config(self._config_path)
-                except Exception as e:
-                    logger.error(f"Error watching contacts config: {e}")
-                time.sleep(2)  # Check every 2 seconds
-
-        self._watcher_thread = threading.Thread(target=watch, daemon=True)
-        self._watcher_thread.start()
+        ConfigWatcher.register(self._config_path, self._reload)
+        self._watching = True
         logger.debug("Started contacts config watcher")
 
+    def _reload(self) -> None:
+        """Reload the config if it changed since the last load."""
+        if not self._config_path:
+            return
+        try:
+            st = os.stat(self._config_path)
+        except OSError:
+            return
+
+        if st.st_mtime_ns != self._last_modified_ns:
+            logger.info("Contacts config changed, reloading...")
+            self._load_config(self._config_path, st)
+
     def stop_watcher(self) -> None:
-        """Stop the config watcher thread."""
-        self._stop_watcher.set()
+        """Stop watching the config file for changes."""
+        if self._watching:
+            ConfigWatcher.unregister(self._config_path, self._reload)
+            self._watching = False
 
     def resolve(self, jid: str) -> ContactProfile:
         """
@@ -208,114 +319,97 @@ class ContactRegistry:
 
         Returns the configured profile if known, or a default profile if unknown.
         """
-        # Direct lookup
-        if jid in self._contacts:
-            return self._contacts[jid]
-
-        # Try iMessage lookup (maps iMessage ID to WhatsApp contact)
-        if jid in self._imessage_lookup:
-            primary_jid = self._imessage_lookup[jid]
-            return self._contacts[primary_jid]
-
-        # For iMessage identifiers without prefix, try with prefix
-        if not jid.startswith("imessage:") and "@" not in jid:
-            imessage_key = f"imessage:{jid}"
-            if imessage_key in self._contacts:
-                return self._contacts[imessage_key]
-            if imessage_key in self._imessage_lookup:
-                primary_jid = self._imessage_lookup[imessage_key]
-                return self._contacts[primary_jid]
+        tables = self._tables
+        profile = tables.resolve_index.get(jid)
+        if profile is not None:
+            return profile
 
         # Return default profile for unknown contacts
-        return ContactProfile(
-            jid=jid,
-            name="Unknown",
-            role=self._defaults.role,
-            tone=self._defaults.tone,
-            allow_proactive=self._defaults.allow_proactive,
-            cooldown_override=self._defaults.cooldown_override,
-        )
+        return tables.unknown_for(jid)
+
+    def resolve_many(self, jids: Iterable[str]) -> list[ContactProfile]:
+        """Resolve several JIDs at once; same results as calling `resolve` on each."""
+        tables = self._tables
+        index = tables.resolve_index
+        unknown = tables.unknown_for
+        return [index.get(jid) or unknown(jid) for jid in jids]
 
     def is_known(self, jid: str) -> bool:
         """Check if a contact is in the registry."""
-        return jid in self._contacts
+        return jid in self._tables.contacts
 
     def get_all_contacts(self) -> list[ContactProfile]:
         """Get all registered contacts."""
-        return list(self._contacts.values())
+        return list(self._tables.contacts.values())
 
 
 class GroupRegistry:
     """Registry for resolving group JIDs to configurations."""
 
     def __init__(self, config_path: Path | None = None, auto_reload: bool = True):
-        self._groups: dict[str, GroupConfig] = {}
-        self._defaults = GroupDefaults()
+        self._tables = _GroupTables(groups={}, defaults=GroupDefaults())
         self._config_path = config_path
-        self._last_modified: float = 0
-        self._watcher_thread: threading.Thread | None = None
-        self._stop_watcher = threading.Event()
+        self._last_modified_ns: int = 0
+        self._watching = False
 
         if config_path and config_path.exists():
             self._load_config(config_path)
             if auto_reload:
                 self._start_watcher()
 
-    def _load_config(self, config_path: Path) -> None:
+    def _load_config(self, config_path: Path, st: os.stat_result | None = None) -> None:
         """Load group configuration from YAML file."""
         try:
-            with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
-
-            # Load groups
-            groups_data = config.get("groups", {})
-            for jid, data in groups_data.items():
-                try:
-                    group_config = GroupConfig.from_dict(jid, data)
-                    self._groups[jid] = group_config
-                    logger.debug(f"Loaded group: {group_config.name} ({jid})")
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Invalid group config for {jid}: {e}")
+            if st is None:
+                st = os.stat(config_path)
+            config = load_yaml(config_path, st)
+
+            # Load groups into new tables, swapped in with one assignment
+            group_configs = _parse_entries(GroupConfig.from_dict, config.get("groups", {}), "group")
+            groups = {group_config.jid: group_config for group_config in group_configs}
 
             # Load defaults
+            defaults = self._tables.defaults
             defaults_data = config.get("defaults", {})
             if defaults_data:
-                self._defaults = GroupDefaults(
-                    category=GroupCategory(defaults_data.get("category", "unknown")),
-                    reply_policy=ReplyPolicy(defaults_data.get("reply_policy", "selective")),
+                defaults = GroupDefaults(
+                    category=_CATEGORY_MAP[defaults_data.get("category", "unknown")],
+                    reply_policy=_POLICY_MAP[defaults_data.get("reply_policy", "selective")],
                 )
 
-            self._last_modified = os.path.getmtime(config_path)
-            logger.info(f"Loaded {len(self._groups)} groups from {config_path}")
+            self._tables = _GroupTables(groups=groups, defaults=defaults)
+            self._last_modified_ns = st.st_mtime_ns
+            logger.info(f"Loaded {len(groups)} groups from {config_path}")
 
         except Exception as e:
             logger.error(f"Failed to load groups config: {e}")
 
     def _start_watcher(self) -> None:
-        """Start background thread to watch for config changes."""
-        if self._watcher_thread is not None:
+        """Subscribe to config changes via the shared watcher."""
+        if self._watching:
             return
-
-        def watch():
-            while not self._stop_watcher.is_set():
-                try:
-                    if self._config_path and self._config_path.exists():
-                        mtime = os.path.getmtime(self._config_path)
-                        if mtime > self._last_modified:
-                            logger.info("Groups config changed, reloading...")
-                            self._groups.clear()
-                            self._load_config(self._config_path)
-                except Exception as e:
-                    logger.error(f"Error watching groups config: {e}")
-                time.sleep(2)  # Check every 2 seconds
-
-        self._watcher_thread = threading.Thread(target=watch, daemon=True)
-        self._watcher_thread.start()
+        ConfigWatcher.register(self._config_path, self._reload)
+        self._watching = True
         logger.debug("Started groups config watcher")
 
+    def _reload(self) -> None:
+        """Reload the config if it changed since the last load."""
+        if not self._config_path:
+            return
+        try:
+            st = os.stat(self._config_path)
+        except OSError:
+            return
+
+        if st.st_mtime_ns != self._last_modified_ns:
+            logger.info("Groups config changed, reloading...")
+            self._load_config(self._config_path, st)
+
     def stop_watcher(self) -> None:
-        """Stop the config watcher thread."""
-        self._stop_watcher.set()
+        """Stop watching the config file for changes."""
+        if self._watching:
+            ConfigWatcher.unregister(self._config_path, self._reload)
+            self._watching = False
 
     def resolve(self, jid: str) -> GroupConfig:
         """
@@ -323,21 +417,28 @@ class GroupRegistry:
 
         Returns the configured settings if known, or defaults if unknown.
         """
-        if jid in self._groups:
-            return self._groups[jid]
+        tables = self._tables
+        if jid in tables.groups:
+            return tables.groups[jid]
 
         # Return default config for unknown groups
         return GroupConfig(
             jid=jid,
             name="Unknown Group",
-            category=self._defaults.category,
-            reply_policy=self._defaults.reply_policy,
+            category=tables.defaults.category,
+            reply_policy=tables.defaults.reply_policy,
         )
 
+    def resolve_many(self, jids: Iterable[str]) -> list[GroupConfig]:
+        """Resolve several group JIDs at once; same results as calling `resolve` on each."""
+        groups = self._tables.groups
+        resolve = self.resolve
+        return [groups.get(jid) or resolve(jid) for jid in jids]
+
     def is_known(self, jid: str) -> bool:
         """Check if a group is in the registry."""
-        return jid in self._groups
+        return jid in self._tables.groups
 
     def get_all_groups(self) -> list[GroupConfig]:
         """Get all registered groups."""
-        return list(self._groups.values())
+        return list(self._tables.groups.values())
@@ -2,19 +2,112 @@
 
 import logging
 import os
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-from dotenv import load_dotenv
-
 from .paths import WingmanPaths
+from .yaml_writer import get_nested_value, load_yaml, set_nested_value
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# .env files already loaded in this process: path -> st_mtime_ns at load time
+_loaded_dotenv: dict[str, int] = {}
+
+
+def _load_dotenv_cached(env_path: Path) -> None:
+    """Load a .env file, skipping it if unchanged since it was last loaded."""
+    key = str(env_path)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        return
+    if _loaded_dotenv.get(key) == mtime_ns:
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv(env_path)
+    _loaded_dotenv[key] = mtime_ns
+
+
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment variable ("true" in any case)."""
+    return value.lower() == "true"
+
+
+# (field name, YAML path, environment variable, converter for env values)
+# Rows are in config.yaml order, which to_yaml_dict() reproduces.
+_SETTINGS_SCHEMA: tuple[tuple[str, str, str | None, Callable[[str], Any] | None], ...] = (
+    # Bot identity
+    ("bot_name", "bot.name", "BOT_NAME", str),
+    # OpenAI / LLM settings
+    ("openai_api_key", "openai.api_key", "OPENAI_API_KEY", str),
+    ("openai_model", "openai.model", "OPENAI_MODEL", str),
+    ("context_window_size", "openai.context_window_size", "CONTEXT_WINDOW_SIZE", int),
+    ("max_response_tokens", "openai.max_response_tokens", "MAX_RESPONSE_TOKENS", int),
+    ("temperature", "openai.temperature", "TEMPERATURE", float),
+    ("stream_replies", "openai.stream_replies", "STREAM_REPLIES", _env_bool),
+    ("cache_enabled", "openai.cache_enabled", "LLM_CACHE_ENABLED", _env_bool),
+    ("semantic_cache", "openai.semantic_cache", "LLM_SEMANTIC_CACHE", _env_bool),
+    # Safety limits
+    ("max_replies_per_hour", "safety.max_replies_per_hour", "MAX_REPLIES_PER_HOUR", int),
+    ("default_cooldown_seconds", "safety.cooldown_seconds", "DEFAULT_COOLDOWN_SECONDS", int),
+    ("quiet_hours_enabled", "safety.quiet_hours.enabled", None, None),
+    ("quiet_hours_start", "safety.quiet_hours.start", "QUIET_HOURS_START", int),
+    ("quiet_hours_end", "safety.quiet_hours.end", "QUIET_HOURS_END", int),
+    # iMessage settings
+    ("imessage_enabled", "imessage.enabled", "IMESSAGE_ENABLED", _env_bool),
+    ("imessage_poll_interval", "imessage.poll_interval", "IMESSAGE_POLL_INTERVAL", float),
+    (
+        "imessage_max_replies_per_hour",
+        "imessage.max_replies_per_hour",
+        "IMESSAGE_MAX_REPLIES_PER_HOUR",
+        int,
+    ),
+    ("imessage_cooldown", "imessage.cooldown", "IMESSAGE_COOLDOWN", int),
+)
+
+
+def _values_from_yaml(config: dict) -> dict[str, Any]:
+    """Collect settings present in a parsed config.yaml (missing ones keep defaults)."""
+    values = {}
+    for name, yaml_path, _, _ in _SETTINGS_SCHEMA:
+        value = get_nested_value(config, yaml_path)
+        if value is not None:
+            values[name] = value
+    return values
+
+
+def _values_from_env() -> dict[str, Any]:
+    """Collect settings set in the environment (missing ones keep defaults)."""
+    values = {}
+    for name, _, env_var, convert in _SETTINGS_SCHEMA:
+        if env_var is None:
+            continue
+        value = os.environ.get(env_var)
+        if value is not None:
+            values[name] = convert(value)
+    return values
+
+
+def _path_values(paths: WingmanPaths) -> dict[str, Path]:
+    """Path settings taken from WingmanPaths."""
+    return {
+        "node_dir": paths.node_dir,
+        "data_dir": paths.data_dir,
+        "log_dir": paths.log_dir,
+        "db_path": paths.db_path,
+        "auth_state_dir": paths.auth_state_dir,
+        "contacts_config": paths.contacts_config,
+        "groups_config": paths.groups_config,
+        "policies_config": paths.policies_config,
+    }
+
+
+@dataclass(slots=True)
 class Settings:
     """Application settings loaded from YAML config or environment variables."""
 
@@ -36,6 +129,9 @@ class Settings:
     context_window_size: int = 30
     max_response_tokens: int = 150
     temperature: float = 0.8
+    stream_replies: bool = False  # Send each sentence as soon as it is generated
+    cache_enabled: bool = False  # Reuse replies to identical requests even when sampling
+    semantic_cache: bool = False  # Reuse replies to paraphrased messages (needs numpy)
 
     # iMessage settings
     imessage_enabled: bool = False
@@ -92,51 +188,14 @@ class Settings:
         config_file = paths.config_file
         logger.info(f"Loading settings from {config_file}")
 
-        with open(config_file) as f:
-            config = yaml.safe_load(f) or {}
-
-        # Parse config sections
-        bot_config = config.get("bot", {})
-        openai_config = config.get("openai", {})
-        safety_config = config.get("safety", {})
-        quiet_hours_config = safety_config.get("quiet_hours", {})
-        imessage_config = config.get("imessage", {})
+        config = load_yaml(config_file)
+        values = _values_from_yaml(config)
 
         # Get API key from config or environment
-        api_key = openai_config.get("api_key") or os.getenv("OPENAI_API_KEY", "")
+        if not values.get("openai_api_key"):
+            values["openai_api_key"] = os.getenv("OPENAI_API_KEY", "")
 
-        settings = cls(
-            # OpenAI
-            openai_api_key=api_key,
-            openai_model=openai_config.get("model", "gpt-4o"),
-            # Bot identity
-            bot_name=bot_config.get("name", "Maximus"),
-            # Safety limits
-            max_replies_per_hour=safety_config.get("max_replies_per_hour", 30),
-            default_cooldown_seconds=safety_config.get("cooldown_seconds", 60),
-            quiet_hours_start=quiet_hours_config.get("start", 0),
-            quiet_hours_end=quiet_hours_config.get("end", 6),
-            quiet_hours_enabled=quiet_hours_config.get("enabled", True),
-            # LLM settings
-            context_window_size=openai_config.get("context_window_size", 30),
-            max_response_tokens=openai_config.get("max_response_tokens", 150),
-            temperature=openai_config.get("temperature", 0.8),
-            # iMessage settings
-            imessage_enabled=imessage_config.get("enabled", False),
-            imessage_poll_interval=imessage_config.get("poll_interval", 2.0),
-            imessage_max_replies_per_hour=imessage_config.get("max_replies_per_hour", 15),
-            imessage_cooldown=imessage_config.get("cooldown", 120),
-            # Paths from WingmanPaths
-            node_dir=paths.node_dir,
-            data_dir=paths.data_dir,
-            log_dir=paths.log_dir,
-            db_path=paths.db_path,
-            auth_state_dir=paths.auth_state_dir,
-            contacts_config=paths.contacts_config,
-            groups_config=paths.groups_config,
-            policies_config=paths.policies_config,
-            _is_cli_mode=True,
-        )
+        settings = cls(**values, **_path_values(paths), _is_cli_mode=True)
 
         # Ensure directories exist
         paths.ensure_directories()
@@ -149,30 +208,12 @@ class Settings:
         """Load settings from environment variables (legacy mode)."""
         # Load .env file
         if env_path:
-            load_dotenv(env_path)
+            _load_dotenv_cached(env_path)
         else:
-            load_dotenv(project_root / ".env")
+            _load_dotenv_cached(project_root / ".env")
 
         settings = cls(
-            # OpenAI
-            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
-            # Bot identity
-            bot_name=os.getenv("BOT_NAME", "Maximus"),
-            # Safety limits
-            max_replies_per_hour=int(os.getenv("MAX_REPLIES_PER_HOUR", "30")),
-            default_cooldown_seconds=int(os.getenv("DEFAULT_COOLDOWN_SECONDS", "60")),
-            quiet_hours_start=int(os.getenv("QUIET_HOURS_START", "0")),
-            quiet_hours_end=int(os.getenv("QUIET_HOURS_END", "6")),
-            # LLM settings
-            context_window_size=int(os.getenv("CONTEXT_WINDOW_SIZE", "30")),
-            max_response_tokens=int(os.getenv("MAX_RESPONSE_TOKENS", "150")),
-            temperature=float(os.getenv("TEMPERATURE", "0.8")),
-            # iMessage settings
-            imessage_enabled=os.getenv("IMESSAGE_ENABLED", "false").lower() == "true",
-            imessage_poll_interval=float(os.getenv("IMESSAGE_POLL_INTERVAL", "2.0")),
-            imessage_max_replies_per_hour=int(os.getenv("IMESSAGE_MAX_REPLIES_PER_HOUR", "15")),
-            imessage_cooldown=int(os.getenv("IMESSAGE_COOLDOWN", "120")),
+            **_values_from_env(),
             # Paths (legacy project structure)
             node_dir=project_root / "node_listener",
             data_dir=project_root / "data",
@@ -202,39 +243,9 @@ class Settings:
     ) -> "Settings":
         """Load settings from environment variables with XDG paths."""
         if env_path:
-            load_dotenv(env_path)
+            _load_dotenv_cached(env_path)
 
-        settings = cls(
-            # OpenAI
-            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
-            # Bot identity
-            bot_name=os.getenv("BOT_NAME", "Maximus"),
-            # Safety limits
-            max_replies_per_hour=int(os.getenv("MAX_REPLIES_PER_HOUR", "30")),
-            default_cooldown_seconds=int(os.getenv("DEFAULT_COOLDOWN_SECONDS", "60")),
-            quiet_hours_start=int(os.getenv("QUIET_HOURS_START", "0")),
-            quiet_hours_end=int(os.getenv("QUIET_HOURS_END", "6")),
-            # LLM settings
-            context_window_size=int(os.getenv("CONTEXT_WINDOW_SIZE", "30")),
-            max_response_tokens=int(os.getenv("MAX_RESPONSE_TOKENS", "150")),
-            temperature=float(os.getenv("TEMPERATURE", "0.8")),
-            # iMessage settings
-            imessage_enabled=os.getenv("IMESSAGE_ENABLED", "false").lower() == "true",
-            imessage_poll_interval=float(os.getenv("IMESSAGE_POLL_INTERVAL", "2.0")),
-            imessage_max_replies_per_hour=int(os.getenv("IMESSAGE_MAX_REPLIES_PER_HOUR", "15")),
-            imessage_cooldown=int(os.getenv("IMESSAGE_COOLDOWN", "120")),
-            # Paths from WingmanPaths
-            node_dir=paths.node_dir,
-            data_dir=paths.data_dir,
-            log_dir=paths.log_dir,
-            db_path=paths.db_path,
-            auth_state_dir=paths.auth_state_dir,
-            contacts_config=paths.contacts_config,
-            groups_config=paths.groups_config,
-            policies_config=paths.policies_config,
-            _is_cli_mode=True,
-        )
+        settings = cls(**_values_from_env(), **_path_values(paths), _is_cli_mode=True)
 
         paths.ensure_directories()
         return settings
@@ -265,30 +276,7 @@ class Settings:
 
     def to_yaml_dict(self) -> dict[str, Any]:
         """Convert settings to a dictionary suitable for YAML serialization."""
-        return {
-            "bot": {
-                "name": self.bot_name,
-            },
-            "openai": {
-                "api_key": self.openai_api_key,
-                "model": self.openai_model,
-                "context_window_size": self.context_window_size,
-                "max_response_tokens": self.max_response_tokens,
-                "temperature": self.temperature,
-            },
-            "safety": {
-                "max_replies_per_hour": self.max_replies_per_hour,
-                "cooldown_seconds": self.default_cooldown_seconds,
-                "quiet_hours": {
-                    "enabled": self.quiet_hours_enabled,
-                    "start": self.quiet_hours_start,
-                    "end": self.quiet_hours_end,
-                },
-            },
-            "imessage": {
-                "enabled": self.imessage_enabled,
-                "poll_interval": self.imessage_poll_interval,
-                "max_replies_per_hour": self.imessage_max_replies_per_hour,
-                "cooldown": self.imessage_cooldown,
-            },
-        }
+        data: dict[str, Any] = {}
+        for name, yaml_path, _, _ in _SETTINGS_SCHEMA:
+            set_nested_value(data, yaml_path, getattr(self, name), coerce=False)
+        return data
@@ -0,0 +1,166 @@
+"""Shared file watcher for hot-reloading config files."""
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+logger = logging.getLogger(__name__)
+
+# Polling interval used when no kernel file notifications are available
+POLL_INTERVAL = 2.0
+
+
+class _DispatchHandler(FileSystemEventHandler):
+    """Forwards watchdog events for subscribed files to the watcher."""
+
+    def __init__(self, watcher: "ConfigWatcher"):
+        self._watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        if event.is_directory:
+            return
+        self._watcher._dispatch(event.src_path)
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            self._watcher._dispatch(dest_path)
+
+
+class ConfigWatcher:
+    """
+    Process-wide watcher that calls back when subscribed files change.
+
+    Uses a single watchdog observer (inotify/FSEvents) when watchdog is
+    installed, otherwise a single polling thread that stats every
+    subscribed file once per cycle. Either way the number of threads is
+    constant no matter how many registries subscribe, and the polling
+    thread sleeps on a condition variable while nothing is subscribed.
+    """
+
+    _instance: "ConfigWatcher | None" = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL):
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._subscriptions: dict[str, list[Callable[[], None]]] = {}
+        self._observer = None
+        self._watched_dirs: set[str] = set()
+        self._poll_thread: threading.Thread | None = None
+        self._wakeup = threading.Condition(self._lock)
+
+    @staticmethod
+    def notifications_available() -> bool:
+        """Whether watchdog is installed so changes arrive as kernel notifications."""
+        return Observer is not None
+
+    @classmethod
+    def instance(cls) -> "ConfigWatcher":
+        """Get the process-wide watcher."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def subscribe(self, path: Path, callback: Callable[[], None]) -> None:
+        """Call `callback` whenever the file at `path` changes."""
+        key = os.path.abspath(path)
+        with self._lock:
+            self._subscriptions.setdefault(key, []).append(callback)
+            if Observer is not None:
+                self._watch_dir(os.path.dirname(key))
+            else:
+                self._ensure_poll_thread()
+                self._wakeup.notify()
+        logger.debug(f"Watching {key} for changes")
+
+    def unsubscribe(self, path: Path, callback: Callable[[], None]) -> None:
+        """Stop calling `callback` for changes to `path`."""
+        key = os.path.abspath(path)
+        with self._lock:
+            callbacks = self._subscriptions.get(key)
+            if not callbacks:
+                return
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                del self._subscriptions[key]
+
+    @classmethod
+    def register(cls, path: Path, callback: Callable[[], None]) -> None:
+        """Subscribe `callback` to `path` on the process-wide watcher."""
+        cls.instance().subscribe(path, callback)
+
+    @classmethod
+    def unregister(cls, path: Path, callback: Callable[[], None]) -> None:
+        """Unsubscribe `callback` from `path` on the process-wide watcher."""
+        cls.instance().unsubscribe(path, callback)
+
+    def _watch_dir(self, directory: str) -> None:
+        """Schedule one watchdog watch per parent directory (lock held)."""
+        if directory in self._watched_dirs:
+            return
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.start()
+        self._observer.schedule(_DispatchHandler(self), directory, recursive=False)
+        self._watched_dirs.add(directory)
+
+    def _dispatch(self, path: str) -> None:
+        """Run the callbacks subscribed to `path`."""
+        with self._lock:
+            callbacks = list(self._subscriptions.get(os.path.abspath(path), ()))
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error reloading {path}: {e}")
+
+    def _ensure_poll_thread(self) -> None:
+        """Start the shared polling thread if needed (lock held)."""
+        if self._poll_thread is not None:
+            return
+        self._poll_thread = threading.Thread(target=self._poll, daemon=True)
+        self._poll_thread.start()
+        logger.debug("Started config polling thread")
+
+    def _poll(self) -> None:
+        """Stat every subscribed file once per cycle and dispatch changes."""
+        seen: dict[str, tuple[int, int] | None] = {}
+        while True:
+            with self._lock:
+                # Sleep until something subscribes instead of polling nothing
+                while not self._subscriptions:
+                    seen.clear()
+                    self._wakeup.wait()
+                paths = list(self._subscriptions)
+
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                    signature = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    signature = None
+                # A newly subscribed path is dispatched once too, so an edit
+                # made between the subscriber's load and our first stat isn't
+                # missed (subscribers compare mtimes and skip no-op reloads)
+                if signature is not None and seen.get(path, ()) != signature:
+                    self._dispatch(path)
+                seen[path] = signature
+
+            # Forget paths that were unsubscribed
+            for path in seen.keys() - set(paths):
+                del seen[path]
+
+            with self._lock:
+                self._wakeup.wait(self._poll_interval)
@@ -1,23 +1,78 @@
 """Safe YAML read-modify-write for configuration files."""
 
 import logging
+import os
+import re
+import stat
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
+# Value coercion for `config set`
+_TRUE_STRINGS = frozenset({"true", "yes"})
+_FALSE_STRINGS = frozenset({"false", "no"})
+# Prefixes float() can parse, including "inf"/"infinity"/"nan" in any case
+_NUMERIC_RE = re.compile(r"\s*[-+]?(?:\.?\d|inf|nan)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _yaml_classes() -> tuple[type, type]:
+    """Import PyYAML on first use and pick its (Loader, Dumper) classes.
+
+    Importing yaml is deferred so commands that never touch config files
+    don't pay for it. The libyaml-backed classes are used when available.
+    """
+    try:
+        from yaml import CSafeDumper as Dumper
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+        from yaml import SafeLoader as Loader
+    return Loader, Dumper
+
+
+def _parse_file(path: Path):
+    """Parse a YAML file with the fastest available loader."""
+    import yaml
+
+    loader, _ = _yaml_classes()
+    return yaml.load(path.read_bytes(), Loader=loader)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML file; cached per (path, mtime_ns, size)."""
+    return _parse_file(Path(path)) or {}
+
+
+def load_yaml(path: Path, st: os.stat_result | None = None) -> dict:
+    """Parse a YAML config file, reusing the last parse while it is unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    Raises OSError / yaml.YAMLError like a direct parse would.
+
+    Args:
+        path: YAML file to load
+        st: Result of os.stat(path), if the caller already has it
+    """
+    if st is None:
+        st = os.stat(path)
+    return _parse_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
+
 
 def read_yaml(path: Path) -> dict:
     """Read a YAML file and return its contents as a dict.
 
     Returns an empty dict if the file doesn't exist or is malformed.
     """
+    import yaml
+
     if not path.exists():
         return {}
     try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = _parse_file(path)
         if not isinstance(data, dict):
             return {}
         return data
@@ -30,13 +85,46 @@ def read_yaml(path: Path) -> dict:
 
 
 def write_yaml(path: Path, data: dict) -> None:
-    """Write a dict to a YAML file, preserving readable formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    """Write a dict to a YAML file, preserving readable formatting.
 
+    The file is written to a temporary sibling and renamed into place, so
+    readers (and the config watcher) never see a partially written file.
+    The new file keeps the old one's permissions (0600 for a new file,
+    since configs can hold API keys), and a symlinked config is updated
+    through the link.
+    """
+    import yaml
+
+    _, dumper = _yaml_classes()
+    path = path.resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o600
 
-def set_nested_value(data: dict, dotted_key: str, value: str) -> dict:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb", buffering=1 << 16) as f:
+            os.fchmod(f.fileno(), mode)
+            yaml.dump(
+                data,
+                f,
+                Dumper=dumper,
+                default_flow_style=False,
+                sort_keys=False,
+                allow_unicode=True,
+                width=1_000_000,
+                encoding="utf-8",
+            )
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def set_nested_value(data: dict, dotted_key: str, value: object, coerce: bool = True) -> dict:
     """
     Set a value in a nested dict using dotted key notation.
 
@@ -44,17 +132,20 @@ def set_nested_value(data: dict, dotted_key: str, value: str) -> dict:
         set_nested_value({}, "openai.model", "gpt-4-turbo")
         -> {"openai": {"model": "gpt-4-turbo"}}
 
-    Attempts to coerce value to int/float/bool if appropriate.
+    With coerce=True (the default), attempts to coerce a string value to
+    int/float/bool if appropriate; otherwise the value is stored as-is.
     """
-    keys = dotted_key.split(".")
     current = data
-
-    for key in keys[:-1]:
-        if key not in current or not isinstance(current[key], dict):
-            current[key] = {}
-        current = current[key]
-
-    current[keys[-1]] = _coerce_value(value)
+    key, sep, rest = dotted_key.partition(".")
+    while sep:
+        # Create (or replace non-dict) intermediate levels
+        child = current.get(key)
+        if not isinstance(child, dict):
+            child = current[key] = {}
+        current = child
+        key, sep, rest = rest.partition(".")
+
+    current[key] = _coerce_value(value) if coerce else value
     return data
 
 
@@ -64,25 +155,31 @@ def get_nested_value(data: dict, dotted_key: str) -> object:
 
     Returns None if the key doesn't exist.
     """
-    keys = dotted_key.split(".")
     current = data
-
-    for key in keys:
-        if not isinstance(current, dict) or key not in current:
+    key, sep, rest = dotted_key.partition(".")
+    while True:
+        # The top level may not be a mapping either (e.g. a YAML list)
+        if not isinstance(current, dict):
             return None
-        current = current[key]
-
-    return current
+        if not sep:
+            return current.get(key)
+        current = current.get(key)
+        key, sep, rest = rest.partition(".")
 
 
 def _coerce_value(value: str) -> object:
     """Coerce a string value to the appropriate Python type."""
     # Booleans
-    if value.lower() in ("true", "yes"):
+    lowered = value.lower()
+    if lowered in _TRUE_STRINGS:
         return True
-    if value.lower() in ("false", "no"):
+    if lowered in _FALSE_STRINGS:
         return False
 
+    # Only attempt numeric parsing on values that can start a number
+    if not _NUMERIC_RE.match(value):
+        return value
+
     # Integers
     try:
         return int(value)
@@ -4,6 +4,7 @@ import asyncio
 import logging
 import signal
 import sys
+import time
 from pathlib import Path
 
 from wingman.config.registry import ContactRegistry, GroupRegistry
@@ -21,8 +22,47 @@ from .transports import (
     WhatsAppTransport,
 )
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Backoff between restarts of a crashed transport (seconds)
+TRANSPORT_RESTART_DELAY = 5.0
+TRANSPORT_MAX_RESTART_DELAY = 300.0
+# A run at least this long counts as healthy and resets the backoff
+TRANSPORT_HEALTHY_RUNTIME = TRANSPORT_MAX_RESTART_DELAY
+
+
+def install_event_loop_policy() -> bool:
+    """
+    Configure new event loops: uvloop when it is installed, and eager task
+    execution (asyncio.eager_task_factory, Python 3.12+) from the moment the
+    loop is created, so even the main task skips a scheduling round-trip.
+
+    Must be called before the loop is created (i.e. before `asyncio.run`).
+
+    Returns:
+        True if uvloop was installed
+    """
+    use_uvloop = uvloop is not None and sys.platform != "win32"
+    base_policy = uvloop.EventLoopPolicy if use_uvloop else asyncio.DefaultEventLoopPolicy
+
+    if hasattr(asyncio, "eager_task_factory"):
+
+        class EagerTaskPolicy(base_policy):
+            def new_event_loop(self) -> asyncio.AbstractEventLoop:
+                loop = super().new_event_loop()
+                loop.set_task_factory(asyncio.eager_task_factory)
+                return loop
+
+        asyncio.set_event_loop_policy(EagerTaskPolicy())
+    elif use_uvloop:
+        asyncio.set_event_loop_policy(base_policy())
+    return use_uvloop
+
 
 def setup_logging(log_dir: Path) -> None:
     """Set up logging to file and console."""
@@ -55,6 +95,8 @@ class MultiTransportAgent:
             model=settings.openai_model,
             max_tokens=settings.max_response_tokens,
             temperature=settings.temperature,
+            cache_enabled=settings.cache_enabled,
+            semantic_cache=settings.semantic_cache,
         )
 
         # Initialize config-driven registries
@@ -77,6 +119,7 @@ class MultiTransportAgent:
             quiet_start=settings.quiet_hours_start,
             quiet_end=settings.quiet_hours_end,
             context_window=settings.context_window_size,
+            stream_replies=settings.stream_replies,
         )
 
         # Set up message sender callback
@@ -85,6 +128,8 @@ class MultiTransportAgent:
         # Transports
         self.transports: dict[Platform, BaseTransport] = {}
         self._transport_tasks: list[asyncio.Task] = []
+        self._flush_task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._shutdown_event = asyncio.Event()
 
         # RPC server (initialized during start)
@@ -106,19 +151,7 @@ class MultiTransportAgent:
 
     async def _on_message(self, event: MessageEvent) -> None:
         """Handle incoming message from any transport."""
-        # Convert MessageEvent to dict format expected by processor
-        data = {
-            "chatId": event.chat_id,
-            "senderId": event.sender_id,
-            "senderName": event.sender_name,
-            "text": event.text,
-            "timestamp": event.timestamp,
-            "isGroup": event.is_group,
-            "isSelf": event.is_self,
-            "platform": event.platform.value,
-            "quotedMessage": event.quoted_message,
-        }
-        await self.processor.process_message(data)
+        await self.processor.process_message(event)
 
     async def start(self) -> None:
         """Start all configured transports."""
@@ -126,6 +159,16 @@ class MultiTransportAgent:
         logger.info(f"Bot name: {self.settings.bot_name}")
         logger.info(f"Model: {self.settings.openai_model}")
 
+        # Look the loop up once; the store and task creation reuse it
+        self._loop = loop = asyncio.get_running_loop()
+        self.store.set_loop(loop)
+
+        # Run new tasks eagerly until their first real suspension (Python 3.12+).
+        # Entry points already get this from install_event_loop_policy; this
+        # covers loops created elsewhere
+        if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+            loop.set_task_factory(asyncio.eager_task_factory)
+
         # Initialize WhatsApp transport
         whatsapp = WhatsAppTransport(
             self.settings.node_dir, auth_state_dir=self.settings.auth_state_dir
@@ -149,13 +192,8 @@ class MultiTransportAgent:
                     "and Messages.app is configured."
                 )
 
-        # Start all transports
-        for platform, transport in self.transports.items():
-            logger.info(f"Starting {platform.value} transport...")
-            task = asyncio.create_task(
-                self._run_transport(platform, transport), name=f"transport_{platform.value}"
-            )
-            self._transport_tasks.append(task)
+        # Write buffered messages to the database in the background
+        self._flush_task = loop.create_task(self.store.run_flusher(), name="store_flusher")
 
         # Start RPC server for console communication
         try:
@@ -171,19 +209,65 @@ class MultiTransportAgent:
 
         logger.info(f"Agent started with {len(self.transports)} transport(s)")
 
-        # Wait for shutdown or all tasks to complete
+        # Run all transports until shutdown or until they all finish
         try:
-            await asyncio.gather(*self._transport_tasks)
+            if hasattr(asyncio, "TaskGroup"):
+                async with asyncio.TaskGroup() as tg:
+                    for platform, transport in self.transports.items():
+                        logger.info(f"Starting {platform.value} transport...")
+                        task = tg.create_task(
+                            self._run_transport(platform, transport),
+                            name=f"transport_{platform.value}",
+                        )
+                        self._transport_tasks.append(task)
+            else:
+                # Python 3.10: no TaskGroup
+                for platform, transport in self.transports.items():
+                    logger.info(f"Starting {platform.value} transport...")
+                    task = loop.create_task(
+                        self._run_transport(platform, transport),
+                        name=f"transport_{platform.value}",
+                    )
+                    self._transport_tasks.append(task)
+                await asyncio.gather(*self._transport_tasks)
         except asyncio.CancelledError:
             logger.info("Transport tasks cancelled")
 
     async def _run_transport(self, platform: Platform, transport: BaseTransport) -> None:
-        """Run a single transport, handling errors."""
-        try:
-            await transport.start()
-        except Exception as e:
-            logger.error(f"{platform.value} transport error: {e}")
-            raise
+        """
+        Run a single transport, restarting it with backoff if it crashes.
+
+        A transport's start() runs until the transport stops, so returning
+        before shutdown was requested (e.g. the Node.js process exited) is
+        treated like an exception. A failing transport is contained here so
+        it never takes the other transports down with it. The backoff starts
+        over after a run that lasted TRANSPORT_HEALTHY_RUNTIME.
+        """
+        delay = TRANSPORT_RESTART_DELAY
+        while True:
+            started = time.monotonic()
+            try:
+                await transport.start()
+                if not self._shutdown_event.is_set():
+                    logger.error(f"{platform.value} transport exited unexpectedly")
+            except Exception as e:
+                logger.error(f"{platform.value} transport error: {e}")
+
+            if self._shutdown_event.is_set():
+                return
+
+            # Clean up whatever the crashed run left behind before retrying
+            try:
+                await transport.stop()
+            except Exception as e:
+                logger.error(f"Error stopping {platform.value}: {e}")
+
+            if time.monotonic() - started >= TRANSPORT_HEALTHY_RUNTIME:
+                delay = TRANSPORT_RESTART_DELAY
+
+            logger.info(f"Restarting {platform.value} transport in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, TRANSPORT_MAX_RESTART_DELAY)
 
     async def _on_whatsapp_connected(self, user_id: str) -> None:
         """Handle WhatsApp connection."""
@@ -192,6 +276,8 @@ class MultiTransportAgent:
     async def stop(self) -> None:
         """Stop all transports gracefully."""
         logger.info("Stopping agent...")
+        # Transports returning from start() now is expected, not a crash
+        self._shutdown_event.set()
 
         # Stop RPC server
         if self._rpc_server:
@@ -216,6 +302,19 @@ class MultiTransportAgent:
             except asyncio.CancelledError:
                 pass
 
+        # Stop the flusher; close() writes whatever is still buffered
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self.store.close()
+
+        try:
+            await self.llm.aclose()
+        except Exception as e:
+            logger.error(f"Error closing LLM client: {e}")
         logger.info("Agent stopped.")
 
     def request_shutdown(self) -> None:
@@ -257,7 +356,7 @@ async def run_agent(settings: Settings | None = None) -> None:
     agent = MultiTransportAgent(settings)
 
     # Set up signal handlers
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     def signal_handler():
         logger.info("Shutdown signal received")
@@ -277,3 +376,13 @@ async def run_agent(settings: Settings | None = None) -> None:
         pass
     finally:
         await agent.stop()
+
+
+def main() -> None:
+    """Run the agent in its own event loop (daemon entry point)."""
+    install_event_loop_policy()
+    asyncio.run(run_agent())
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 NULL_CHAR = "\0"
+NULL_BYTE = b"\0"
 
 
 @dataclass
@@ -33,7 +34,7 @@ class IPCHandler:
     def __init__(self, stdin: asyncio.StreamWriter, stdout: asyncio.StreamReader):
         self.stdin = stdin
         self.stdout = stdout
-        self._buffer = ""
+        self._buffer = bytearray()
         self._handlers: dict[str, Callable[[dict], Coroutine]] = {}
         self._running = False
 
@@ -79,16 +80,20 @@ class IPCHandler:
                     logger.warning("Node.js stdout closed")
                     break
 
-                self._buffer += chunk.decode("utf-8")
-
-                # Process all complete messages
-                while NULL_CHAR in self._buffer:
-                    null_idx = self._buffer.index(NULL_CHAR)
-                    json_str = self._buffer[:null_idx]
-                    self._buffer = self._buffer[null_idx + 1 :]
-
-                    if json_str.strip():
-                        await self._process_message(json_str)
+                # Frames stay bytes until json parses them: no decode and
+                # re-concatenation per chunk, and a UTF-8 character split
+                # across two reads is reassembled before decoding
+                buffer = self._buffer
+                buffer += chunk
+
+                # Process all complete messages, then drop them in one go
+                start = 0
+                while (null_idx := buffer.find(NULL_BYTE, start)) != -1:
+                    frame = bytes(buffer[start:null_idx])
+                    start = null_idx + 1
+                    if frame.strip():
+                        await self._process_message(frame)
+                del buffer[:start]
 
             except asyncio.CancelledError:
                 logger.info("Message reader cancelled")
@@ -97,10 +102,10 @@ class IPCHandler:
                 logger.error(f"Error reading from stdout: {e}")
                 await asyncio.sleep(0.1)
 
-    async def _process_message(self, json_str: str) -> None:
+    async def _process_message(self, frame: bytes | str) -> None:
         """Parse and dispatch a single message."""
         try:
-            data = json.loads(json_str)
+            data = json.loads(frame)
             message = IPCMessage(type=data.get("type", "unknown"), data=data.get("data"))
 
             handler = self._handlers.get(message.type)
@@ -109,7 +114,7 @@ class IPCHandler:
             else:
                 logger.debug(f"No handler for message type: {message.type}")
 
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error(f"Failed to parse JSON: {e}")
         except Exception as e:
             logger.error(f"Error processing message: {e}")
@@ -1,48 +1,260 @@
 """OpenAI API client wrapper."""
 
+import hashlib
+import json
 import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
+from importlib.util import find_spec
 
 from openai import AsyncOpenAI
 
+from .semantic_cache import EMBEDDING_MODEL, SemanticCache
+
+try:
+    import httpx
+    from openai import DefaultAsyncHttpxClient
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Connection pool for the OpenAI API, shared by all concurrent requests
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+KEEPALIVE_EXPIRY = 30.0
+
+# Messages before the latest user message that scope a semantic cache entry,
+# so a short reply like "yes" only matches within the same conversation state
+SEMANTIC_SCOPE_HISTORY = 4
+
+
+def _build_http_client():
+    """
+    Build a pooled keep-alive HTTP client for the OpenAI API.
+
+    Uses HTTP/2 (one multiplexed connection for concurrent chats) when the
+    h2 package is installed. Built on the SDK's default client, so its
+    timeout and proxy environment variables still apply; retries are left
+    to the SDK. Returns None to fall back to the SDK's own client if httpx
+    or DefaultAsyncHttpxClient isn't importable.
+    """
+    if httpx is None:
+        return None
+    return DefaultAsyncHttpxClient(
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+
 
 class LLMClient:
     """Async OpenAI API client for generating responses."""
 
     def __init__(
-        self, api_key: str, model: str = "gpt-4o", max_tokens: int = 150, temperature: float = 0.8
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        max_tokens: int = 150,
+        temperature: float = 0.8,
+        cache_enabled: bool = False,
+        cache_size: int = 1024,
+        semantic_cache: bool = False,
     ):
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key, http_client=_build_http_client())
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
 
+        # Exact-match response cache (LRU). Only deterministic calls are cached
+        # unless explicitly enabled, since sampling is meant to vary replies.
+        self.cache_enabled = cache_enabled
+        self._cache_size = cache_size
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+
+        # Ready-made system message dicts, keyed by their content
+        self._system_messages: dict[str, dict[str, str]] = {}
+
+        # Paraphrase cache keyed on the last user message's embedding. Costs an
+        # embeddings call per message, so it is opt-in (and needs numpy).
+        self._semantic_cache: SemanticCache | None = None
+        if semantic_cache:
+            if SemanticCache.available():
+                self._semantic_cache = SemanticCache()
+            else:
+                logger.warning("Semantic cache disabled: numpy is not installed")
+
+    # Upper bound on memoized system messages (prompts + language instructions)
+    MAX_SYSTEM_MESSAGES = 1024
+
+    def prewarm(
+        self, system_prompts: Iterable[str], language_instructions: Iterable[str | None]
+    ) -> None:
+        """
+        Build the system messages for known prompts and language instructions up front.
+
+        Args:
+            system_prompts: Personality prompts that will be passed to generate_response
+            language_instructions: Language instructions that may accompany them
+        """
+        for content in (*system_prompts, *language_instructions):
+            if content:
+                self._system_message(content)
+        logger.debug(f"Prewarmed {len(self._system_messages)} system messages")
+
+    def _system_message(self, content: str) -> dict[str, str]:
+        """Get the (shared, read-only) system message dict for some content."""
+        message = self._system_messages.get(content)
+        if message is None:
+            if len(self._system_messages) >= self.MAX_SYSTEM_MESSAGES:
+                self._system_messages.clear()
+            message = self._system_messages[content] = {"role": "system", "content": content}
+        return message
+
+    def _api_messages(
+        self,
+        system_prompt: str,
+        messages: list[dict[str, str]],
+        language_instruction: str | None,
+        contact_note: str | None = None,
+    ) -> list[dict[str, str]]:
+        """
+        Assemble the request messages, most stable first.
+
+        OpenAI reuses cached prompt prefixes, so the shared system prompt goes
+        first byte-for-byte unchanged, then the per-chat contact note, then
+        the history, and the per-message language instruction last.
+        """
+        api_messages = [self._system_message(system_prompt)]
+        if contact_note:
+            api_messages.append(self._system_message(contact_note))
+        api_messages.extend(messages)
+        if language_instruction:
+            api_messages.append(self._system_message(language_instruction))
+        return api_messages
+
+    def _use_cache(self) -> bool:
+        """Whether responses may be served from / stored in the cache."""
+        return self.cache_enabled or self.temperature <= 0.0
+
+    def _cache_key(self, api_messages: list[dict[str, str]]) -> bytes:
+        """Hash everything that determines the response."""
+        payload = {
+            "m": self.model,
+            "t": self.temperature,
+            "x": self.max_tokens,
+            "h": api_messages,
+        }
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        else:
+            data = json.dumps(
+                payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+            ).encode()
+        return hashlib.sha256(data).digest()
+
+    @staticmethod
+    def _semantic_scope(
+        system_prompt: str,
+        messages: list[dict[str, str]],
+        last_user_index: int,
+        language_instruction: str | None,
+        contact_note: str | None,
+    ) -> str:
+        """Hash the prompt settings and recent history a semantic cache hit must share."""
+        start = max(0, last_user_index - SEMANTIC_SCOPE_HISTORY)
+        payload = [
+            system_prompt,
+            contact_note,
+            language_instruction,
+            messages[start:last_user_index],
+        ]
+        if orjson is not None:
+            data = orjson.dumps(payload)
+        else:
+            data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+        return hashlib.sha256(data).hexdigest()
+
+    async def _embed(self, text: str):
+        """Embed text for the semantic cache, or None if the call fails."""
+        try:
+            response = await self.client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            return SemanticCache.normalize(response.data[0].embedding)
+        except Exception as e:
+            logger.debug(f"Embedding failed, skipping semantic cache: {e}")
+            return None
+
     async def generate_response(
         self,
         system_prompt: str,
         messages: list[dict[str, str]],
         language_instruction: str | None = None,
+        contact_note: str | None = None,
     ) -> str | None:
         """
         Generate a response using the OpenAI API.
 
         Args:
-            system_prompt: The personality/system prompt
+            system_prompt: The personality/system prompt. Pass the same string
+                for every call with a given personality (don't edit it per
+                message) so the provider's prompt-prefix cache can hit.
             messages: Conversation history
             language_instruction: Optional language-specific instruction
+            contact_note: Optional per-chat note about who the bot is talking to,
+                sent as its own message so the system prompt stays shared
 
         Returns:
             Generated response text or None on error
         """
         try:
-            # Build full system prompt
-            full_system = system_prompt
-            if language_instruction:
-                full_system += f"\n\n{language_instruction}"
-
             # Prepare messages for API
-            api_messages = [{"role": "system", "content": full_system}, *messages]
+            api_messages = self._api_messages(
+                system_prompt, messages, language_instruction, contact_note
+            )
+
+            # Serve repeats of an identical request from the cache
+            cache_key = None
+            if self._use_cache():
+                cache_key = self._cache_key(api_messages)
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+                    logger.debug("Serving response from cache")
+                    return cached
+
+            # Serve paraphrases of a recent message from the semantic cache
+            semantic_vector = None
+            if self._semantic_cache is not None and (self.cache_enabled or self.temperature < 0.3):
+                last_user_index = next(
+                    (
+                        i
+                        for i in range(len(messages) - 1, -1, -1)
+                        if messages[i].get("role") == "user"
+                    ),
+                    None,
+                )
+                if last_user_index is not None and messages[last_user_index]["content"]:
+                    scope = self._semantic_scope(
+                        system_prompt,
+                        messages,
+                        last_user_index,
+                        language_instruction,
+                        contact_note,
+                    )
+                    semantic_vector = await self._embed(messages[last_user_index]["content"])
+                if semantic_vector is not None:
+                    cached = self._semantic_cache.lookup(scope, semantic_vector)
+                    if cached is not None:
+                        logger.debug("Serving response from semantic cache")
+                        return cached
 
             logger.debug(f"Sending request to {self.model} with {len(messages)} context messages")
 
@@ -56,6 +268,12 @@ class LLMClient:
             if response.choices and response.choices[0].message.content:
                 text = response.choices[0].message.content.strip()
                 logger.debug(f"Generated response: {text[:50]}...")
+                if cache_key is not None:
+                    self._cache[cache_key] = text
+                    if len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+                if semantic_vector is not None:
+                    self._semantic_cache.add(scope, semantic_vector, text)
                 return text
 
             logger.warning("Empty response from API")
@@ -65,6 +283,69 @@ class LLMClient:
             logger.error(f"API error: {e}")
             return None
 
+    async def generate_response_stream(
+        self,
+        system_prompt: str,
+        messages: list[dict[str, str]],
+        language_instruction: str | None = None,
+        contact_note: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the OpenAI API as text deltas.
+
+        Takes the same arguments as generate_response. Errors are logged and
+        end the stream early.
+
+        Yields:
+            Chunks of response text as they arrive
+        """
+        api_messages = self._api_messages(
+            system_prompt, messages, language_instruction, contact_note
+        )
+
+        # A cached reply is yielded whole
+        cache_key = None
+        if self._use_cache():
+            cache_key = self._cache_key(api_messages)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                logger.debug("Serving response from cache")
+                yield cached
+                return
+
+        logger.debug(f"Streaming from {self.model} with {len(messages)} context messages")
+
+        parts: list[str] = []
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=api_messages,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                stream=True,
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            logger.error(f"API error: {e}")
+            return
+
+        text = "".join(parts).strip()
+        if cache_key is not None and text:
+            self._cache[cache_key] = text
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool."""
+        await self.client.close()
+
     async def health_check(self) -> bool:
         """Check if the API is accessible."""
         try:
@@ -0,0 +1,73 @@
+"""Embedding-similarity cache for LLM responses."""
+
+import logging
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIM = 1536
+SIMILARITY_THRESHOLD = 0.92
+
+
+class SemanticCache:
+    """
+    Fixed-size ring of (embedding, response) pairs matched by cosine similarity.
+
+    Entries are scoped by a key (the full system prompt) so a reply cached
+    for one contact/tone is never served to another. Requires numpy.
+    """
+
+    def __init__(
+        self,
+        size: int = 256,
+        threshold: float = SIMILARITY_THRESHOLD,
+        dim: int = EMBEDDING_DIM,
+    ):
+        if np is None:
+            raise RuntimeError("SemanticCache requires numpy (pip install numpy)")
+        self.threshold = threshold
+        self._matrix = np.zeros((size, dim), dtype=np.float32)
+        self._keys: list[str | None] = [None] * size
+        self._responses: list[str | None] = [None] * size
+        self._next = 0
+        self._count = 0
+
+    @staticmethod
+    def available() -> bool:
+        """Whether numpy is installed so the cache can be used."""
+        return np is not None
+
+    @staticmethod
+    def normalize(embedding: list[float]):
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, key: str, vector) -> str | None:
+        """Get the cached response most similar to `vector` for `key`, if close enough."""
+        if not self._count:
+            return None
+
+        # One matrix-vector product scores every cached entry
+        sims = self._matrix[: self._count] @ vector
+        for i in np.argsort(sims)[::-1]:
+            if sims[i] < self.threshold:
+                return None
+            if self._keys[i] == key:
+                return self._responses[i]
+        return None
+
+    def add(self, key: str, vector, response: str) -> None:
+        """Store a response, overwriting the oldest entry once full."""
+        i = self._next
+        self._matrix[i] = vector
+        self._keys[i] = key
+        self._responses[i] = response
+        self._next = (i + 1) % len(self._responses)
+        self._count = min(self._count + 1, len(self._responses))
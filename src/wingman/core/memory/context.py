@@ -1,15 +1,63 @@
 """Context building for LLM conversations."""
 
 import logging
+import re
+import threading
+from collections import OrderedDict
 from typing import Any
 
-from .models import MessageStore
+from .models import Message, MessageStore
 
 logger = logging.getLogger(__name__)
 
+# Devanagari Unicode range, as a str.translate() table that deletes it
+_DEVANAGARI_STRIP = dict.fromkeys(range(0x0900, 0x0980))
+
+# Common Hinglish words/patterns, matched as whole words
+_HINGLISH_MARKERS = (
+    "hai",
+    "hain",
+    "kya",
+    "nahi",
+    "aur",
+    "bhi",
+    "kaise",
+    "kaisa",
+    "accha",
+    "theek",
+    "yaar",
+    "bhai",
+    "arre",
+    "haan",
+    "matlab",
+    "wala",
+    "kar",
+    "karo",
+    "karna",
+    "raha",
+    "rahi",
+)
+_HINGLISH_RE = re.compile(r"\b(?:" + "|".join(_HINGLISH_MARKERS) + r")\b")
+
+# Instruction appended to the system prompt for each detected language
+LANGUAGE_INSTRUCTIONS = {
+    "hindi": "Respond in Hindi (Devanagari script). Match the casual tone.",
+    "hinglish": "Respond in Hinglish (Hindi words in Roman script mixed with English). Keep it natural and casual.",
+    "english": "Respond in English. Keep it casual and friendly.",
+}
+
 
 class ContextBuilder:
-    """Builds conversation context for LLM from stored messages."""
+    """
+    Builds conversation context for LLM from stored messages.
+
+    The formatted history of recently active chats is cached and kept
+    current by listening to the store, so a new message costs one append
+    instead of re-reading the whole window from SQLite.
+    """
+
+    # Maximum number of chats whose history is kept in memory
+    MAX_CACHED_CHATS = 256
 
     def __init__(
         self, message_store: MessageStore, window_size: int = 30, bot_name: str = "Maximus"
@@ -18,36 +66,122 @@ class ContextBuilder:
         self.window_size = window_size
         self.bot_name = bot_name
 
-    def build_context(self, chat_id: str, current_message: dict[str, Any]) -> list[dict[str, str]]:
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, list[dict[str, str]]] = OrderedDict()
+        # Per-chat count of stored messages, to detect writes racing a fill
+        self._writes: dict[str, int] = {}
+        self._generation = message_store.generation
+        message_store.add_listener(self._on_message_stored)
+
+    def build_context(
+        self, chat_id: str, sender_name: str | None, text: str
+    ) -> list[dict[str, str]]:
         """
         Build conversation context for the LLM.
 
         Args:
             chat_id: Chat to build context for
-            current_message: The current incoming message
+            sender_name: Sender of the current incoming message
+            text: Text of the current incoming message
 
         Returns:
             List of message dicts for OpenAI API format
         """
-        # Get recent messages from storage
-        messages = self.store.get_recent_messages(chat_id, limit=self.window_size)
-
-        # Convert to OpenAI message format
-        context = []
-        for msg in messages:
-            if msg.is_self:
-                context.append({"role": "assistant", "content": msg.text})
-            else:
-                # Format user messages with sender name for context
-                sender = msg.sender_name or "User"
-                content = f"[{sender}]: {msg.text}"
-                context.append({"role": "user", "content": content})
-
-        # Add current message
-        sender_name = current_message.get("senderName") or "User"
-        context.append(
-            {"role": "user", "content": f"[{sender_name}]: {current_message.get('text', '')}"}
-        )
+        history = self._cached_history(chat_id)
+        if history is None:
+            writes = self._writes.get(chat_id, 0)
+            columns = self.store.get_recent_messages_columns(chat_id, limit=self.window_size)
+            history = self._fill_cache(chat_id, writes, columns)
+        return self._with_current(chat_id, history, sender_name, text)
+
+    async def abuild_context(
+        self, chat_id: str, sender_name: str | None, text: str
+    ) -> list[dict[str, str]]:
+        """Async variant of `build_context` that reads off the event loop."""
+        history = self._cached_history(chat_id)
+        if history is None:
+            writes = self._writes.get(chat_id, 0)
+            columns = await self.store.aget_recent_messages_columns(chat_id, limit=self.window_size)
+            history = self._fill_cache(chat_id, writes, columns)
+        return self._with_current(chat_id, history, sender_name, text)
+
+    async def alast_is_self(self, chat_id: str) -> bool:
+        """
+        Check whether the last message in a chat was from the bot.
+
+        Answered from the cached history when there is one. Otherwise the
+        chat's history is loaded with the same query and cached, so a
+        following `abuild_context` doesn't hit the database again.
+        """
+        history = self._cached_history(chat_id)
+        if history is not None:
+            return bool(history) and history[-1]["role"] == "assistant"
+
+        writes = self._writes.get(chat_id, 0)
+        columns, _, last_is_self = await self.store.aget_chat_state(chat_id, self.window_size)
+        self._fill_cache(chat_id, writes, columns)
+        return last_is_self
+
+    @staticmethod
+    def _format_message(is_self: bool, sender_name: str | None, text: str) -> dict[str, str]:
+        """Convert a stored message to OpenAI format."""
+        if is_self:
+            return {"role": "assistant", "content": text}
+        # Format user messages with sender name for context
+        return {"role": "user", "content": f"[{sender_name or 'User'}]: {text}"}
+
+    def _cached_history(self, chat_id: str) -> list[dict[str, str]] | None:
+        """Get a copy of the cached history for a chat, if any."""
+        with self._lock:
+            # Drop everything if stored messages were deleted
+            if self._generation != self.store.generation:
+                self._cache.clear()
+                self._generation = self.store.generation
+            history = self._cache.get(chat_id)
+            if history is None:
+                return None
+            self._cache.move_to_end(chat_id)
+            return list(history)
+
+    def _fill_cache(
+        self, chat_id: str, writes: int, columns: dict[str, list[Any]]
+    ) -> list[dict[str, str]]:
+        """Cache history read from the store, unless a write raced the read."""
+        format_message = self._format_message
+        history = [
+            format_message(is_self, sender_name, text)
+            for is_self, sender_name, text in zip(
+                columns["is_self"], columns["sender_name"], columns["text"]
+            )
+        ]
+        with self._lock:
+            if self._writes.get(chat_id, 0) == writes:
+                self._cache[chat_id] = list(history)
+                if len(self._cache) > self.MAX_CACHED_CHATS:
+                    self._cache.popitem(last=False)
+        return history
+
+    def _on_message_stored(self, message: Message) -> None:
+        """Append a newly stored message to its chat's cached history."""
+        chat_id = message.chat_id
+        with self._lock:
+            self._writes[chat_id] = self._writes.get(chat_id, 0) + 1
+            history = self._cache.get(chat_id)
+            if history is None:
+                return
+            history.append(self._format_message(message.is_self, message.sender_name, message.text))
+            if len(history) > self.window_size:
+                del history[: -self.window_size]
+
+    def _with_current(
+        self, chat_id: str, context: list[dict[str, str]], sender_name: str | None, text: str
+    ) -> list[dict[str, str]]:
+        """Append the current message to a copy of the chat history."""
+        # The processor stores the incoming message before building context,
+        # so it is usually already the last history entry; don't send it twice
+        current = self._format_message(False, sender_name, text)
+        if not context or context[-1] != current:
+            context.append(current)
 
         logger.debug(f"Built context with {len(context)} messages for {chat_id}")
         return context
@@ -60,39 +194,14 @@ class ContextBuilder:
         Returns:
             'hindi', 'hinglish', or 'english'
         """
-        # Devanagari Unicode range
-        hindi_chars = sum(1 for c in text if "\u0900" <= c <= "\u097f")
+        # Devanagari characters are the ones translate() strips
+        hindi_chars = len(text) - len(text.translate(_DEVANAGARI_STRIP))
 
         if hindi_chars > len(text) * 0.3:
             return "hindi"
 
-        # Check for common Hinglish words/patterns
-        hinglish_markers = [
-            "hai",
-            "hain",
-            "kya",
-            "nahi",
-            "aur",
-            "bhi",
-            "kaise",
-            "kaisa",
-            "accha",
-            "theek",
-            "yaar",
-            "bhai",
-            "arre",
-            "haan",
-            "matlab",
-            "wala",
-            "kar",
-            "karo",
-            "karna",
-            "raha",
-            "rahi",
-        ]
-
-        text_lower = text.lower()
-        hinglish_count = sum(1 for word in hinglish_markers if word in text_lower)
+        # Count distinct Hinglish marker words
+        hinglish_count = len(set(_HINGLISH_RE.findall(text.lower())))
 
         if hinglish_count >= 2:
             return "hinglish"
@@ -101,9 +210,4 @@ class ContextBuilder:
 
     def get_language_instruction(self, language: str) -> str:
         """Get language-specific instruction for the LLM."""
-        instructions = {
-            "hindi": "Respond in Hindi (Devanagari script). Match the casual tone.",
-            "hinglish": "Respond in Hinglish (Hindi words in Roman script mixed with English). Keep it natural and casual.",
-            "english": "Respond in English. Keep it casual and friendly.",
-        }
-        return instructions.get(language, instructions["english"])
+        return LANGUAGE_INSTRUCTIONS.get(language, LANGUAGE_INSTRUCTIONS["english"])
@@ -1,13 +1,67 @@
 """SQLite database models and operations."""
 
+import asyncio
 import logging
 import sqlite3
-from contextlib import contextmanager
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Hot-path statements, kept as module constants so the connection's statement
+# cache reuses their compiled form across calls
+SQL_INSERT = """
+    INSERT INTO messages (chat_id, sender_id, sender_name, text, timestamp, is_self, platform)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+# Newest `limit` rows of a chat, emitted oldest first by the outer query
+SQL_RECENT = """
+    SELECT id, sender_id, sender_name, text, timestamp, is_self, platform
+    FROM (
+        SELECT id, sender_id, sender_name, text, timestamp, is_self, platform
+        FROM messages
+        WHERE chat_id = ?
+        ORDER BY timestamp DESC
+        LIMIT ?
+    )
+    ORDER BY timestamp ASC
+"""
+SQL_RECENT_COLUMNS = """
+    SELECT is_self, sender_id, sender_name, text
+    FROM (
+        SELECT is_self, sender_id, sender_name, text, timestamp
+        FROM messages
+        WHERE chat_id = ?
+        ORDER BY timestamp DESC
+        LIMIT ?
+    )
+    ORDER BY timestamp ASC
+"""
+# Answered from idx_messages_chat_recent alone, without touching the table
+SQL_LAST_MESSAGE_META = """
+    SELECT sender_id, is_self
+    FROM messages
+    WHERE chat_id = ?
+    ORDER BY timestamp DESC
+    LIMIT 1
+"""
+
+# Buffered inserts are written once this many are queued, or by the
+# background flusher every FLUSH_INTERVAL seconds
+FLUSH_BATCH_SIZE = 32
+FLUSH_INTERVAL = 0.05
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
 
 @dataclass
 class Message:
@@ -24,17 +78,158 @@ class Message:
 
 
 class MessageStore:
-    """SQLite-based message storage."""
+    """
+    SQLite-based message storage.
+
+    Holds one long-lived connection (WAL, autocommit) shared by all callers
+    and serialized with a lock, instead of connecting per query. Inserts are
+    buffered and written in one transaction per batch; every read flushes
+    the buffer first, so callers always see their own writes. The `a*`
+    coroutine variants run on a dedicated database thread so async callers
+    don't block the event loop on disk I/O.
+    """
 
     def __init__(self, db_path: Path):
         self.db_path = db_path
+        self._lock = threading.Lock()
+        self._write_buf: list[tuple] = []
+        self._listeners: list[Callable[[Message], None]] = []
+        # Bumped when stored messages are removed, so caches of recent
+        # messages know to start over
+        self.generation = 0
+        # Event loop used by the async variants; looked up per call until set
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # SQLite serializes access anyway, so one worker thread is enough
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wingman-db")
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
         self._ensure_db_exists()
 
-    def _ensure_db_exists(self) -> None:
-        """Create database and tables if they don't exist."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+    def close(self) -> None:
+        """Flush pending writes and close the database connection."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            try:
+                self._flush_locked()
+            finally:
+                self._conn.close()
+
+    def add_listener(self, callback: Callable[[Message], None]) -> None:
+        """Call `callback` with every message passed to `store_message`."""
+        self._listeners.append(callback)
+
+    def flush(self) -> None:
+        """Write all buffered messages to the database."""
+        with self._lock:
+            self._flush_locked()
 
-        with self._get_connection() as conn:
+    def _flush_locked(self) -> None:
+        """Write buffered messages in a single transaction (lock held).
+
+        If the database is busy or otherwise unavailable, the rows stay
+        queued for the next flush and the error is raised. A row the schema
+        rejects is dropped with a logged error; the rest of the batch is kept.
+        """
+        if not self._write_buf:
+            return
+        rows, self._write_buf = self._write_buf, []
+        try:
+            self._insert_locked(rows)
+        except sqlite3.OperationalError:
+            self._write_buf[:0] = rows
+            raise
+        except sqlite3.Error:
+            # Find the bad row(s) by writing the batch one row at a time
+            for i, row in enumerate(rows):
+                try:
+                    self._insert_locked([row])
+                except sqlite3.OperationalError:
+                    self._write_buf[:0] = rows[i:]
+                    raise
+                except sqlite3.Error as e:
+                    logger.error(f"Dropped unwritable message in chat {row[0]}: {e}")
+        logger.debug(f"Flushed {len(rows)} message(s) to database")
+
+    def _insert_locked(self, rows: list[tuple]) -> None:
+        """Insert rows in one transaction, rolling back on error (lock held)."""
+        conn = self._conn
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(SQL_INSERT, rows)
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def _try_flush_locked(self) -> None:
+        """Flush before a read or after a queued write, logging failures (lock held).
+
+        Unwritten rows stay queued for the next flush, so callers carry on
+        with what is already in the database.
+        """
+        try:
+            self._flush_locked()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to flush messages: {e}")
+
+    async def run_flusher(self, interval: float = FLUSH_INTERVAL) -> None:
+        """Periodically flush buffered writes until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            if not self._write_buf:
+                continue
+            try:
+                await self._run(self.flush)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to flush messages: {e}")
+
+    def set_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Pin the event loop that all async calls on this store run in."""
+        self._loop = loop
+
+    async def _run(self, func: Callable, *args):
+        """Run a blocking store method on the database thread."""
+        # run_in_executor skips the context copy and partial() of to_thread
+        loop = self._loop or asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def astore_message(self, message: Message) -> None:
+        """Async variant of `store_message`."""
+        await self._run(self.store_message, message)
+
+    async def aget_recent_messages(self, chat_id: str, limit: int = 30) -> list[Message]:
+        """Async variant of `get_recent_messages`."""
+        return await self._run(self.get_recent_messages, chat_id, limit)
+
+    async def aget_recent_messages_columns(
+        self, chat_id: str, limit: int = 30
+    ) -> dict[str, list[Any]]:
+        """Async variant of `get_recent_messages_columns`."""
+        return await self._run(self.get_recent_messages_columns, chat_id, limit)
+
+    async def aget_chat_state(
+        self, chat_id: str, limit: int = 30
+    ) -> tuple[dict[str, list[Any]], str | None, bool]:
+        """Async variant of `get_chat_state`."""
+        return await self._run(self.get_chat_state, chat_id, limit)
+
+    async def awas_last_message_from_self(self, chat_id: str) -> bool:
+        """Async variant of `was_last_message_from_self`."""
+        return await self._run(self.was_last_message_from_self, chat_id)
+
+    def _ensure_db_exists(self) -> None:
+        """Create tables if they don't exist."""
+        with self._lock:
+            conn = self._conn
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS messages (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -47,58 +242,44 @@ class MessageStore:
                     platform TEXT DEFAULT 'whatsapp'
                 )
             """)
+            # Covering index for per-chat recency queries; it supersedes the
+            # old (chat_id, timestamp) index, so drop that one
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_chat
-                ON messages(chat_id, timestamp DESC)
+                CREATE INDEX IF NOT EXISTS idx_messages_chat_recent
+                ON messages(chat_id, timestamp DESC, is_self, sender_id)
             """)
+            conn.execute("DROP INDEX IF EXISTS idx_messages_chat")
             # Add platform column if it doesn't exist (migration for existing DBs)
             try:
                 conn.execute("SELECT platform FROM messages LIMIT 1")
             except Exception:
                 conn.execute("ALTER TABLE messages ADD COLUMN platform TEXT DEFAULT 'whatsapp'")
                 logger.info("Added platform column to messages table")
-            conn.commit()
             logger.info(f"Database initialized: {self.db_path}")
 
-    @contextmanager
-    def _get_connection(self):
-        """Get a database connection context manager."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
-
-    def store_message(self, message: Message) -> int:
+    def store_message(self, message: Message) -> None:
         """
-        Store a message in the database.
+        Queue a message for storage.
 
-        Returns:
-            The ID of the inserted message
+        The row is written with the next batch: once FLUSH_BATCH_SIZE rows are
+        queued, on the next `flush()` (see `run_flusher`), or before any read.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO messages (chat_id, sender_id, sender_name, text, timestamp, is_self, platform)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    message.chat_id,
-                    message.sender_id,
-                    message.sender_name,
-                    message.text,
-                    message.timestamp,
-                    1 if message.is_self else 0,
-                    message.platform,
-                ),
-            )
-            conn.commit()
-            msg_id = cursor.lastrowid
-            logger.debug(
-                f"Stored message {msg_id} in chat {message.chat_id} (platform={message.platform})"
-            )
-            return msg_id
+        row = (
+            message.chat_id,
+            message.sender_id,
+            message.sender_name,
+            message.text,
+            message.timestamp,
+            1 if message.is_self else 0,
+            message.platform,
+        )
+        with self._lock:
+            self._write_buf.append(row)
+            if len(self._write_buf) >= FLUSH_BATCH_SIZE:
+                self._try_flush_locked()
+        logger.debug(f"Queued message in chat {message.chat_id} (platform={message.platform})")
+        for callback in self._listeners:
+            callback(message)
 
     def get_recent_messages(self, chat_id: str, limit: int = 30) -> list[Message]:
         """
@@ -111,24 +292,16 @@ class MessageStore:
         Returns:
             List of messages, oldest first
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT id, chat_id, sender_id, sender_name, text, timestamp, is_self, platform
-                FROM messages
-                WHERE chat_id = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (chat_id, limit),
-            )
+        with self._lock:
+            self._try_flush_locked()
+            cursor = self._conn.execute(SQL_RECENT, (chat_id, limit))
             rows = cursor.fetchall()
 
-        # Convert to Message objects and reverse for chronological order
+        # Convert to Message objects (already in chronological order)
         messages = [
             Message(
                 id=row["id"],
-                chat_id=row["chat_id"],
+                chat_id=chat_id,
                 sender_id=row["sender_id"],
                 sender_name=row["sender_name"],
                 text=row["text"],
@@ -136,56 +309,92 @@ class MessageStore:
                 is_self=bool(row["is_self"]),
                 platform=row["platform"] or "whatsapp",
             )
-            for row in reversed(rows)
+            for row in rows
         ]
 
         logger.debug(f"Retrieved {len(messages)} messages from {chat_id}")
         return messages
 
+    def get_recent_messages_columns(self, chat_id: str, limit: int = 30) -> dict[str, list[Any]]:
+        """
+        Get the fields needed for LLM context of recent messages, column-wise.
+
+        Cheaper than `get_recent_messages` when only these fields are needed:
+        no Message objects are built.
+
+        Args:
+            chat_id: The chat to get messages from
+            limit: Maximum number of messages to return
+
+        Returns:
+            {"is_self": [...], "sender_id": [...], "sender_name": [...], "text": [...]},
+            oldest first
+        """
+        with self._lock:
+            self._try_flush_locked()
+            rows = self._conn.execute(SQL_RECENT_COLUMNS, (chat_id, limit)).fetchall()
+
+        return {
+            "is_self": [bool(row[0]) for row in rows],
+            "sender_id": [row[1] for row in rows],
+            "sender_name": [row[2] for row in rows],
+            "text": [row[3] for row in rows],
+        }
+
+    def get_chat_state(
+        self, chat_id: str, limit: int = 30
+    ) -> tuple[dict[str, list[Any]], str | None, bool]:
+        """
+        Get a chat's recent messages and last-message info in one query.
+
+        Args:
+            chat_id: The chat to get messages from
+            limit: Maximum number of messages to return
+
+        Returns:
+            (columns as from `get_recent_messages_columns`, last sender ID,
+            whether the last message was from the bot)
+        """
+        columns = self.get_recent_messages_columns(chat_id, limit)
+        if not columns["text"]:
+            return columns, None, False
+        return columns, columns["sender_id"][-1], columns["is_self"][-1]
+
+    def get_last_message_meta(self, chat_id: str) -> tuple[str | None, bool]:
+        """
+        Get the sender and origin of the last message in a chat in one query.
+
+        Returns:
+            (sender ID, whether it was sent by the bot), or (None, False) if
+            the chat is empty
+        """
+        with self._lock:
+            self._try_flush_locked()
+            row = self._conn.execute(SQL_LAST_MESSAGE_META, (chat_id,)).fetchone()
+
+        if row is None:
+            return None, False
+        return row["sender_id"], bool(row["is_self"])
+
     def get_last_sender(self, chat_id: str) -> str | None:
         """
         Get the sender ID of the last message in a chat.
 
         Returns:
-            Sender ID or None if chat is empty
+            Sender ID ("self" for the bot) or None if chat is empty
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT sender_id, is_self
-                FROM messages
-                WHERE chat_id = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-                """,
-                (chat_id,),
-            )
-            row = cursor.fetchone()
-
-        if row:
-            return "self" if row["is_self"] else row["sender_id"]
-        return None
+        sender_id, is_self = self.get_last_message_meta(chat_id)
+        return "self" if is_self else sender_id
 
     def was_last_message_from_self(self, chat_id: str) -> bool:
         """Check if the last message in a chat was from the bot."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT is_self
-                FROM messages
-                WHERE chat_id = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-                """,
-                (chat_id,),
-            )
-            row = cursor.fetchone()
-
-        return bool(row and row["is_self"])
+        return self.get_last_message_meta(chat_id)[1]
 
     def get_message_count(self, chat_id: str | None = None) -> int:
         """Get total message count, optionally filtered by chat."""
-        with self._get_connection() as conn:
+        with self._lock:
+            self._try_flush_locked()
+            conn = self._conn
             if chat_id:
                 cursor = conn.execute("SELECT COUNT(*) FROM messages WHERE chat_id = ?", (chat_id,))
             else:
@@ -194,7 +403,9 @@ class MessageStore:
 
     def get_recent_chats(self, limit: int = 20) -> list[dict]:
         """Get recently active chats with their last message."""
-        with self._get_connection() as conn:
+        with self._lock:
+            self._try_flush_locked()
+            conn = self._conn
             cursor = conn.execute(
                 """
                 SELECT chat_id, sender_name, text, timestamp, is_self, platform,
@@ -224,7 +435,9 @@ class MessageStore:
 
     def get_stats(self) -> dict:
         """Get overall message statistics."""
-        with self._get_connection() as conn:
+        with self._lock:
+            self._try_flush_locked()
+            conn = self._conn
             total = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
             sent = conn.execute("SELECT COUNT(*) FROM messages WHERE is_self = 1").fetchone()[0]
             received = total - sent
@@ -248,7 +461,9 @@ class MessageStore:
 
     def get_recent_activity(self, limit: int = 20) -> list[dict]:
         """Get recent bot activity (sent messages)."""
-        with self._get_connection() as conn:
+        with self._lock:
+            self._try_flush_locked()
+            conn = self._conn
             cursor = conn.execute(
                 """
                 SELECT chat_id, sender_name, text, timestamp, platform
@@ -282,10 +497,12 @@ class MessageStore:
 
         cutoff = time.time() - (days * 24 * 60 * 60)
 
-        with self._get_connection() as conn:
-            cursor = conn.execute("DELETE FROM messages WHERE timestamp < ?", (cutoff,))
-            conn.commit()
+        with self._lock:
+            self._try_flush_locked()
+            cursor = self._conn.execute("DELETE FROM messages WHERE timestamp < ?", (cutoff,))
             deleted = cursor.rowcount
+            if deleted:
+                self.generation += 1
 
         if deleted > 0:
             logger.info(f"Cleaned up {deleted} old messages")
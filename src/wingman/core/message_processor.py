@@ -1,24 +1,36 @@
 """Core message processing logic."""
 
 import logging
+import re
 import time
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import aclosing
 from typing import Any
 
 from wingman.config.personality import RoleBasedPromptBuilder, get_personality_prompt
-from wingman.config.registry import ContactProfile, ContactRegistry, GroupRegistry
+from wingman.config.registry import (
+    ContactProfile,
+    ContactRegistry,
+    ContactTone,
+    GroupRegistry,
+)
 
 from .llm.client import LLMClient
-from .memory.context import ContextBuilder
+from .memory.context import LANGUAGE_INSTRUCTIONS, ContextBuilder
 from .memory.models import Message, MessageStore
 from .policy import PolicyEvaluator
 from .safety import CooldownManager, QuietHoursChecker, RateLimiter, TriggerDetector
+from .transports.base import MessageEvent
 
 logger = logging.getLogger(__name__)
 
 # Type alias for message sender callback
 MessageSender = Callable[[str, str, str], Coroutine[Any, Any, bool]]
 
+# End of a sentence in a streamed reply: punctuation followed by whitespace
+# (so "3.5" or a trailing "..." still waiting on more text isn't split)
+_SENTENCE_END_RE = re.compile(r"[.?!…]+(?=\s)")
+
 
 class MessageProcessor:
     """
@@ -41,10 +53,12 @@ class MessageProcessor:
         quiet_start: int = 0,
         quiet_end: int = 6,
         context_window: int = 30,
+        stream_replies: bool = False,
     ):
         self.store = store
         self.llm = llm
         self.bot_name = bot_name
+        self.stream_replies = stream_replies
 
         # Config-driven registries
         self.contact_registry = contact_registry
@@ -63,6 +77,11 @@ class MessageProcessor:
         # Role-based prompt builder
         self.prompt_builder = RoleBasedPromptBuilder(bot_name)
 
+        # Build every tone x language system message before the first message
+        base_prompts = [self.prompt_builder.build_prompt(tone) for tone in ContactTone]
+        base_prompts.append(get_personality_prompt(bot_name))
+        self.llm.prewarm(base_prompts, LANGUAGE_INSTRUCTIONS.values())
+
         # Track our own user ID per platform
         self.self_ids: dict[str, str] = {}
 
@@ -82,7 +101,7 @@ class MessageProcessor:
         """Set the message sender callback."""
         self._send_message = sender
 
-    async def process_message(self, data: dict[str, Any]) -> None:
+    async def process_message(self, event: MessageEvent) -> None:
         """
         Process an incoming message through the full pipeline.
 
@@ -92,14 +111,14 @@ class MessageProcessor:
         3. Check for triggers
         4. Generate and send response
         """
-        chat_id = data.get("chatId", "")
-        sender_id = data.get("senderId", "")
-        sender_name = data.get("senderName")
-        text = data.get("text", "")
-        timestamp = data.get("timestamp", time.time())
-        is_group = data.get("isGroup", False)
-        is_self = data.get("isSelf", False)
-        platform = data.get("platform", "whatsapp")
+        chat_id = event.chat_id
+        sender_id = event.sender_id
+        sender_name = event.sender_name
+        text = event.text
+        timestamp = event.timestamp
+        is_group = event.is_group
+        is_self = event.is_self
+        platform = event.platform.value
 
         logger.info(
             f"Processing message: platform={platform}, chat={chat_id[:20]}..., "
@@ -118,7 +137,7 @@ class MessageProcessor:
             is_self=is_self,
             platform=platform,
         )
-        self.store.store_message(message)
+        await self.store.astore_message(message)
 
         # Don't process our own messages
         if is_self:
@@ -138,14 +157,18 @@ class MessageProcessor:
         if contact.cooldown_override is not None:
             self.cooldown.set_cooldown(chat_id, contact.cooldown_override)
 
-        # 4. Check safety rules
-        skip_reason = self._check_safety_rules(chat_id)
+        # 4. Check safety rules (loading the chat's history once, for both the
+        # double-reply check and the LLM context). One clock reading serves
+        # the rate limiter's check and its record below
+        now = time.monotonic()
+        last_is_self = await self.context_builder.alast_is_self(chat_id)
+        skip_reason = self._check_safety_rules(chat_id, last_is_self, now)
         if skip_reason:
             logger.info(f"Skipping message: {skip_reason}")
             return
 
         # 5. Evaluate policy rules
-        is_reply_to_bot = self._is_reply_to_bot(data, platform)
+        is_reply_to_bot = self._is_reply_to_bot(event, platform)
 
         context = self.policy_evaluator.create_context(
             chat_id=chat_id,
@@ -168,25 +191,31 @@ class MessageProcessor:
             f"Responding to message (policy: {decision.reason}, action: {decision.action.value})"
         )
 
-        # 6. Generate response with role-based prompt
-        response = await self._generate_response(chat_id, data, contact)
+        if self.stream_replies and self._send_message:
+            # 6-7. Stream the response to the transport sentence by sentence
+            response = await self._stream_response(platform, chat_id, event, contact)
+            if not response:
+                return
+        else:
+            # 6. Generate response with role-based prompt
+            response = await self._generate_response(chat_id, event, contact)
 
-        if not response:
-            logger.warning("Failed to generate response")
-            return
+            if not response:
+                logger.warning("Failed to generate response")
+                return
 
-        # 7. Send response via transport
-        if self._send_message:
-            success = await self._send_message(platform, chat_id, response)
-            if not success:
-                logger.error(f"Failed to send message via {platform}")
+            # 7. Send response via transport
+            if self._send_message:
+                success = await self._send_message(platform, chat_id, response)
+                if not success:
+                    logger.error(f"Failed to send message via {platform}")
+                    return
+            else:
+                logger.error("No message sender configured")
                 return
-        else:
-            logger.error("No message sender configured")
-            return
 
         # 8. Update safety trackers
-        self.rate_limiter.record_reply()
+        self.rate_limiter.record_reply(now)
         self.cooldown.record_reply(chat_id)
 
         # 9. Store our response
@@ -201,14 +230,22 @@ class MessageProcessor:
             is_self=True,
             platform=platform,
         )
-        self.store.store_message(bot_message)
+        await self.store.astore_message(bot_message)
 
         logger.info(f"Response sent via {platform}: {response[:50]}...")
 
-    def _check_safety_rules(self, chat_id: str) -> str | None:
+    def _check_safety_rules(
+        self, chat_id: str, last_is_self: bool | None = None, now: float | None = None
+    ) -> str | None:
         """
         Check all safety rules.
 
+        Args:
+            chat_id: Chat the message arrived in
+            last_is_self: Whether the chat's last message was ours, if already
+                known; otherwise the store is queried
+            now: Current time.monotonic() value, if the caller already has one
+
         Returns:
             Reason string if should skip, None if OK to proceed
         """
@@ -226,7 +263,7 @@ class MessageProcessor:
             return "quiet_hours"
 
         # Check rate limit
-        if not self.rate_limiter.can_reply():
+        if not self.rate_limiter.can_reply(now):
             return "rate_limit"
 
         # Check per-chat cooldown
@@ -234,14 +271,16 @@ class MessageProcessor:
             return "cooldown"
 
         # Check double-reply (don't reply if last message was ours)
-        if self.store.was_last_message_from_self(chat_id):
+        if last_is_self is None:
+            last_is_self = self.store.was_last_message_from_self(chat_id)
+        if last_is_self:
             return "double_reply"
 
         return None
 
-    def _is_reply_to_bot(self, data: dict[str, Any], platform: str = "whatsapp") -> bool:
+    def _is_reply_to_bot(self, event: MessageEvent, platform: str = "whatsapp") -> bool:
         """Check if the message is a reply to one of our messages."""
-        quoted = data.get("quotedMessage")
+        quoted = event.quoted_message
         if not quoted:
             return False
 
@@ -258,33 +297,105 @@ class MessageProcessor:
 
         return False
 
-    async def _generate_response(
-        self, chat_id: str, message_data: dict[str, Any], contact: ContactProfile | None = None
-    ) -> str | None:
-        """Generate an LLM response for the message."""
+    async def _prepare_request(
+        self, chat_id: str, event: MessageEvent, contact: ContactProfile | None
+    ) -> tuple[str, list[dict[str, str]], str, str | None]:
+        """Build the system prompt, context, language instruction and contact note."""
         # Build context
-        context = self.context_builder.build_context(chat_id, message_data)
+        context = await self.context_builder.abuild_context(chat_id, event.sender_name, event.text)
 
         # Detect language
-        text = message_data.get("text", "")
-        language = self.context_builder.detect_language(text)
+        language = self.context_builder.detect_language(event.text)
         language_instruction = self.context_builder.get_language_instruction(language)
 
         logger.debug(f"Detected language: {language}")
 
-        # Build role-based system prompt
+        # Build role-based system prompt; the contact's name goes in a
+        # separate note so the prompt itself is shared by all chats of a tone
+        contact_note = None
         if contact:
-            system_prompt = self.prompt_builder.build_prompt(
-                tone=contact.tone,
-                contact_name=contact.name if contact.name != "Unknown" else None,
-            )
+            system_prompt = self.prompt_builder.build_prompt(tone=contact.tone)
+            if contact.name != "Unknown":
+                contact_note = self.prompt_builder.build_contact_note(contact.name)
             logger.debug(f"Using tone: {contact.tone.value} for {contact.name}")
         else:
             system_prompt = get_personality_prompt(self.bot_name)
 
+        return system_prompt, context, language_instruction, contact_note
+
+    async def _generate_response(
+        self, chat_id: str, event: MessageEvent, contact: ContactProfile | None = None
+    ) -> str | None:
+        """Generate an LLM response for the message."""
+        system_prompt, context, language_instruction, contact_note = await self._prepare_request(
+            chat_id, event, contact
+        )
+
         # Generate response
         response = await self.llm.generate_response(
-            system_prompt=system_prompt, messages=context, language_instruction=language_instruction
+            system_prompt=system_prompt,
+            messages=context,
+            language_instruction=language_instruction,
+            contact_note=contact_note,
         )
 
         return response
+
+    async def _stream_response(
+        self,
+        platform: str,
+        chat_id: str,
+        event: MessageEvent,
+        contact: ContactProfile | None = None,
+    ) -> str | None:
+        """
+        Stream an LLM response, sending each sentence as soon as it is complete.
+
+        Returns:
+            The text that was sent, or None if nothing was sent
+        """
+        system_prompt, context, language_instruction, contact_note = await self._prepare_request(
+            chat_id, event, contact
+        )
+        deltas = self.llm.generate_response_stream(
+            system_prompt=system_prompt,
+            messages=context,
+            language_instruction=language_instruction,
+            contact_note=contact_note,
+        )
+
+        sent: list[str] = []
+        async with aclosing(_sentences(deltas)) as sentences:
+            async for sentence in sentences:
+                if not await self._send_message(platform, chat_id, sentence):
+                    logger.error(f"Failed to send message via {platform}")
+                    break
+                sent.append(sentence)
+            else:
+                if not sent:
+                    logger.warning("Failed to generate response")
+
+        if not sent:
+            return None
+        return " ".join(sent)
+
+
+async def _sentences(deltas: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Regroup streamed text deltas into whole sentences."""
+    buffer = ""
+    try:
+        async for delta in deltas:
+            buffer += delta
+            start = 0
+            for match in _SENTENCE_END_RE.finditer(buffer):
+                sentence = buffer[start : match.end()].strip()
+                if sentence:
+                    yield sentence
+                start = match.end()
+            buffer = buffer[start:]
+    finally:
+        await deltas.aclose()
+
+    tail = buffer.strip()
+    if tail:
+        yield tail
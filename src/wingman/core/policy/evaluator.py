@@ -1,11 +1,11 @@
 """Policy evaluation engine for determining response behavior."""
 
 import logging
-from dataclasses import dataclass
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import yaml
-
 from wingman.config.registry import (
     ContactProfile,
     ContactRole,
@@ -13,11 +13,13 @@ from wingman.config.registry import (
     GroupConfig,
     ReplyPolicy,
 )
+from wingman.config.yaml_writer import load_yaml
+from wingman.core.safety import TriggerDetector
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageContext:
     """Context information for a message being evaluated."""
 
@@ -50,7 +52,7 @@ class MessageContext:
         return self.group.category if self.group else None
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyDecision:
     """Result of policy evaluation."""
 
@@ -60,13 +62,61 @@ class PolicyDecision:
     action: ReplyPolicy = ReplyPolicy.SELECTIVE
 
 
-@dataclass
+# Condition key -> predicate source over the context `c`, with `{v}` naming the
+# configured value. Keys not listed here are ignored. Listed most-selective
+# first: predicates are emitted in this order so a non-matching rule (the
+# common case) fails on the first check; platform/is_dm/is_group are usually
+# the same for most messages in a deployment so they go last.
+_CONDITION_EXPRS = {
+    "role": "c.contact.role.value == {v}",
+    "group_category": "(c.group is not None and c.group.category.value == {v})",
+    "is_mentioned": "c.is_mentioned == {v}",
+    "is_reply_to_bot": "c.is_reply_to_bot == {v}",
+    "is_dm": "c.is_dm == {v}",
+    "is_group": "c.is_group == {v}",
+    "platform": "c.platform == {v}",
+}
+
+
+def compile_conditions(conditions: dict) -> Callable[[MessageContext], bool]:
+    """
+    Compile a rule's conditions into a single predicate over a MessageContext.
+
+    Only the keys present in `conditions` are checked, in selectivity order.
+    Configured values are bound as names in the predicate's namespace, never
+    formatted into source.
+
+    Args:
+        conditions: Rule conditions from the policy config
+
+    Returns:
+        Function returning True when the context matches every condition
+    """
+    namespace: dict = {}
+    clauses = []
+    for key, template in _CONDITION_EXPRS.items():
+        if key not in conditions:
+            continue
+        name = f"v{len(clauses)}"
+        namespace[name] = conditions[key]
+        clauses.append(template.format(v=name))
+
+    source = f"lambda c: {' and '.join(clauses) or 'True'}"
+    return eval(compile(source, "<policy rule>", "eval"), namespace)
+
+
+@dataclass(frozen=True, slots=True)
 class PolicyRule:
     """A single policy rule."""
 
     name: str
     conditions: dict
     action: ReplyPolicy
+    match: Callable[[MessageContext], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Compile once at load; evaluation is then a single predicate call
+        object.__setattr__(self, "match", compile_conditions(self.conditions))
 
     @classmethod
     def from_dict(cls, data: dict) -> "PolicyRule":
@@ -78,6 +128,19 @@ class PolicyRule:
         )
 
 
+# Whether to respond under each action, indexed by whether the bot was
+# addressed (mentioned or replied to)
+_DECISION_TABLE: dict[ReplyPolicy, tuple[bool, bool]] = {
+    ReplyPolicy.ALWAYS: (True, True),
+    ReplyPolicy.NEVER: (False, False),
+    ReplyPolicy.SELECTIVE: (False, True),
+}
+
+# Parsed policy files: abspath -> ((mtime_ns, size), rules, fallback action).
+# Rules are immutable, so evaluators built from an unchanged file share them.
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], tuple[PolicyRule, ...], ReplyPolicy]] = {}
+
+
 class PolicyEvaluator:
     """
     Evaluates policy rules against message context to determine
@@ -87,94 +150,65 @@ class PolicyEvaluator:
     def __init__(self, config_path: Path | None = None, bot_name: str = "Maximus"):
         self._rules: list[PolicyRule] = []
         self._fallback_action = ReplyPolicy.SELECTIVE
-        self._bot_name = bot_name.lower()
+        # Whether any rule condition reads is_mentioned
+        self._rules_use_mention = False
+        # One precompiled pattern matches both "name" and "@name"
+        self._mention_detector = TriggerDetector(bot_name)
 
         if config_path and config_path.exists():
             self._load_config(config_path)
 
     def _load_config(self, config_path: Path) -> None:
-        """Load policy configuration from YAML file."""
+        """Load policy configuration from YAML file, reusing the last parse if unchanged."""
         try:
-            with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
-
-            # Load rules
-            rules_data = config.get("rules", [])
-            for rule_data in rules_data:
-                try:
-                    rule = PolicyRule.from_dict(rule_data)
-                    self._rules.append(rule)
-                    logger.debug(f"Loaded policy rule: {rule.name}")
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Invalid policy rule: {e}")
+            st = os.stat(config_path)
+            key = os.path.abspath(config_path)
+            signature = (st.st_mtime_ns, st.st_size)
 
-            # Load fallback
-            fallback_data = config.get("fallback", {})
-            if fallback_data:
-                self._fallback_action = ReplyPolicy(fallback_data.get("action", "selective"))
+            cached = _CONFIG_CACHE.get(key)
+            if cached is None or cached[0] != signature:
+                rules, fallback = self._parse_config(config_path, st)
+                cached = (signature, rules, fallback)
+                _CONFIG_CACHE[key] = cached
+                logger.info(f"Loaded {len(rules)} policy rules from {config_path}")
 
-            logger.info(f"Loaded {len(self._rules)} policy rules from {config_path}")
+            _, rules, self._fallback_action = cached
+            self._rules = list(rules)
+            self._rules_use_mention = any("is_mentioned" in rule.conditions for rule in rules)
 
         except Exception as e:
             logger.error(f"Failed to load policies config: {e}")
 
-    def _check_mentioned(self, text: str) -> bool:
+    @staticmethod
+    def _parse_config(
+        config_path: Path, st: os.stat_result
+    ) -> tuple[tuple[PolicyRule, ...], ReplyPolicy]:
+        """Parse a policy YAML file into its rules and fallback action."""
+        config = load_yaml(config_path, st)
+
+        # Load rules
+        debug = logger.isEnabledFor(logging.DEBUG)
+        rules = []
+        for rule_data in config.get("rules", []):
+            try:
+                rule = PolicyRule.from_dict(rule_data)
+                rules.append(rule)
+                if debug:
+                    logger.debug(f"Loaded policy rule: {rule.name}")
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Invalid policy rule: {e}")
+
+        # Load fallback
+        fallback_action = ReplyPolicy.SELECTIVE
+        fallback_data = config.get("fallback", {})
+        if fallback_data:
+            fallback_action = ReplyPolicy(fallback_data.get("action", "selective"))
+
+        return tuple(rules), fallback_action
+
+    def check_mentioned(self, text: str) -> bool:
         """Check if the bot is mentioned in the text."""
-        if not text:
-            return False
-
-        text_lower = text.lower()
-
-        # Check for @mention or name mention
-        if f"@{self._bot_name}" in text_lower:
-            return True
-        if self._bot_name in text_lower:
-            return True
-
-        return False
-
-    def _matches_conditions(self, rule: PolicyRule, context: MessageContext) -> bool:
-        """Check if a rule's conditions match the message context."""
-        conditions = rule.conditions
-
-        # Check platform
-        if "platform" in conditions:
-            if conditions["platform"] != context.platform:
-                return False
-
-        # Check is_dm
-        if "is_dm" in conditions:
-            if conditions["is_dm"] != context.is_dm:
-                return False
-
-        # Check is_group
-        if "is_group" in conditions:
-            if conditions["is_group"] != context.is_group:
-                return False
-
-        # Check role
-        if "role" in conditions:
-            if conditions["role"] != context.role.value:
-                return False
-
-        # Check group_category
-        if "group_category" in conditions:
-            if context.group_category is None:
-                return False
-            if conditions["group_category"] != context.group_category.value:
-                return False
-
-        # Check is_reply_to_bot
-        if "is_reply_to_bot" in conditions:
-            if conditions["is_reply_to_bot"] != context.is_reply_to_bot:
-                return False
-
-        # Check is_mentioned
-        if "is_mentioned" in conditions:
-            if conditions["is_mentioned"] != context.is_mentioned:
-                return False
-
-        return True
+        return self._mention_detector.has_trigger(text)
 
     def evaluate(self, context: MessageContext) -> PolicyDecision:
         """
@@ -186,26 +220,35 @@ class PolicyEvaluator:
         Returns:
             PolicyDecision with should_respond and reason
         """
-        # Check if bot is mentioned (for selective policies)
-        is_mentioned = self._check_mentioned(context.text)
-        # Update context with mention status
-        context.is_mentioned = is_mentioned
-
-        logger.debug(
-            f"Evaluating policy: platform={context.platform}, is_dm={context.is_dm}, "
-            f"role={context.role.value}, "
-            f"group_category={context.group_category.value if context.group_category else 'N/A'}, "
-            f"is_mentioned={is_mentioned}"
-        )
+        # Skip building log messages unless debug logging is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Mention detection scans the whole text, so only run it up front when
+        # a rule condition reads it; otherwise only a SELECTIVE decision for a
+        # message that isn't a reply needs it (see _should_respond_for_action)
+        mentioned: bool | None = None
+        if not context.text:
+            mentioned = False
+        elif self._rules_use_mention or debug:
+            mentioned = self.check_mentioned(context.text)
+        if mentioned is not None:
+            context.is_mentioned = mentioned
+
+        if debug:
+            logger.debug(
+                f"Evaluating policy: platform={context.platform}, is_dm={context.is_dm}, "
+                f"role={context.role.value}, "
+                f"group_category={context.group_category.value if context.group_category else 'N/A'}, "
+                f"is_mentioned={mentioned}"
+            )
 
         # Evaluate rules in order
         for rule in self._rules:
-            if self._matches_conditions(rule, context):
-                logger.debug(f"Rule matched: {rule.name} -> {rule.action.value}")
+            if rule.match(context):
+                if debug:
+                    logger.debug(f"Rule matched: {rule.name} -> {rule.action.value}")
 
-                should_respond = self._should_respond_for_action(
-                    rule.action, is_mentioned, context.is_reply_to_bot
-                )
+                should_respond = self._should_respond_for_action(rule.action, context, mentioned)
 
                 return PolicyDecision(
                     should_respond=should_respond,
@@ -215,10 +258,9 @@ class PolicyEvaluator:
                 )
 
         # No rule matched, use fallback
-        logger.debug(f"No rule matched, using fallback: {self._fallback_action.value}")
-        should_respond = self._should_respond_for_action(
-            self._fallback_action, is_mentioned, context.is_reply_to_bot
-        )
+        if debug:
+            logger.debug(f"No rule matched, using fallback: {self._fallback_action.value}")
+        should_respond = self._should_respond_for_action(self._fallback_action, context, mentioned)
 
         return PolicyDecision(
             should_respond=should_respond,
@@ -228,17 +270,26 @@ class PolicyEvaluator:
         )
 
     def _should_respond_for_action(
-        self, action: ReplyPolicy, is_mentioned: bool, is_reply_to_bot: bool
+        self, action: ReplyPolicy, context: MessageContext, mentioned: bool | None
     ) -> bool:
-        """Determine if should respond based on action type."""
-        if action == ReplyPolicy.ALWAYS:
-            return True
-        elif action == ReplyPolicy.NEVER:
-            return False
-        elif action == ReplyPolicy.SELECTIVE:
-            # Respond if mentioned or replying to bot
-            return is_mentioned or is_reply_to_bot
-        return False
+        """
+        Determine if should respond based on action type and whether the bot was addressed.
+
+        Args:
+            action: The matched rule's (or fallback) action
+            context: The message context
+            mentioned: Mention status if already checked, else None to check on demand
+        """
+        responds = _DECISION_TABLE[action]
+        # A reply addresses the bot; ALWAYS/NEVER don't depend on being addressed
+        if context.is_reply_to_bot:
+            return responds[True]
+        if responds[False] == responds[True]:
+            return responds[False]
+
+        if mentioned is None:
+            mentioned = context.is_mentioned = self.check_mentioned(context.text)
+        return responds[mentioned]
 
     def create_context(
         self,
@@ -8,6 +8,9 @@ from .ipc_handler import IPCCommand, IPCHandler
 
 logger = logging.getLogger(__name__)
 
+# Characters that mark a line of the terminal QR code printed during auth
+_QR_CHARS = frozenset("▄█▀=")
+
 
 class NodeProcessManager:
     """Manages the Node.js listener subprocess."""
@@ -76,10 +79,10 @@ class NodeProcessManager:
                 log_line = line.decode("utf-8").strip()
                 if log_line:
                     # Check if it's a QR code line (contains block characters)
-                    if any(c in log_line for c in ["▄", "█", "▀", "="]):
+                    if not _QR_CHARS.isdisjoint(log_line):
                         # Print QR directly to stderr for user to see
                         print(log_line, flush=True)
-                    else:
+                    elif logger.isEnabledFor(logging.DEBUG):
                         logger.debug(f"[Node] {log_line}")
 
             except asyncio.CancelledError:
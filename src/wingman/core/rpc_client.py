@@ -6,7 +6,43 @@ import uuid
 from pathlib import Path
 from typing import Any
 
-DELIMITER = b"\0"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Each message is a 4-byte big-endian payload length followed by JSON
+HEADER_SIZE = 4
+# Responses up to this size are read into one buffer reused across calls
+RECV_BUFFER_SIZE = 65536
+# Calls that are safe to repeat if the daemon dropped the connection after
+# possibly receiving (and acting on) the request
+IDEMPOTENT_METHODS = frozenset({"ping", "get_status", "list_active_chats"})
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an RPC message to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: memoryview) -> Any:
+    """Parse an RPC message from a view of JSON bytes (raises json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.tobytes())
+
+
+def _recv_exactly(sock: socket.socket, view: memoryview) -> None:
+    """Fill `view` completely with bytes read from a socket."""
+    pos = 0
+    size = len(view)
+    while pos < size:
+        received = sock.recv_into(view[pos:])
+        if not received:
+            raise ConnectionResetError("Connection closed by daemon")
+        pos += received
 
 
 class RPCError(Exception):
@@ -15,22 +51,85 @@ class RPCError(Exception):
     pass
 
 
+class _RequestNotSent(ConnectionError):
+    """Writing the request failed, so the daemon never received it."""
+
+
 class RPCClient:
     """
     Synchronous RPC client for the console REPL.
 
-    Connects to the daemon's Unix domain socket.
+    Connects to the daemon's Unix domain socket and keeps the connection
+    open across calls, reconnecting if the daemon dropped it.
     """
 
     def __init__(self, socket_path: Path, timeout: float = 5.0) -> None:
         self._socket_path = socket_path
         self._timeout = timeout
+        self._sock: socket.socket | None = None
+        self._recv_view = memoryview(bytearray(RECV_BUFFER_SIZE))
 
     @property
     def available(self) -> bool:
         """Check if the daemon socket exists."""
         return self._socket_path.exists()
 
+    def __enter__(self) -> "RPCClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection to the daemon, if open."""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+    def _connect(self) -> socket.socket:
+        """Get the open connection, connecting first if needed."""
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self._timeout)
+            try:
+                sock.connect(str(self._socket_path))
+            except BaseException:
+                sock.close()
+                raise
+            self._sock = sock
+        return self._sock
+
+    def _exchange(self, payload: bytes) -> memoryview:
+        """
+        Send one length-prefixed request and read back one response.
+
+        The returned view is only valid until the next exchange.
+        """
+        sock = self._connect()
+        try:
+            try:
+                sock.sendall(len(payload).to_bytes(HEADER_SIZE, "big") + payload)
+            except (BrokenPipeError, ConnectionResetError) as e:
+                # The peer was already gone: no complete request reached it
+                raise _RequestNotSent(str(e)) from e
+
+            header = self._recv_view[:HEADER_SIZE]
+            _recv_exactly(sock, header)
+            size = int.from_bytes(header, "big")
+
+            if size <= len(self._recv_view):
+                response = self._recv_view[:size]
+            else:
+                response = memoryview(bytearray(size))
+            _recv_exactly(sock, response)
+            return response
+        except BaseException:
+            # A failed exchange leaves the stream in an unknown state
+            self.close()
+            raise
+
     def call(self, method: str, params: dict | None = None) -> Any:
         """
         Make an RPC call to the daemon.
@@ -54,26 +153,21 @@ class RPCClient:
             "params": params or {},
         }
 
+        payload = _dumps(request)
         try:
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.settimeout(self._timeout)
-            sock.connect(str(self._socket_path))
-
-            # Send request
-            sock.sendall(json.dumps(request).encode("utf-8") + DELIMITER)
-
-            # Receive response
-            buffer = b""
-            while DELIMITER not in buffer:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    raise RPCError("Connection closed by daemon")
-                buffer += chunk
-
-            response_data = buffer.split(DELIMITER, 1)[0]
-            response = json.loads(response_data.decode("utf-8"))
-
-            sock.close()
+            reused = self._sock is not None
+            try:
+                response_data = self._exchange(payload)
+            except (_RequestNotSent, BrokenPipeError, ConnectionResetError) as e:
+                # The daemon restarted or dropped the idle connection; retry
+                # once, unless the request may already have been acted on
+                # (e.g. a send_message must not go out twice)
+                not_sent = isinstance(e, _RequestNotSent)
+                if not reused or not (not_sent or method in IDEMPOTENT_METHODS):
+                    raise
+                response_data = self._exchange(payload)
+
+            response = _loads(response_data)
 
             if response.get("error"):
                 raise RPCError(response["error"])
@@ -84,6 +178,8 @@ class RPCClient:
             raise RPCError("Daemon did not respond in time")
         except ConnectionRefusedError:
             raise RPCError("Daemon refused connection (may have crashed)")
+        except (_RequestNotSent, BrokenPipeError, ConnectionResetError):
+            raise RPCError("Connection closed by daemon")
         except FileNotFoundError:
             raise RPCError("Daemon is not running (socket not found)")
         except json.JSONDecodeError:
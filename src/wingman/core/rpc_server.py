@@ -10,13 +10,34 @@ import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from .agent import MultiTransportAgent
 
 logger = logging.getLogger(__name__)
 
-# NULL-delimited JSON protocol (matches existing IPC convention)
-DELIMITER = b"\0"
+# Each message is a 4-byte big-endian payload length followed by JSON
+HEADER_SIZE = 4
+# Upper bound on a request payload, so a bad header can't allocate without limit
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an RPC message to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse an RPC message from JSON bytes (raises json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class RPCServer:
@@ -30,7 +51,15 @@ class RPCServer:
         self._socket_path = socket_path
         self._agent = agent
         self._server: asyncio.AbstractServer | None = None
-        self._start_time = time.time()
+        # Open client connections; consoles keep theirs open between calls
+        self._clients: set[asyncio.StreamWriter] = set()
+        self._start_time = time.monotonic()
+        # RPC method name -> bound _rpc_* handler
+        self._dispatch = {
+            name.removeprefix("_rpc_"): getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_rpc_")
+        }
 
     async def start(self) -> None:
         """Start the RPC server."""
@@ -53,6 +82,9 @@ class RPCServer:
         """Stop the RPC server."""
         if self._server:
             self._server.close()
+            # wait_closed() waits for open connections on newer Pythons
+            for writer in list(self._clients):
+                writer.close()
             await self._server.wait_closed()
             logger.info("RPC server stopped")
 
@@ -63,35 +95,39 @@ class RPCServer:
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
         """Handle a client connection."""
+        self._clients.add(writer)
         try:
-            buffer = b""
             while True:
-                data = await reader.read(4096)
-                if not data:
+                try:
+                    header = await reader.readexactly(HEADER_SIZE)
+                except asyncio.IncompleteReadError:
+                    break
+
+                size = int.from_bytes(header, "big")
+                if size > MAX_FRAME_SIZE:
+                    logger.warning(f"RPC request too large ({size} bytes), disconnecting")
                     break
 
-                buffer += data
-                while DELIMITER in buffer:
-                    message, buffer = buffer.split(DELIMITER, 1)
-                    if message:
-                        response = await self._process_request(message.decode("utf-8"))
-                        writer.write(json.dumps(response).encode("utf-8") + DELIMITER)
-                        await writer.drain()
-        except (ConnectionResetError, BrokenPipeError):
+                message = await reader.readexactly(size)
+                response = _dumps(await self._process_request(message))
+                writer.writelines((len(response).to_bytes(HEADER_SIZE, "big"), response))
+                await writer.drain()
+        except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError):
             pass
         except Exception as e:
             logger.error(f"RPC client error: {e}")
         finally:
+            self._clients.discard(writer)
             writer.close()
             try:
                 await writer.wait_closed()
             except Exception:
                 pass
 
-    async def _process_request(self, raw: str) -> dict[str, Any]:
+    async def _process_request(self, raw: bytes) -> dict[str, Any]:
         """Process a single RPC request and return the response."""
         try:
-            request = json.loads(raw)
+            request = _loads(raw)
         except json.JSONDecodeError:
             return {"id": None, "result": None, "error": "Invalid JSON"}
 
@@ -100,7 +136,7 @@ class RPCServer:
         params = request.get("params", {})
 
         try:
-            handler = getattr(self, f"_rpc_{method}", None)
+            handler = self._dispatch.get(method)
             if handler is None:
                 return {"id": req_id, "result": None, "error": f"Unknown method: {method}"}
             result = await handler(params)
@@ -112,7 +148,7 @@ class RPCServer:
     # ========== RPC Methods ==========
 
     async def _rpc_ping(self, params: dict) -> dict:
-        return {"pong": True, "uptime": time.time() - self._start_time}
+        return {"pong": True, "uptime": time.monotonic() - self._start_time}
 
     async def _rpc_get_status(self, params: dict) -> dict:
         transports = {}
@@ -123,7 +159,7 @@ class RPCServer:
             "running": True,
             "bot_name": self._agent.settings.bot_name,
             "model": self._agent.settings.openai_model,
-            "uptime": time.time() - self._start_time,
+            "uptime": time.monotonic() - self._start_time,
             "transports": transports,
             "paused": getattr(self._agent.processor, "paused", False),
             "pause_until": getattr(self._agent.processor, "pause_until", None),
@@ -2,57 +2,65 @@
 
 import logging
 import time
-from collections import deque
 
 logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
     """
-    Implements a sliding window rate limiter.
-    Tracks replies in a 1-hour window and enforces max replies limit.
+    Implements a token-bucket rate limiter.
+    The bucket holds up to max_replies tokens and refills at
+    max_replies per hour, so bursts are capped and the hourly
+    rate is enforced without tracking individual replies.
     """
 
     def __init__(self, max_replies_per_hour: int = 30):
         self.max_replies = max_replies_per_hour
         self.window_seconds = 3600  # 1 hour
-        self._timestamps: deque[float] = deque()
+        self._rate = max_replies_per_hour / self.window_seconds  # Tokens per second
+        self._tokens = float(max_replies_per_hour)
+        self._last_refill = time.monotonic()
 
-    def _cleanup_old_entries(self) -> None:
-        """Remove timestamps older than the window."""
-        cutoff = time.time() - self.window_seconds
-        while self._timestamps and self._timestamps[0] < cutoff:
-            self._timestamps.popleft()
+    def _refill(self, now: float | None) -> None:
+        """Add the tokens earned since the last refill."""
+        if now is None:
+            now = time.monotonic()
+        elif now <= self._last_refill:
+            # A caller's earlier reading; another call already refilled past it
+            return
+        self._tokens = min(
+            float(self.max_replies), self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+    def can_reply(self, now: float | None = None) -> bool:
+        """Check if a reply is allowed within rate limits.
 
-    def can_reply(self) -> bool:
-        """Check if a reply is allowed within rate limits."""
-        self._cleanup_old_entries()
-        allowed = len(self._timestamps) < self.max_replies
+        Args:
+            now: Current time.monotonic() value, if the caller already has one
+        """
+        self._refill(now)
+        allowed = self._tokens >= 1
 
         if not allowed:
-            logger.warning(
-                f"Rate limit reached: {len(self._timestamps)}/{self.max_replies} "
-                f"replies in the last hour"
-            )
+            logger.warning(f"Rate limit reached: {self.max_replies} replies per hour")
 
         return allowed
 
-    def record_reply(self) -> None:
+    def record_reply(self, now: float | None = None) -> None:
         """Record that a reply was sent."""
-        self._cleanup_old_entries()
-        self._timestamps.append(time.time())
-        logger.debug(
-            f"Reply recorded: {len(self._timestamps)}/{self.max_replies} " f"in current window"
-        )
+        self._refill(now)
+        self._tokens -= 1
+        logger.debug(f"Reply recorded: {max(0, int(self._tokens))}/{self.max_replies} remaining")
 
-    def get_remaining(self) -> int:
+    def get_remaining(self, now: float | None = None) -> int:
         """Get number of remaining allowed replies."""
-        self._cleanup_old_entries()
-        return max(0, self.max_replies - len(self._timestamps))
+        self._refill(now)
+        return max(0, int(self._tokens))
 
-    def get_reset_time(self) -> float:
-        """Get seconds until oldest reply expires from window."""
-        if not self._timestamps:
+    def get_reset_time(self, now: float | None = None) -> float:
+        """Get seconds until the next reply is allowed."""
+        self._refill(now)
+        if self._tokens >= 1 or not self._rate:
             return 0
-        oldest = self._timestamps[0]
-        return max(0, (oldest + self.window_seconds) - time.time())
+        return (1 - self._tokens) / self._rate
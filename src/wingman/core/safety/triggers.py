@@ -24,26 +24,60 @@ class TriggerDetector:
             for trigger in additional_triggers:
                 self.triggers.add(trigger.lower())
 
-        # Compile regex patterns for efficient matching
-        self._compile_patterns()
+        # Escaped form of each trigger, kept in step with add/remove so
+        # recompiling never re-escapes the whole set
+        self._escaped: dict[str, str] = {t: re.escape(t) for t in self.triggers}
+
+        # Regex patterns are compiled on first use after any change, so
+        # adding many triggers in a row compiles only once
+        self._trigger_pattern: re.Pattern | None = None
+        self._mention_prefixes: tuple[str, ...] = ()
 
     def _compile_patterns(self) -> None:
         """Compile regex patterns for trigger matching."""
-        # Pattern for @mentions (handles WhatsApp mention format)
-        escaped_triggers = [re.escape(t) for t in self.triggers]
-        pattern = r"\b(" + "|".join(escaped_triggers) + r")\b"
-        self._trigger_pattern = re.compile(pattern, re.IGNORECASE)
+        # Pattern for @mentions (handles WhatsApp mention format). Triggers are
+        # lowercase and text is lowercased before matching, so no IGNORECASE.
+        # Longest first, so the longest of overlapping triggers is reported
+        escaped_triggers = sorted(
+            (escaped for t, escaped in self._escaped.items() if not self._is_redundant(t)),
+            key=len,
+            reverse=True,
+        )
+        pattern = r"\b(?:" + "|".join(escaped_triggers) + r")\b"
+        self._trigger_pattern = re.compile(pattern)
+        # Prefixes that make a message a direct address (trigger or @trigger)
+        self._mention_prefixes = tuple(self.triggers) + tuple(f"@{t}" for t in self.triggers)
+
+    def _is_redundant(self, trigger: str) -> bool:
+        """
+        Check whether an "@name" trigger can only match where "name" does.
+
+        The word boundary before a name starting with a word character sits
+        between "@" and the name, so the bare trigger already matches there.
+        """
+        name = trigger[1:]
+        return (
+            trigger.startswith("@")
+            and name in self.triggers
+            and (name[:1].isalnum() or name[:1] == "_")
+        )
 
     def add_trigger(self, trigger: str) -> None:
         """Add a new trigger word."""
-        self.triggers.add(trigger.lower())
-        self._compile_patterns()
+        trigger_lower = trigger.lower()
+        if trigger_lower not in self.triggers:
+            self.triggers.add(trigger_lower)
+            self._escaped[trigger_lower] = re.escape(trigger_lower)
+            self._trigger_pattern = None
         logger.debug(f"Added trigger: {trigger}")
 
     def remove_trigger(self, trigger: str) -> None:
         """Remove a trigger word."""
-        self.triggers.discard(trigger.lower())
-        self._compile_patterns()
+        trigger_lower = trigger.lower()
+        if trigger_lower in self.triggers:
+            self.triggers.discard(trigger_lower)
+            del self._escaped[trigger_lower]
+            self._trigger_pattern = None
         logger.debug(f"Removed trigger: {trigger}")
 
     def has_trigger(self, text: str) -> bool:
@@ -58,8 +92,10 @@ class TriggerDetector:
         """
         if not text:
             return False
+        if self._trigger_pattern is None:
+            self._compile_patterns()
 
-        match = self._trigger_pattern.search(text)
+        match = self._trigger_pattern.search(text.lower())
         if match:
             logger.debug(f"Trigger found: '{match.group()}'")
             return True
@@ -72,17 +108,9 @@ class TriggerDetector:
         """
         if not text:
             return False
-
-        text_lower = text.lower().strip()
-
-        for trigger in self.triggers:
-            if text_lower.startswith(trigger):
-                return True
-            # Check for @mention at start
-            if text_lower.startswith(f"@{trigger}"):
-                return True
-
-        return False
+        if self._trigger_pattern is None:
+            self._compile_patterns()
+        return text.lower().lstrip().startswith(self._mention_prefixes)
 
     def should_respond(
         self, text: str, is_group: bool, is_dm: bool = False, is_reply_to_bot: bool = False
@@ -3,7 +3,7 @@
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Coroutine
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -17,7 +17,7 @@ class Platform(Enum):
     IMESSAGE = "imessage"
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageEvent:
     """Unified message structure across all platforms."""
 
@@ -37,8 +37,8 @@ class MessageEvent:
     is_group: bool = False
     is_self: bool = False
 
-    # Platform-specific data
-    raw_data: dict = field(default_factory=dict)
+    # Platform-specific data; None unless the transport sets KEEP_RAW_DATA
+    raw_data: dict | None = None
 
     # Reply context (if replying to a message)
     quoted_message: dict | None = None
@@ -51,6 +51,11 @@ MessageHandler = Callable[[MessageEvent], Coroutine[Any, Any, None]]
 class BaseTransport(ABC):
     """Abstract base class for message transports."""
 
+    # Attach the platform's raw message to each MessageEvent.raw_data. Off by
+    # default: nothing in the pipeline reads it, and skipping it saves an
+    # allocation (or keeps a large IPC dict alive) per message
+    KEEP_RAW_DATA = False
+
     def __init__(self):
         self._message_handler: MessageHandler | None = None
         self._running = False
@@ -8,11 +8,17 @@ from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from pathlib import Path
 
+from wingman.config.watcher import ConfigWatcher
+
 logger = logging.getLogger(__name__)
 
 # Apple epoch: seconds between Unix epoch (1970) and Apple epoch (2001)
 APPLE_EPOCH_OFFSET = 978307200
 
+# With file change notifications, still re-check this often in case one was
+# missed (e.g. the WAL file was recreated between notifications)
+NOTIFY_RECHECK_INTERVAL = 60.0
+
 
 @dataclass
 class IMessageData:
@@ -32,6 +38,10 @@ class IMessageDBListener:
     """
     Polls the iMessage chat.db database for new messages.
 
+    When watchdog is installed, the database is re-queried when chat.db or
+    its WAL file changes instead of every `poll_interval` seconds, so an
+    idle listener doesn't wake up.
+
     Note: Requires Full Disk Access permission for the Python process.
     """
 
@@ -48,6 +58,10 @@ class IMessageDBListener:
         self._last_rowid = 0
         self._running = False
         self._message_callback: Callable[[IMessageData], Coroutine] | None = None
+        # Set (thread-safely) when the database files change; None when polling
+        self._changed: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._watched_paths: list[Path] = []
 
     def set_message_callback(self, callback: Callable[[IMessageData], Coroutine]) -> None:
         """Set the callback for new messages."""
@@ -66,13 +80,60 @@ class IMessageDBListener:
         logger.info(f"iMessage listener starting from ROWID {self._last_rowid}")
 
         self._running = True
-        await self._poll_loop()
+        if ConfigWatcher.notifications_available():
+            self._watch_files()
+        try:
+            await self._poll_loop()
+        finally:
+            self._unwatch_files()
 
     async def stop(self) -> None:
         """Stop polling."""
         self._running = False
+        if self._changed is not None:
+            self._changed.set()
         logger.info("iMessage listener stopped")
 
+    def _watch_files(self) -> None:
+        """Subscribe to changes of chat.db and its WAL file."""
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        # New messages land in the WAL first; checkpoints rewrite chat.db
+        self._watched_paths = [self._db_path, self._db_path.with_name(self._db_path.name + "-wal")]
+        for path in self._watched_paths:
+            ConfigWatcher.register(path, self._on_file_changed)
+        logger.debug("iMessage listener waiting for chat.db change notifications")
+
+    def _unwatch_files(self) -> None:
+        """Drop the change subscriptions made by _watch_files."""
+        for path in self._watched_paths:
+            ConfigWatcher.unregister(path, self._on_file_changed)
+        self._watched_paths = []
+        self._changed = None
+
+    def _on_file_changed(self) -> None:
+        """Watcher-thread callback: wake the poll loop."""
+        changed = self._changed
+        if changed is not None:
+            try:
+                self._loop.call_soon_threadsafe(changed.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    async def _wait_for_change(self) -> None:
+        """Sleep until the database may have new messages."""
+        changed = self._changed
+        if changed is None:
+            await asyncio.sleep(self._poll_interval)
+            return
+
+        try:
+            await asyncio.wait_for(changed.wait(), timeout=NOTIFY_RECHECK_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        # Cleared before querying, so a change during the query wakes us again
+        changed.clear()
+
     async def _poll_loop(self) -> None:
         """Main polling loop."""
         while self._running:
@@ -90,7 +151,7 @@ class IMessageDBListener:
             except Exception as e:
                 logger.error(f"Error polling iMessage database: {e}")
 
-            await asyncio.sleep(self._poll_interval)
+            await self._wait_for_change()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a read-only connection to chat.db."""
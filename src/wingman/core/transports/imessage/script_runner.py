@@ -0,0 +1,163 @@
+"""Long-lived osascript process for running AppleScript without a spawn per script."""
+
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# How long a freshly started runner gets to report that it is ready
+STARTUP_TIMEOUT = 10.0
+
+# JavaScript for Automation loop run by one osascript process. It reads one
+# JSON-encoded AppleScript source per line from stdin, compiles and runs it
+# with NSAppleScript, and answers each with one JSON line
+# {"ok": bool, "output": str}. Requests are pure ASCII (Python escapes
+# everything else), so decoding partial reads can't split a character.
+_RUNNER_JS = r"""
+ObjC.import("Foundation");
+var input = $.NSFileHandle.fileHandleWithStandardInput;
+var output = $.NSFileHandle.fileHandleWithStandardOutput;
+function reply(obj) {
+    output.writeData($(JSON.stringify(obj) + "\n").dataUsingEncoding($.NSUTF8StringEncoding));
+}
+reply({ready: true});
+var pending = "";
+for (;;) {
+    var data = input.availableData;
+    if (data.length === 0) break;
+    pending += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    var newline;
+    while ((newline = pending.indexOf("\n")) !== -1) {
+        var source = JSON.parse(pending.slice(0, newline));
+        pending = pending.slice(newline + 1);
+        var error = Ref();
+        var result = $.NSAppleScript.alloc.initWithSource(source).executeAndReturnError(error);
+        if (result.isNil()) {
+            var info = ObjC.deepUnwrap(error[0]) || {};
+            reply({ok: false, output: String(info.NSAppleScriptErrorMessage || "AppleScript error")});
+        } else {
+            reply({ok: true, output: ObjC.unwrap(result.stringValue) || ""});
+        }
+    }
+}
+"""
+
+
+class RunnerUnavailable(Exception):
+    """The runner could not be started; nothing was sent to it."""
+
+
+class AppleScriptRunner:
+    """
+    One osascript process that runs AppleScript sources sent over stdin.
+
+    Saves the fork/exec and osascript startup that a fresh `osascript -e`
+    pays for every script. (`osascript -i` is not used because it compiles
+    its input one line at a time, which breaks multi-line tell blocks.)
+    Scripts run one at a time; a runner that exits or times out is
+    restarted on the next call.
+    """
+
+    def __init__(self):
+        self._process: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        """Start the runner if it isn't running (lock held)."""
+        if self._process is not None and self._process.returncode is None:
+            return self._process
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "osascript",
+                "-l",
+                "JavaScript",
+                "-e",
+                _RUNNER_JS,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise RunnerUnavailable(f"Cannot start osascript: {e}") from e
+
+        try:
+            ready = await asyncio.wait_for(process.stdout.readline(), timeout=STARTUP_TIMEOUT)
+            if not json.loads(ready).get("ready"):
+                raise ValueError(f"unexpected greeting {ready!r}")
+        except (asyncio.TimeoutError, ValueError, AttributeError) as e:
+            await self._kill(process)
+            raise RunnerUnavailable(f"osascript runner did not start: {e}") from e
+
+        logger.debug(f"Started osascript runner (PID: {process.pid})")
+        self._process = process
+        return process
+
+    async def run(self, script: str, timeout: float) -> str | None:
+        """
+        Run one AppleScript source.
+
+        Args:
+            script: AppleScript source
+            timeout: Seconds to wait for the script to finish
+
+        Returns:
+            The script's result as text, or None if it failed
+
+        Raises:
+            RunnerUnavailable: If the runner couldn't be started (the script
+                was not run, so the caller may run it another way)
+        """
+        async with self._lock:
+            process = await self._ensure_started()
+            try:
+                process.stdin.write(json.dumps(script).encode("ascii") + b"\n")
+                await process.stdin.drain()
+                line = await asyncio.wait_for(process.stdout.readline(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # The script may still be running; don't reuse the runner
+                await self._kill(process)
+                logger.error("AppleScript timed out")
+                return None
+            except (BrokenPipeError, ConnectionResetError) as e:
+                await self._kill(process)
+                logger.error(f"osascript runner failed: {e}")
+                return None
+
+            if not line:
+                await self._kill(process)
+                logger.error("osascript runner exited")
+                return None
+
+            reply = json.loads(line)
+            if not reply.get("ok"):
+                logger.error(f"AppleScript error: {reply.get('output', '')}")
+                return None
+            return reply.get("output", "")
+
+    async def _kill(self, process: asyncio.subprocess.Process) -> None:
+        """Kill a runner process and reap it."""
+        if process is self._process:
+            self._process = None
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
+
+    async def close(self) -> None:
+        """Stop the runner by closing its stdin."""
+        process = self._process
+        if process is None:
+            return
+        self._process = None
+
+        if process.returncode is None:
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
@@ -2,19 +2,133 @@
 
 import asyncio
 import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
+
+import psutil
+
+from .script_runner import AppleScriptRunner, RunnerUnavailable
 
 logger = logging.getLogger(__name__)
 
+# Sends queued while another send is in flight are coalesced into one
+# osascript run. Once a burst is noticed, wait this long for the rest of it
+BATCH_WINDOW = 0.02
+MAX_BATCH_SIZE = 16
+# osascript timeout, per message in a run
+SEND_TIMEOUT = 10.0
+
+# Characters that need a backslash escape inside an AppleScript string literal
+_APPLESCRIPT_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+_NEEDS_ESCAPE_RE = re.compile(r'[\\"\n\r\t]')
+
+
+def _escape(text: str) -> str:
+    """
+    Escape special characters for use in AppleScript strings.
+
+    AppleScript uses backslash for escaping within double-quoted strings.
+    """
+    # Most text has nothing to escape; return it without copying
+    if not _NEEDS_ESCAPE_RE.search(text):
+        return text
+    return text.translate(_APPLESCRIPT_ESCAPES)
+
+
+# Recipients and chat ids come from a small, repetitive set, so their escaped
+# forms are memoized. Message text is unbounded and always escaped afresh
+_escape_cached = lru_cache(maxsize=512)(_escape)
+
+# Script templates, built once. Substituted values must already be escaped
+_SCRIPT_INDIVIDUAL = Template(
+    'tell application "Messages"\n'
+    "set targetService to 1st account whose service type = iMessage\n"
+    'set targetBuddy to participant "$recipient" of targetService\n'
+    'send "$text" to targetBuddy\n'
+    "end tell"
+)
+_SCRIPT_GROUP = Template(
+    'tell application "Messages"\n'
+    'set targetChat to a reference to chat id "$chat_id"\n'
+    'send "$text" to targetChat\n'
+    "end tell"
+)
+# Slower lookup through every chat, for groups whose id reference fails
+_SCRIPT_GROUP_FALLBACK = Template(
+    'tell application "Messages"\n'
+    "set allChats to every chat\n"
+    "repeat with aChat in allChats\n"
+    'if id of aChat contains "$chat_id" then\n'
+    'send "$text" to aChat\n'
+    "return\n"
+    "end if\n"
+    "end repeat\n"
+    "end tell"
+)
+# One isolated send inside a batch script; a failure doesn't abort the rest
+_BATCH_ITEM = Template(
+    "try\n"
+    "set targetChat to $target\n"
+    'send "$text" to targetChat\n'
+    'set results to results & "1"\n'
+    "on error\n"
+    'set results to results & "0"\n'
+    "end try"
+)
+
+
+@dataclass
+class _PendingSend:
+    """A queued send waiting for the dispatch loop."""
+
+    target: str  # Recipient for direct messages, chat id for groups
+    text: str
+    is_group: bool
+    future: asyncio.Future
+
 
 class IMessageSender:
     """
     Sends iMessages using AppleScript via osascript.
 
-    Supports both direct messages and group chats.
+    Supports both direct messages and group chats. Once started, sends
+    that pile up while osascript is busy go out together in one run.
     """
 
     def __init__(self):
         self._last_send_time = 0.0
+        self._queue: asyncio.Queue[_PendingSend] | None = None
+        self._dispatch_task: asyncio.Task | None = None
+        # Runs scripts in one long-lived osascript; None once it proved unusable
+        self._runner: AppleScriptRunner | None = AppleScriptRunner()
+
+    def start(self) -> None:
+        """Start the background loop that batches queued sends."""
+        if self._dispatch_task is None:
+            self._queue = asyncio.Queue()
+            self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+
+    async def close(self) -> None:
+        """Stop the dispatch loop, failing any sends still queued, and the osascript runner."""
+        if self._dispatch_task is not None:
+            self._dispatch_task.cancel()
+            try:
+                await self._dispatch_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatch_task = None
+
+            while not self._queue.empty():
+                pending = self._queue.get_nowait()
+                if not pending.future.done():
+                    pending.future.set_result(False)
+
+        if self._runner is not None:
+            await self._runner.close()
 
     async def send_message(
         self,
@@ -37,64 +151,150 @@ class IMessageSender:
         """
         try:
             if is_group and chat_id:
-                return await self._send_to_group(chat_id, text)
+                target, is_group = chat_id, True
             else:
-                return await self._send_to_individual(recipient, text)
+                target, is_group = recipient, False
+
+            if self._dispatch_task is None:
+                return await self._send_one(target, text, is_group)
+
+            future = asyncio.get_running_loop().create_future()
+            self._queue.put_nowait(_PendingSend(target, text, is_group, future))
+            return await future
         except Exception as e:
             logger.error(f"Failed to send iMessage: {e}")
             return False
 
+    async def _dispatch_loop(self) -> None:
+        """Send queued messages, batching those that arrive together."""
+        while True:
+            batch = [await self._queue.get()]
+            if not self._queue.empty():
+                # More sends are waiting: let the rest of the burst arrive
+                await asyncio.sleep(BATCH_WINDOW)
+                while len(batch) < MAX_BATCH_SIZE and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+            results = [False] * len(batch)
+            try:
+                results = await self._send_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to send iMessage batch: {e}")
+            finally:
+                for pending, success in zip(batch, results):
+                    if not pending.future.done():
+                        pending.future.set_result(success)
+
+    async def _send_one(self, target: str, text: str, is_group: bool) -> bool:
+        """Send a single message with its own osascript run."""
+        if is_group:
+            return await self._send_to_group(target, text)
+        return await self._send_to_individual(target, text)
+
+    async def _send_batch(self, batch: list[_PendingSend]) -> list[bool]:
+        """Send several messages in one osascript run; returns per-message success."""
+        if len(batch) == 1:
+            pending = batch[0]
+            return [await self._send_one(pending.target, pending.text, pending.is_group)]
+
+        output = await self._run_applescript_output(
+            self._build_batch_script(batch), timeout=SEND_TIMEOUT * len(batch)
+        )
+        # The script reports one "1" (sent) or "0" (failed) per message
+        flags = (output or "").strip()
+        if len(flags) != len(batch):
+            # The run failed as a whole (e.g. timed out and was killed), so
+            # some messages may already have gone out. Report them as not
+            # confirmed rather than resending and risking duplicates
+            logger.warning(f"iMessage batch of {len(batch)} failed; delivery unknown, not retrying")
+            return [False] * len(batch)
+
+        results = [flags[i : i + 1] == "1" for i in range(len(batch))]
+        logger.debug(f"Sent iMessage batch: {sum(results)}/{len(batch)} succeeded")
+
+        # Retry the sends AppleScript reported as failed; groups get the
+        # slower lookup through every chat
+        for i, pending in enumerate(batch):
+            if results[i]:
+                continue
+            if pending.is_group:
+                results[i] = await self._send_group_fallback(pending.target, pending.text)
+            else:
+                results[i] = await self._send_to_individual(pending.target, pending.text)
+        return results
+
+    def _build_batch_script(self, batch: list[_PendingSend]) -> str:
+        """Build one AppleScript that sends every message in `batch`."""
+        lines = ['tell application "Messages"', 'set results to ""']
+        if any(not pending.is_group for pending in batch):
+            lines.append("set targetService to 1st account whose service type = iMessage")
+
+        for pending in batch:
+            escaped_text = self._escape_for_applescript(pending.text)
+            escaped_target = _escape_cached(pending.target)
+            if pending.is_group:
+                target = f'a reference to chat id "{escaped_target}"'
+            else:
+                target = f'participant "{escaped_target}" of targetService'
+            lines.append(_BATCH_ITEM.substitute(target=target, text=escaped_text))
+
+        lines += ["return results", "end tell"]
+        return "\n".join(lines)
+
     async def _send_to_individual(self, recipient: str, text: str) -> bool:
         """Send a direct message to an individual."""
         # Escape special characters for AppleScript
-        escaped_text = self._escape_for_applescript(text)
-        escaped_recipient = self._escape_for_applescript(recipient)
-
-        script = f"""
-            tell application "Messages"
-                set targetService to 1st account whose service type = iMessage
-                set targetBuddy to participant "{escaped_recipient}" of targetService
-                send "{escaped_text}" to targetBuddy
-            end tell
-        """
+        script = _SCRIPT_INDIVIDUAL.substitute(
+            recipient=_escape_cached(recipient), text=self._escape_for_applescript(text)
+        )
 
         return await self._run_applescript(script)
 
     async def _send_to_group(self, chat_id: str, text: str) -> bool:
         """Send a message to a group chat."""
-        escaped_text = self._escape_for_applescript(text)
-        escaped_chat_id = self._escape_for_applescript(chat_id)
-
         # Try to find the chat by its identifier
-        script = f"""
-            tell application "Messages"
-                set targetChat to a reference to chat id "{escaped_chat_id}"
-                send "{escaped_text}" to targetChat
-            end tell
-        """
+        script = _SCRIPT_GROUP.substitute(
+            chat_id=_escape_cached(chat_id), text=self._escape_for_applescript(text)
+        )
 
         success = await self._run_applescript(script)
 
         if not success:
-            # Fallback: try finding by chat name
-            logger.debug("Retrying with chat name lookup")
-            script_fallback = f"""
-                tell application "Messages"
-                    set allChats to every chat
-                    repeat with aChat in allChats
-                        if id of aChat contains "{escaped_chat_id}" then
-                            send "{escaped_text}" to aChat
-                            return
-                        end if
-                    end repeat
-                end tell
-            """
-            success = await self._run_applescript(script_fallback)
+            success = await self._send_group_fallback(chat_id, text)
 
         return success
 
+    async def _send_group_fallback(self, chat_id: str, text: str) -> bool:
+        """Send to a group by scanning every chat for a matching id."""
+        # Fallback: try finding by chat name
+        logger.debug("Retrying with chat name lookup")
+        script_fallback = _SCRIPT_GROUP_FALLBACK.substitute(
+            chat_id=_escape_cached(chat_id), text=self._escape_for_applescript(text)
+        )
+        return await self._run_applescript(script_fallback)
+
     async def _run_applescript(self, script: str) -> bool:
         """Execute an AppleScript and return success status."""
+        return await self._run_applescript_output(script) is not None
+
+    async def _run_applescript_output(
+        self, script: str, timeout: float = SEND_TIMEOUT
+    ) -> str | None:
+        """Execute an AppleScript and return its output, or None on failure."""
+        if self._runner is not None:
+            try:
+                return await self._runner.run(script, timeout)
+            except RunnerUnavailable as e:
+                logger.warning(f"{e}; running each AppleScript in its own osascript")
+                self._runner = None
+            except Exception as e:
+                logger.error(f"Failed to execute AppleScript: {e}")
+                return None
+
+        return await self._spawn_applescript(script, timeout)
+
+    async def _spawn_applescript(self, script: str, timeout: float) -> str | None:
+        """Execute an AppleScript in a fresh osascript process."""
         try:
             # Run osascript in a subprocess
             process = await asyncio.create_subprocess_exec(
@@ -105,39 +305,49 @@ class IMessageSender:
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10.0)
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                raise
 
             if process.returncode == 0:
                 logger.debug("AppleScript executed successfully")
-                return True
+                return stdout.decode("utf-8")
             else:
                 error_msg = stderr.decode("utf-8").strip()
                 logger.error(f"AppleScript error: {error_msg}")
-                return False
+                return None
 
         except asyncio.TimeoutError:
             logger.error("AppleScript timed out")
-            return False
+            return None
         except Exception as e:
             logger.error(f"Failed to execute AppleScript: {e}")
-            return False
+            return None
 
     def _escape_for_applescript(self, text: str) -> str:
+        """Escape special characters for use in AppleScript strings."""
+        return _escape(text)
+
+    async def check_messages_app(self, strict: bool = False) -> bool:
         """
-        Escape special characters for use in AppleScript strings.
+        Check if Messages.app is available and accessible.
+
+        Args:
+            strict: Ask System Events through AppleScript, which also proves
+                osascript can drive the GUI session, instead of scanning the
+                process table
 
-        AppleScript uses backslash for escaping within double-quoted strings.
+        Returns:
+            True if the Messages process is running
         """
-        # Escape backslashes first, then quotes
-        text = text.replace("\\", "\\\\")
-        text = text.replace('"', '\\"')
-        text = text.replace("\n", "\\n")
-        text = text.replace("\r", "\\r")
-        text = text.replace("\t", "\\t")
-        return text
+        if not strict:
+            try:
+                return any(p.info["name"] == "Messages" for p in psutil.process_iter(["name"]))
+            except psutil.Error as e:
+                logger.debug(f"Process scan failed, asking System Events: {e}")
 
-    async def check_messages_app(self) -> bool:
-        """Check if Messages.app is available and accessible."""
         script = """
             tell application "System Events"
                 return exists application process "Messages"
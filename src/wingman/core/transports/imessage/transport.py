@@ -10,6 +10,10 @@ from .sender import IMessageSender
 
 logger = logging.getLogger(__name__)
 
+# Received messages waiting for the handler. When full, the database
+# poller waits for room instead of dropping messages
+DISPATCH_QUEUE_SIZE = 256
+
 
 class IMessageTransport(BaseTransport):
     """
@@ -33,24 +37,45 @@ class IMessageTransport(BaseTransport):
         )
         self._sender = IMessageSender()
         self._listener_task: asyncio.Task | None = None
+        # Decouples database polling from handler execution
+        self._queue: asyncio.Queue[MessageEvent] = asyncio.Queue(maxsize=DISPATCH_QUEUE_SIZE)
+        self._dispatcher_task: asyncio.Task | None = None
 
     @property
     def platform(self) -> Platform:
         return Platform.IMESSAGE
 
     async def start(self) -> None:
-        """Start the iMessage transport."""
+        """
+        Start the iMessage transport and run until it is stopped.
+
+        Raises whatever stops the database listener, so a supervisor can
+        restart the transport.
+        """
         logger.info("Starting iMessage transport...")
         self._running = True
 
         # Set up message callback
         self._listener.set_message_callback(self._on_message)
 
+        # Handle received messages in order, off the polling task
+        self._dispatcher_task = asyncio.create_task(self._dispatch_loop())
+
         # Start listener in background task
         self._listener_task = asyncio.create_task(self._listener.start())
 
+        # Start batching outgoing sends
+        self._sender.start()
+
         logger.info("iMessage transport started")
 
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            # stop() cancels the listener; anything else cancelled us
+            if self._running:
+                raise
+
     async def _on_message(self, msg: IMessageData) -> None:
         """Handle incoming iMessage from the database listener."""
         # Skip our own messages
@@ -68,13 +93,17 @@ class IMessageTransport(BaseTransport):
             sender_name=msg.chat_name if msg.is_group else None,
             is_group=msg.is_group,
             is_self=msg.is_from_me,
-            raw_data={
-                "rowid": msg.rowid,
-                "handle_id": msg.handle_id,
-                "chat_id": msg.chat_id,
-                "chat_name": msg.chat_name,
-                "is_group": msg.is_group,
-            },
+            raw_data=(
+                {
+                    "rowid": msg.rowid,
+                    "handle_id": msg.handle_id,
+                    "chat_id": msg.chat_id,
+                    "chat_name": msg.chat_name,
+                    "is_group": msg.is_group,
+                }
+                if self.KEEP_RAW_DATA
+                else None
+            ),
         )
 
         logger.info(
@@ -82,7 +111,15 @@ class IMessageTransport(BaseTransport):
             f"group={msg.is_group}, text={msg.text[:50]}..."
         )
 
-        await self._dispatch_message(event)
+        if self._queue.full():
+            logger.warning("iMessage dispatch queue full; waiting for the handler")
+        await self._queue.put(event)
+
+    async def _dispatch_loop(self) -> None:
+        """Pass queued messages to the handler one at a time, in arrival order."""
+        while True:
+            event = await self._queue.get()
+            await self._dispatch_message(event)
 
     async def stop(self) -> None:
         """Stop the iMessage transport."""
@@ -100,6 +137,18 @@ class IMessageTransport(BaseTransport):
             except asyncio.CancelledError:
                 pass
 
+        # Cancel the message dispatcher
+        if self._dispatcher_task:
+            self._dispatcher_task.cancel()
+            try:
+                await self._dispatcher_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher_task = None
+
+        # Stop the send dispatcher
+        await self._sender.close()
+
         logger.info("iMessage transport stopped")
 
     async def send_message(self, chat_id: str, text: str) -> bool:
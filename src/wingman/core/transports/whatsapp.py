@@ -29,6 +29,19 @@ class WhatsAppTransport(BaseTransport):
         self._on_disconnected: Callable[[], Coroutine] | None = None
         self._on_qr_code: Callable[[], Coroutine] | None = None
 
+        # Node.js IPC message type -> handler, registered on every start()
+        self._ipc_table: dict[str, Callable[[dict], Coroutine]] = {
+            "message": self._ipc_on_message,
+            "connected": self._ipc_on_connected,
+            "disconnected": self._ipc_on_disconnected,
+            "qr_code": self._ipc_on_qr_code,
+            "error": self._ipc_on_error,
+            "logged_out": self._ipc_on_logged_out,
+            "send_result": self._ipc_on_send_result,
+            "starting": self._ipc_on_starting,
+            "pong": self._ipc_on_pong,
+        }
+
     @property
     def platform(self) -> Platform:
         return Platform.WHATSAPP
@@ -76,81 +89,74 @@ class WhatsAppTransport(BaseTransport):
         if not self._ipc:
             return
 
-        async def on_message(data: dict) -> None:
-            """Handle incoming WhatsApp message."""
-            event = self._convert_to_event(data)
-            await self._dispatch_message(event)
-
-        async def on_connected(data: dict) -> None:
-            """Handle WhatsApp connection."""
-            user = data.get("user", {})
-            user_id = user.get("id", "")
-            self._self_id = user_id
-            logger.info(f"WhatsApp connected: {user_id}")
-            if self._on_connected:
-                await self._on_connected(user_id)
-
-        async def on_disconnected(data: dict) -> None:
-            """Handle WhatsApp disconnection."""
-            logger.warning(f"WhatsApp disconnected: {data}")
-            if self._on_disconnected:
-                await self._on_disconnected()
-
-        async def on_qr_code(data: dict) -> None:
-            """Handle QR code event."""
-            logger.info("QR code received - check terminal")
-            if self._on_qr_code:
-                await self._on_qr_code()
-
-        async def on_error(data: dict) -> None:
-            """Handle Node.js error."""
-            logger.error(f"WhatsApp error: {data.get('message', 'Unknown error')}")
-
-        async def on_logged_out(data: dict) -> None:
-            """Handle logout event."""
-            logger.error("Logged out from WhatsApp")
-            if self._on_disconnected:
-                await self._on_disconnected()
-
-        async def on_send_result(data: dict) -> None:
-            """Handle send result."""
-            success = data.get("success", False)
-            jid = data.get("jid", "")
-            if success:
-                logger.debug(f"Message sent to {jid}")
-            else:
-                logger.error(f"Failed to send message to {jid}")
-
-        async def on_starting(data: dict) -> None:
-            logger.info("Node.js starting...")
-
-        async def on_pong(data: dict) -> None:
-            logger.debug("Pong received")
-
-        # Register all handlers
-        self._ipc.register_handler("message", on_message)
-        self._ipc.register_handler("connected", on_connected)
-        self._ipc.register_handler("disconnected", on_disconnected)
-        self._ipc.register_handler("qr_code", on_qr_code)
-        self._ipc.register_handler("error", on_error)
-        self._ipc.register_handler("logged_out", on_logged_out)
-        self._ipc.register_handler("send_result", on_send_result)
-        self._ipc.register_handler("starting", on_starting)
-        self._ipc.register_handler("pong", on_pong)
+        for message_type, handler in self._ipc_table.items():
+            self._ipc.register_handler(message_type, handler)
+
+    async def _ipc_on_message(self, data: dict) -> None:
+        """Handle incoming WhatsApp message."""
+        event = self._convert_to_event(data)
+        await self._dispatch_message(event)
+
+    async def _ipc_on_connected(self, data: dict) -> None:
+        """Handle WhatsApp connection."""
+        user = data.get("user", {})
+        user_id = user.get("id", "")
+        self._self_id = user_id
+        logger.info(f"WhatsApp connected: {user_id}")
+        if self._on_connected:
+            await self._on_connected(user_id)
+
+    async def _ipc_on_disconnected(self, data: dict) -> None:
+        """Handle WhatsApp disconnection."""
+        logger.warning(f"WhatsApp disconnected: {data}")
+        if self._on_disconnected:
+            await self._on_disconnected()
+
+    async def _ipc_on_qr_code(self, data: dict) -> None:
+        """Handle QR code event."""
+        logger.info("QR code received - check terminal")
+        if self._on_qr_code:
+            await self._on_qr_code()
+
+    async def _ipc_on_error(self, data: dict) -> None:
+        """Handle Node.js error."""
+        logger.error(f"WhatsApp error: {data.get('message', 'Unknown error')}")
+
+    async def _ipc_on_logged_out(self, data: dict) -> None:
+        """Handle logout event."""
+        logger.error("Logged out from WhatsApp")
+        if self._on_disconnected:
+            await self._on_disconnected()
+
+    async def _ipc_on_send_result(self, data: dict) -> None:
+        """Handle send result."""
+        success = data.get("success", False)
+        jid = data.get("jid", "")
+        if success:
+            logger.debug(f"Message sent to {jid}")
+        else:
+            logger.error(f"Failed to send message to {jid}")
+
+    async def _ipc_on_starting(self, data: dict) -> None:
+        logger.info("Node.js starting...")
+
+    async def _ipc_on_pong(self, data: dict) -> None:
+        logger.debug("Pong received")
 
     def _convert_to_event(self, data: dict) -> MessageEvent:
         """Convert IPC message data to MessageEvent."""
+        get = data.get
         return MessageEvent(
-            chat_id=data.get("chatId", ""),
-            sender_id=data.get("senderId", ""),
-            text=data.get("text", ""),
-            timestamp=data.get("timestamp", time.time()),
+            chat_id=get("chatId", ""),
+            sender_id=get("senderId", ""),
+            text=get("text", ""),
+            timestamp=get("timestamp", time.time()),
             platform=Platform.WHATSAPP,
-            sender_name=data.get("senderName"),
-            is_group=data.get("isGroup", False),
-            is_self=data.get("isSelf", False),
-            raw_data=data,
-            quoted_message=data.get("quotedMessage"),
+            sender_name=get("senderName"),
+            is_group=get("isGroup", False),
+            is_self=get("isSelf", False),
+            raw_data=data if self.KEEP_RAW_DATA else None,
+            quoted_message=get("quotedMessage"),
         )
 
     async def stop(self) -> None:
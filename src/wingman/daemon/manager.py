@@ -1,16 +1,93 @@
 """Daemon manager for Wingman."""
 
+import ctypes
+import ctypes.util
 import logging
 import os
 import signal
 import subprocess
 import sys
 import time
+from typing import NamedTuple
 
 from wingman.config.paths import WingmanPaths
 
 logger = logging.getLogger(__name__)
 
+# How long one `launchctl list` result answers is_running/get_pid/get_uptime
+_CACHE_TTL = 0.25
+
+
+# proc_pidinfo() flavor that fills a struct proc_bsdinfo (<sys/proc_info.h>)
+_PROC_PIDTBSDINFO = 3
+
+
+class _ProcBSDInfo(ctypes.Structure):
+    """struct proc_bsdinfo from <sys/proc_info.h>."""
+
+    _fields_ = [
+        ("pbi_flags", ctypes.c_uint32),
+        ("pbi_status", ctypes.c_uint32),
+        ("pbi_xstatus", ctypes.c_uint32),
+        ("pbi_pid", ctypes.c_uint32),
+        ("pbi_ppid", ctypes.c_uint32),
+        ("pbi_uid", ctypes.c_uint32),
+        ("pbi_gid", ctypes.c_uint32),
+        ("pbi_ruid", ctypes.c_uint32),
+        ("pbi_rgid", ctypes.c_uint32),
+        ("pbi_svuid", ctypes.c_uint32),
+        ("pbi_svgid", ctypes.c_uint32),
+        ("rfu_1", ctypes.c_uint32),
+        ("pbi_comm", ctypes.c_char * 16),
+        ("pbi_name", ctypes.c_char * 32),
+        ("pbi_nfiles", ctypes.c_uint32),
+        ("pbi_pgid", ctypes.c_uint32),
+        ("pbi_pjobc", ctypes.c_uint32),
+        ("e_tdev", ctypes.c_uint32),
+        ("e_tpgid", ctypes.c_uint32),
+        ("pbi_nice", ctypes.c_int32),
+        ("pbi_start_tvsec", ctypes.c_uint64),
+        ("pbi_start_tvusec", ctypes.c_uint64),
+    ]
+
+
+def _darwin_uptime(pid: int) -> float | None:
+    """Get a process's age from libproc's proc_pidinfo (macOS)."""
+    path = ctypes.util.find_library("proc") or "/usr/lib/libSystem.dylib"
+    try:
+        libproc = ctypes.CDLL(path, use_errno=True)
+    except OSError:
+        return None
+
+    info = _ProcBSDInfo()
+    size = ctypes.sizeof(info)
+    written = libproc.proc_pidinfo(pid, _PROC_PIDTBSDINFO, 0, ctypes.byref(info), size)
+    if written != size:
+        return None
+    return time.time() - (info.pbi_start_tvsec + info.pbi_start_tvusec / 1_000_000)
+
+
+def _linux_uptime(pid: int) -> float | None:
+    """Get a process's age from /proc (Linux)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+        with open("/proc/uptime") as f:
+            system_uptime = float(f.read().split()[0])
+        # comm (field 2) may contain spaces and parens, so split after the
+        # last ")"; starttime is field 22, i.e. index 19 of what follows
+        start_ticks = int(stat[stat.rindex(")") + 2 :].split()[19])
+        return system_uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _LaunchdStatus(NamedTuple):
+    """Parsed `launchctl list <label>` line for a loaded agent."""
+
+    pid: int | None
+    status: int
+
 
 class DaemonManager:
     """
@@ -25,9 +102,12 @@ class DaemonManager:
     def __init__(self, paths: WingmanPaths):
         self.paths = paths
         self._is_macos = sys.platform == "darwin"
+        # (monotonic time of the probe, its result)
+        self._launchd_cache: tuple[float, _LaunchdStatus | None] | None = None
 
     def start(self) -> None:
         """Start the daemon."""
+        self._launchd_cache = None
         if self._is_macos:
             self._start_launchd()
         else:
@@ -35,6 +115,7 @@ class DaemonManager:
 
     def stop(self) -> None:
         """Stop the daemon."""
+        self._launchd_cache = None
         if self._is_macos:
             self._stop_launchd()
         else:
@@ -45,6 +126,7 @@ class DaemonManager:
         self.stop()
         time.sleep(1)
         self.start()
+        self._launchd_cache = None
 
     def is_running(self) -> bool:
         """Check if the daemon is running."""
@@ -66,6 +148,16 @@ class DaemonManager:
         if pid is None:
             return None
 
+        # Read the start time directly; only fork ps if that isn't possible
+        if self._is_macos:
+            uptime = _darwin_uptime(pid)
+        elif sys.platform.startswith("linux"):
+            uptime = _linux_uptime(pid)
+        else:
+            uptime = None
+        if uptime is not None:
+            return max(uptime, 0.0)
+
         try:
             # Use ps to get process start time
             result = subprocess.run(
@@ -176,31 +268,49 @@ class DaemonManager:
 
         logger.info(f"Daemon stopped: {self.LAUNCHD_LABEL}")
 
-    def _is_launchd_running(self) -> bool:
-        """Check if launchd agent is running."""
-        result = subprocess.run(
-            ["launchctl", "list", self.LAUNCHD_LABEL], capture_output=True, text=True
-        )
-        return result.returncode == 0
+    def _query_launchd(self) -> _LaunchdStatus | None:
+        """
+        Get the agent's launchd entry, or None if it isn't loaded.
+
+        One `launchctl list` result is reused for _CACHE_TTL seconds so a
+        status refresh that checks is_running, get_pid and get_uptime forks
+        launchctl once instead of three times.
+        """
+        now = time.monotonic()
+        cached = self._launchd_cache
+        if cached is not None and now - cached[0] < _CACHE_TTL:
+            return cached[1]
 
-    def _get_launchd_pid(self) -> int | None:
-        """Get PID from launchd."""
         result = subprocess.run(
             ["launchctl", "list", self.LAUNCHD_LABEL], capture_output=True, text=True
         )
-
-        if result.returncode != 0:
-            return None
-
-        # Parse output: PID\tStatus\tLabel
-        parts = result.stdout.strip().split("\t")
-        if len(parts) >= 1 and parts[0] != "-":
+        entry = None
+        if result.returncode == 0:
+            # Parse output: PID\tStatus\tLabel
+            parts = result.stdout.strip().split("\t")
+            pid = None
+            if parts[0] != "-":
+                try:
+                    pid = int(parts[0])
+                except ValueError:
+                    pass
             try:
-                return int(parts[0])
+                status = int(parts[1]) if len(parts) > 1 else 0
             except ValueError:
-                pass
+                status = 0
+            entry = _LaunchdStatus(pid, status)
 
-        return None
+        self._launchd_cache = (now, entry)
+        return entry
+
+    def _is_launchd_running(self) -> bool:
+        """Check if launchd agent is running."""
+        return self._query_launchd() is not None
+
+    def _get_launchd_pid(self) -> int | None:
+        """Get PID from launchd."""
+        entry = self._query_launchd()
+        return entry.pid if entry is not None else None
 
     # ========== PID file implementation (fallback) ==========
 
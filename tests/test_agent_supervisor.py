@@ -0,0 +1,100 @@
+"""Tests for MultiTransportAgent's transport supervisor."""
+
+import asyncio
+import types
+
+from wingman.core import agent as agent_module
+from wingman.core.agent import MultiTransportAgent
+from wingman.core.transports import Platform
+
+
+class _FlakyTransport:
+    """start() returns, then raises, then succeeds until shutdown."""
+
+    def __init__(self, agent):
+        self.agent = agent
+        self.starts = 0
+        self.stops = 0
+
+    async def start(self):
+        self.starts += 1
+        if self.starts == 1:
+            return  # e.g. the Node.js process exited
+        if self.starts == 2:
+            raise RuntimeError("listener crashed")
+        self.agent._shutdown_event.set()
+
+    async def stop(self):
+        self.stops += 1
+
+
+class _ScriptedTransport:
+    """Runs for the given durations on a fake clock, then requests shutdown."""
+
+    def __init__(self, agent, clock, runtimes):
+        self.agent = agent
+        self.clock = clock
+        self.runtimes = list(runtimes)
+
+    async def start(self):
+        if not self.runtimes:
+            self.agent._shutdown_event.set()
+            return
+        self.clock[0] += self.runtimes.pop(0)
+
+    async def stop(self):
+        pass
+
+
+class TestTransportSupervisor:
+    def test_returned_or_failed_transport_is_restarted(self, monkeypatch):
+        monkeypatch.setattr(agent_module, "TRANSPORT_RESTART_DELAY", 0)
+        agent = MultiTransportAgent.__new__(MultiTransportAgent)
+
+        async def main():
+            agent._shutdown_event = asyncio.Event()
+            transport = _FlakyTransport(agent)
+            await asyncio.wait_for(agent._run_transport(Platform.WHATSAPP, transport), 1)
+            return transport
+
+        transport = asyncio.run(main())
+        assert transport.starts == 3
+        assert transport.stops == 2
+
+    def test_return_after_shutdown_is_not_restarted(self):
+        agent = MultiTransportAgent.__new__(MultiTransportAgent)
+
+        async def main():
+            agent._shutdown_event = asyncio.Event()
+            agent._shutdown_event.set()
+            transport = _FlakyTransport(agent)
+            await agent._run_transport(Platform.WHATSAPP, transport)
+            return transport
+
+        transport = asyncio.run(main())
+        assert (transport.starts, transport.stops) == (1, 0)
+
+    def test_backoff_resets_after_healthy_run(self, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr(agent_module, "time", types.SimpleNamespace(monotonic=lambda: clock[0]))
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr(agent_module.asyncio, "sleep", fake_sleep)
+        agent = MultiTransportAgent.__new__(MultiTransportAgent)
+
+        async def main():
+            agent._shutdown_event = asyncio.Event()
+            # Two quick exits, one long healthy run, then another quick exit
+            transport = _ScriptedTransport(
+                agent, clock, [0, 0, agent_module.TRANSPORT_HEALTHY_RUNTIME, 0]
+            )
+            await agent._run_transport(Platform.WHATSAPP, transport)
+
+        asyncio.run(main())
+        base = agent_module.TRANSPORT_RESTART_DELAY
+        assert delays == [base, base * 2, base, base * 2]
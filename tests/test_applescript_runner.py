@@ -0,0 +1,73 @@
+"""Tests for AppleScriptRunner against a fake osascript on PATH."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from wingman.core.transports.imessage.script_runner import AppleScriptRunner, RunnerUnavailable
+
+FAKE_OSASCRIPT = """\
+#!{python}
+import json, sys, time
+if "--broken" in open(__file__ + ".mode").read():
+    sys.exit(1)
+print(json.dumps({{"ready": True}}), flush=True)
+for line in sys.stdin:
+    source = json.loads(line)
+    if source == "hang":
+        time.sleep(30)
+    ok = source != "fail"
+    print(json.dumps({{"ok": ok, "output": source.upper()}}), flush=True)
+"""
+
+
+@pytest.fixture
+def fake_osascript(tmp_path, monkeypatch):
+    script = tmp_path / "osascript"
+    script.write_text(FAKE_OSASCRIPT.format(python=sys.executable))
+    script.chmod(0o755)
+    mode = tmp_path / "osascript.mode"
+    mode.write_text("")
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    return mode
+
+
+class TestAppleScriptRunner:
+    def test_scripts_share_one_process(self, fake_osascript):
+        async def main():
+            runner = AppleScriptRunner()
+            try:
+                first = await runner.run("one", timeout=5)
+                pid = runner._process.pid
+                second = await runner.run("two", timeout=5)
+                assert runner._process.pid == pid
+                return first, second, await runner.run("fail", timeout=5)
+            finally:
+                await runner.close()
+
+        assert asyncio.run(main()) == ("ONE", "TWO", None)
+
+    def test_timed_out_runner_is_replaced(self, fake_osascript):
+        async def main():
+            runner = AppleScriptRunner()
+            try:
+                await runner.run("one", timeout=5)
+                pid = runner._process.pid
+                assert await runner.run("hang", timeout=0.2) is None
+                assert await runner.run("again", timeout=5) == "AGAIN"
+                assert runner._process.pid != pid
+            finally:
+                await runner.close()
+
+        asyncio.run(main())
+
+    def test_unavailable_runner(self, fake_osascript):
+        fake_osascript.write_text("--broken")
+
+        async def main():
+            with pytest.raises(RunnerUnavailable):
+                await AppleScriptRunner().run("one", timeout=5)
+
+        asyncio.run(main())
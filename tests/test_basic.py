@@ -1,5 +1,7 @@
 """Basic smoke tests for wingman."""
 
+import shutil
+
 from wingman.config.paths import WingmanPaths
 
 
@@ -16,3 +18,36 @@ def test_paths_created():
     assert paths.config_dir is not None
     assert paths.data_dir is not None
     assert paths.log_dir is not None
+
+
+def test_derived_paths_cached(tmp_path):
+    """Verify derived paths are computed once per WingmanPaths instance."""
+    paths = WingmanPaths(config_dir=tmp_path / "config")
+    assert paths.config_file == tmp_path / "config" / "config.yaml"
+    assert paths.config_file is paths.config_file
+
+
+def test_ensure_directories(tmp_path):
+    """Verify ensure_directories creates every required directory."""
+    paths = WingmanPaths(
+        config_dir=tmp_path / "config",
+        data_dir=tmp_path / "data",
+        cache_dir=tmp_path / "cache",
+    )
+    paths.ensure_directories()
+    paths.ensure_directories()
+    for directory in [paths.config_dir, paths.log_dir, paths.auth_state_dir]:
+        assert directory.is_dir()
+
+
+def test_ensure_directories_recreates_deleted(tmp_path):
+    """Verify a directory removed after the first call is created again."""
+    paths = WingmanPaths(
+        config_dir=tmp_path / "config",
+        data_dir=tmp_path / "data",
+        cache_dir=tmp_path / "cache",
+    )
+    paths.ensure_directories()
+    shutil.rmtree(tmp_path / "data")
+    paths.ensure_directories()
+    assert paths.auth_state_dir.is_dir()
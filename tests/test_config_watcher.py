@@ -0,0 +1,70 @@
+"""Tests for the shared config file watcher."""
+
+import os
+import threading
+import time
+
+from wingman.config import watcher as watcher_module
+from wingman.config.watcher import ConfigWatcher
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestPollingWatcher:
+    def setup_method(self):
+        self._observer = watcher_module.Observer
+        watcher_module.Observer = None  # Force the polling fallback
+
+    def teardown_method(self):
+        watcher_module.Observer = self._observer
+
+    def test_change_dispatched_to_all_subscribers(self, tmp_path):
+        f = tmp_path / "contacts.yaml"
+        f.write_text("a: 1\n")
+        watcher = ConfigWatcher(poll_interval=0.02)
+        calls = []
+        watcher.subscribe(f, lambda: calls.append("first"))
+        watcher.subscribe(f, lambda: calls.append("second"))
+
+        # Newly subscribed paths are checked once straight away
+        assert _wait_for(lambda: len(calls) >= 2)
+        calls.clear()
+
+        f.write_text("a: 2\n")
+        os.utime(f, ns=(time.time_ns() + 10**9,) * 2)
+        assert _wait_for(lambda: sorted(calls) == ["first", "second"])
+
+    def test_single_thread_for_many_subscriptions(self, tmp_path):
+        watcher = ConfigWatcher(poll_interval=0.02)
+        before = threading.active_count()
+        for i in range(5):
+            path = tmp_path / f"config{i}.yaml"
+            path.write_text("")
+            watcher.subscribe(path, lambda: None)
+        assert threading.active_count() == before + 1
+
+    def test_unsubscribe(self, tmp_path):
+        f = tmp_path / "groups.yaml"
+        f.write_text("a: 1\n")
+        watcher = ConfigWatcher(poll_interval=0.02)
+        calls = []
+
+        def callback():
+            calls.append(1)
+
+        watcher.subscribe(f, callback)
+        assert _wait_for(lambda: calls)
+        watcher.unsubscribe(f, callback)
+        calls.clear()
+
+        f.write_text("a: 2\n")
+        os.utime(f, ns=(time.time_ns() + 10**9,) * 2)
+        time.sleep(0.1)
+        assert calls == []
@@ -0,0 +1,82 @@
+"""Tests for ContextBuilder history caching."""
+
+from unittest.mock import patch
+
+from wingman.core.memory.context import ContextBuilder
+from wingman.core.memory.models import Message, MessageStore
+
+
+def _msg(text, ts, is_self=False, chat_id="chat"):
+    return Message(
+        id=None,
+        chat_id=chat_id,
+        sender_id="alice",
+        sender_name="Alice",
+        text=text,
+        timestamp=ts,
+        is_self=is_self,
+    )
+
+
+class TestContextCache:
+    def setup_method(self):
+        self.current = ("Alice", "now")
+
+    def test_cached_history_is_kept_current(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        builder = ContextBuilder(store, window_size=3)
+        store.store_message(_msg("one", 1.0))
+
+        first = builder.build_context("chat", *self.current)
+        assert [m["content"] for m in first] == ["[Alice]: one", "[Alice]: now"]
+
+        with patch.object(store, "get_recent_messages_columns") as read:
+            store.store_message(_msg("two", 2.0, is_self=True))
+            store.store_message(_msg("three", 3.0))
+            store.store_message(_msg("four", 4.0))
+            context = builder.build_context("chat", *self.current)
+            read.assert_not_called()
+
+        # Trimmed to the window, and the cached history wasn't mutated
+        assert [m["content"] for m in context] == [
+            "two",
+            "[Alice]: three",
+            "[Alice]: four",
+            "[Alice]: now",
+        ]
+        assert context[0]["role"] == "assistant"
+        assert len(builder.build_context("chat", *self.current)) == 4
+        store.close()
+
+    def test_matches_uncached_read(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        builder = ContextBuilder(store, window_size=5)
+        builder.build_context("chat", *self.current)
+        for i in range(8):
+            store.store_message(_msg(f"m{i}", float(i), is_self=i % 3 == 0))
+
+        fresh = ContextBuilder(store, window_size=5)
+        assert builder.build_context("chat", *self.current) == fresh.build_context(
+            "chat", *self.current
+        )
+        store.close()
+
+    def test_cleanup_invalidates_cache(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        builder = ContextBuilder(store)
+        store.store_message(_msg("old", 1.0))
+        assert len(builder.build_context("chat", *self.current)) == 2
+
+        store.cleanup_old_messages(days=1)
+        assert len(builder.build_context("chat", *self.current)) == 1
+        store.close()
+
+    def test_stored_current_message_not_repeated(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        builder = ContextBuilder(store)
+        store.store_message(_msg("hello", 1.0))
+        store.store_message(_msg("now", 2.0))
+
+        context = builder.build_context("chat", *self.current)
+        assert [m["content"] for m in context] == ["[Alice]: hello", "[Alice]: now"]
+        store.close()
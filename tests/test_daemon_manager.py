@@ -0,0 +1,74 @@
+"""Tests for DaemonManager's launchd probing (launchctl is stubbed out)."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from wingman.config.paths import WingmanPaths
+from wingman.daemon import manager as manager_module
+from wingman.daemon.manager import DaemonManager
+
+
+class TestLaunchdProbe:
+    def _manager(self, monkeypatch, tmp_path, stdout="123\t0\tcom.wingman.agent\n", code=0):
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            return subprocess.CompletedProcess(args, code, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(manager_module.subprocess, "run", fake_run)
+        daemon = DaemonManager(WingmanPaths(config_dir=tmp_path))
+        daemon._is_macos = True
+        return daemon, calls
+
+    def test_one_probe_answers_status_calls(self, monkeypatch, tmp_path):
+        daemon, calls = self._manager(monkeypatch, tmp_path)
+        assert daemon.is_running()
+        assert daemon.get_pid() == 123
+        assert daemon.get_pid() == 123
+        assert len(calls) == 1
+
+    def test_loaded_but_not_running(self, monkeypatch, tmp_path):
+        daemon, _ = self._manager(monkeypatch, tmp_path, stdout="-\t78\tcom.wingman.agent\n")
+        assert daemon.is_running()
+        assert daemon.get_pid() is None
+
+    def test_not_loaded(self, monkeypatch, tmp_path):
+        daemon, _ = self._manager(monkeypatch, tmp_path, stdout="", code=113)
+        assert not daemon.is_running()
+        assert daemon.get_pid() is None
+
+    def test_cache_expires(self, monkeypatch, tmp_path):
+        daemon, calls = self._manager(monkeypatch, tmp_path)
+        clock = iter([100.0, 100.1, 101.0])
+        monkeypatch.setattr(manager_module.time, "monotonic", lambda: next(clock))
+        daemon.get_pid()
+        daemon.get_pid()
+        daemon.get_pid()
+        assert len(calls) == 2
+
+
+class TestUptime:
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+    def test_linux_uptime_from_proc(self):
+        uptime = manager_module._linux_uptime(os.getpid())
+        assert uptime is not None
+        assert 0 <= uptime < 3600
+
+    def test_missing_process(self):
+        assert manager_module._linux_uptime(2**22 + 1) is None
+
+    def test_falls_back_to_ps(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(manager_module, "_linux_uptime", lambda pid: None)
+        monkeypatch.setattr(manager_module, "_darwin_uptime", lambda pid: None)
+        monkeypatch.setattr(
+            manager_module.subprocess,
+            "run",
+            lambda args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=" 01:02:03\n"),
+        )
+        daemon = DaemonManager(WingmanPaths(config_dir=tmp_path))
+        monkeypatch.setattr(daemon, "get_pid", lambda: 42)
+        assert daemon.get_uptime() == 3723
@@ -0,0 +1,78 @@
+"""Tests for IMessageDBListener wakeups (uses a minimal stand-in chat.db)."""
+
+import asyncio
+import sqlite3
+import threading
+
+from wingman.config.watcher import ConfigWatcher
+from wingman.core.transports.imessage.db_listener import IMessageDBListener
+
+SCHEMA = """
+CREATE TABLE message (
+    ROWID INTEGER PRIMARY KEY, text TEXT, attributedBody BLOB,
+    handle_id INTEGER, date INTEGER, is_from_me INTEGER
+);
+CREATE TABLE handle (ROWID INTEGER PRIMARY KEY, id TEXT);
+CREATE TABLE chat (
+    ROWID INTEGER PRIMARY KEY, chat_identifier TEXT, display_name TEXT, style INTEGER
+);
+CREATE TABLE chat_message_join (chat_id INTEGER, message_id INTEGER);
+INSERT INTO handle VALUES (1, '+15551234');
+"""
+
+
+def _make_db(path):
+    with sqlite3.connect(path) as conn:
+        conn.executescript(SCHEMA)
+
+
+def _add_message(path, text):
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO message VALUES (NULL, ?, NULL, 1, 0, 0)", (text,))
+
+
+class TestChangeNotifications:
+    def test_change_notification_wakes_listener(self, tmp_path, monkeypatch):
+        db = tmp_path / "chat.db"
+        _make_db(db)
+        subscriptions = {}
+        monkeypatch.setattr(ConfigWatcher, "notifications_available", staticmethod(lambda: True))
+        monkeypatch.setattr(
+            ConfigWatcher, "register", classmethod(lambda cls, p, cb: subscriptions.update({p: cb}))
+        )
+        monkeypatch.setattr(
+            ConfigWatcher, "unregister", classmethod(lambda cls, p, cb: subscriptions.pop(p))
+        )
+
+        # Polling alone would not notice the message within the test
+        listener = IMessageDBListener(db_path=db, poll_interval=100)
+        received = []
+
+        async def on_message(msg):
+            received.append(msg.text)
+
+        async def main():
+            listener.set_message_callback(on_message)
+            task = asyncio.create_task(listener.start())
+            while not subscriptions:
+                await asyncio.sleep(0.01)
+            assert set(subscriptions) == {db, tmp_path / "chat.db-wal"}
+
+            _add_message(db, "hello")
+            # Watcher callbacks run on the watcher's thread
+            thread = threading.Thread(target=subscriptions[db])
+            thread.start()
+            thread.join()
+            await asyncio.wait_for(_until(lambda: received), 2)
+
+            await listener.stop()
+            await asyncio.wait_for(task, 2)
+
+        asyncio.run(main())
+        assert received == ["hello"]
+        assert subscriptions == {}
+
+
+async def _until(predicate):
+    while not predicate():
+        await asyncio.sleep(0.01)
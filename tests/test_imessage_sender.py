@@ -0,0 +1,133 @@
+"""Tests for IMessageSender send batching (osascript is stubbed out)."""
+
+import asyncio
+
+from wingman.core.transports.imessage import sender as sender_module
+from wingman.core.transports.imessage.sender import IMessageSender, _PendingSend
+
+
+class _StubSender(IMessageSender):
+    """Records scripts instead of running osascript."""
+
+    def __init__(self, output=None):
+        super().__init__()
+        self.scripts = []
+        self.output = output
+
+    async def _run_applescript_output(self, script, timeout=10.0):
+        self.scripts.append(script)
+        await asyncio.sleep(0.01)
+        if self.output is not None:
+            return self.output
+        return "1" * script.count("on error") or ""
+
+
+class _FailingSender(_StubSender):
+    """Every osascript run fails as a whole (e.g. times out)."""
+
+    async def _run_applescript_output(self, script, timeout=10.0):
+        self.scripts.append(script)
+        return None
+
+
+class TestIMessageSender:
+    def test_unstarted_sender_sends_directly(self):
+        sender = _StubSender()
+        assert asyncio.run(sender.send_message("+15551234", "hi"))
+        assert len(sender.scripts) == 1
+        assert 'participant "+15551234"' in sender.scripts[0]
+
+    def test_burst_is_sent_in_one_run(self):
+        sender = _StubSender()
+
+        async def main():
+            sender.start()
+            try:
+                first = asyncio.create_task(sender.send_message("+1", "one"))
+                await asyncio.sleep(0)
+                rest = [sender.send_message(f"+{i}", f"msg {i}") for i in range(2, 6)]
+                rest.append(sender.send_message("chat1", "group", is_group=True, chat_id="chat1"))
+                return await asyncio.gather(first, *rest)
+            finally:
+                await sender.close()
+
+        results = asyncio.run(main())
+        assert results == [True] * 6
+        # The first send goes out alone; the rest queue behind it and share a run
+        assert len(sender.scripts) == 2
+        batch = sender.scripts[1]
+        assert batch.count("on error") == 5
+        assert 'a reference to chat id "chat1"' in batch
+
+    def test_failed_group_send_in_batch_uses_fallback(self):
+        sender = _StubSender(output="01")
+
+        async def main():
+            future = asyncio.get_running_loop().create_future
+            batch = [
+                _PendingSend("chat1", "hi", True, future()),
+                _PendingSend("+1", "hi", False, future()),
+            ]
+            return await sender._send_batch(batch)
+
+        assert asyncio.run(main()) == [True, True]
+        assert "repeat with aChat in allChats" in sender.scripts[-1]
+
+    def _run_batch(self, sender, *targets):
+        async def main():
+            future = asyncio.get_running_loop().create_future
+            batch = [_PendingSend(t, "hi", t.startswith("chat"), future()) for t in targets]
+            return await sender._send_batch(batch)
+
+        return asyncio.run(main())
+
+    def test_failed_batch_run_is_not_resent(self):
+        sender = _FailingSender()
+        assert self._run_batch(sender, "chat1", "+1") == [False, False]
+        assert len(sender.scripts) == 1
+
+    def test_failed_individual_send_in_batch_is_retried_alone(self):
+        sender = _StubSender(output="10")
+        assert self._run_batch(sender, "+1", "+2") == [True, True]
+        assert len(sender.scripts) == 2
+        assert 'participant "+2"' in sender.scripts[1]
+        assert 'participant "+1"' not in sender.scripts[1]
+
+    def test_close_fails_queued_sends(self):
+        sender = _StubSender()
+
+        async def main():
+            sender.start()
+            sends = [asyncio.create_task(sender.send_message(f"+{i}", "x")) for i in range(3)]
+            await asyncio.sleep(0)
+            await sender.close()
+            return await asyncio.gather(*sends)
+
+        assert asyncio.run(main()) == [False, False, False]
+
+    def test_escape_for_applescript(self):
+        escape = IMessageSender()._escape_for_applescript
+        assert escape('say "hi"\\now\n\ttab\r') == 'say \\"hi\\"\\\\now\\n\\ttab\\r'
+        plain = "nothing to escape"
+        assert escape(plain) is plain
+
+    def test_messages_app_found_in_process_table(self, monkeypatch):
+        class _Proc:
+            def __init__(self, name):
+                self.info = {"name": name}
+
+        procs = [_Proc("launchd"), _Proc("Messages")]
+        monkeypatch.setattr(sender_module.psutil, "process_iter", lambda attrs: iter(procs))
+        assert asyncio.run(IMessageSender().check_messages_app())
+        procs.pop()
+        assert not asyncio.run(IMessageSender().check_messages_app())
+
+    def test_group_script_keeps_text_verbatim(self):
+        sender = _StubSender()
+        assert asyncio.run(sender.send_message("", 'costs $5 "now"', True, "chat$id"))
+        assert sender.scripts[0] == (
+            'tell application "Messages"\n'
+            'set targetChat to a reference to chat id "chat$id"\n'
+            'send "costs $5 \\"now\\"" to targetChat\n'
+            "end tell"
+        )
@@ -0,0 +1,95 @@
+"""Tests for IMessageTransport's dispatch queue (no chat.db or osascript needed)."""
+
+import asyncio
+
+import pytest
+
+from wingman.core.transports.imessage.db_listener import IMessageData
+from wingman.core.transports.imessage.transport import IMessageTransport
+
+
+class _IdleListener:
+    """Stands in for the chat.db poller."""
+
+    def set_message_callback(self, callback):
+        self.callback = callback
+
+    async def start(self):
+        await asyncio.Event().wait()
+
+    async def stop(self):
+        pass
+
+
+def _data(rowid, text, is_from_me=False):
+    return IMessageData(
+        rowid=rowid,
+        text=text,
+        handle_id="+15551234",
+        chat_id="chat1",
+        chat_name=None,
+        timestamp=float(rowid),
+        is_from_me=is_from_me,
+        is_group=False,
+    )
+
+
+class TestIMessageDispatch:
+    def test_polling_is_not_blocked_by_the_handler(self, tmp_path):
+        transport = IMessageTransport(db_path=tmp_path / "chat.db")
+        transport._listener = _IdleListener()
+        release = asyncio.Event()
+        handled = []
+
+        async def handler(event):
+            await release.wait()
+            handled.append(event.text)
+
+        async def main():
+            transport.set_message_handler(handler)
+            running = asyncio.create_task(transport.start())
+            await asyncio.sleep(0)
+            try:
+                # The poller's callback returns while the handler is still busy
+                for rowid, text in enumerate(["one", "two", "three"]):
+                    await asyncio.wait_for(transport._on_message(_data(rowid, text)), 1)
+                await transport._on_message(_data(9, "mine", is_from_me=True))
+                assert handled == []
+
+                release.set()
+                while len(handled) < 3:
+                    await asyncio.sleep(0.01)
+            finally:
+                await transport.stop()
+            await asyncio.wait_for(running, 1)
+
+        asyncio.run(main())
+        assert handled == ["one", "two", "three"]
+
+    def test_raw_data_only_kept_on_request(self, tmp_path):
+        transport = IMessageTransport(db_path=tmp_path / "chat.db")
+        events = []
+
+        async def put(event):
+            events.append(event)
+
+        transport._queue.put = put
+        asyncio.run(transport._on_message(_data(1, "hi")))
+        transport.KEEP_RAW_DATA = True
+        asyncio.run(transport._on_message(_data(2, "hi")))
+
+        assert events[0].raw_data is None
+        assert events[1].raw_data["rowid"] == 2
+
+    def test_listener_failure_ends_start(self, tmp_path):
+        transport = IMessageTransport(db_path=tmp_path / "chat.db")
+
+        async def main():
+            try:
+                await asyncio.wait_for(transport.start(), 1)
+            finally:
+                await transport.stop()
+
+        # chat.db is missing, so the listener raises and start() reports it
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(main())
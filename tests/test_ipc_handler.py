@@ -0,0 +1,36 @@
+"""Tests for IPCHandler's NUL-delimited framing."""
+
+import asyncio
+import json
+
+from wingman.core.ipc_handler import IPCHandler
+
+
+class TestIPCFraming:
+    def test_frames_split_across_reads(self):
+        received = []
+
+        async def on_message(data):
+            received.append(data["text"])
+
+        async def main():
+            stdout = asyncio.StreamReader()
+            ipc = IPCHandler(stdin=None, stdout=stdout)
+            ipc.register_handler("message", on_message)
+
+            payload = b"".join(
+                json.dumps({"type": "message", "data": {"text": text}}, ensure_ascii=False).encode()
+                + b"\0"
+                for text in ["héllo", "wörld 👋"]
+            )
+            reader = asyncio.create_task(ipc.start())
+            # Deliver the second frame in reads that split the multi-byte emoji
+            cut = payload.index("👋".encode()) + 2
+            for piece in (payload[:cut], payload[cut : cut + 1], payload[cut + 1 :]):
+                stdout.feed_data(piece)
+                await asyncio.sleep(0)
+            stdout.feed_eof()
+            await reader
+
+        asyncio.run(main())
+        assert received == ["héllo", "wörld 👋"]
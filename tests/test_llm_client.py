@@ -0,0 +1,69 @@
+"""Tests for LLMClient response caching (no API calls are made)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from wingman.config.paths import WingmanPaths
+from wingman.config.settings import Settings
+from wingman.core.llm.client import LLMClient
+
+
+def _completion(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+class _FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return _completion(f"reply {self.calls}")
+
+
+class TestResponseCache:
+    def _client(self, **kwargs):
+        client = LLMClient(api_key="test", **kwargs)
+        client.client = SimpleNamespace(chat=SimpleNamespace(completions=_FakeCompletions()))
+        return client
+
+    def test_sampling_calls_cached_only_when_enabled(self):
+        messages = [{"role": "user", "content": "hi"}]
+
+        async def twice(client):
+            return [await client.generate_response("prompt", messages) for _ in range(2)]
+
+        assert asyncio.run(twice(self._client())) == ["reply 1", "reply 2"]
+        assert asyncio.run(twice(self._client(cache_enabled=True))) == ["reply 1", "reply 1"]
+
+    def test_semantic_scope_includes_recent_history(self):
+        def scope(history):
+            messages = [*history, {"role": "user", "content": "yes"}]
+            return LLMClient._semantic_scope("prompt", messages, len(history), None, None)
+
+        pizza = [{"role": "assistant", "content": "want pizza?"}]
+        movie = [{"role": "assistant", "content": "watch a movie?"}]
+        assert scope(pizza) == scope(pizza)
+        assert scope(pizza) != scope(movie)
+        # Only the last few messages count
+        old = [{"role": "user", "content": f"old {i}"} for i in range(10)]
+        assert scope(old[:1] + old[5:] + pizza) == scope(old[5:] + pizza)
+
+
+class TestCacheSettings:
+    @pytest.mark.parametrize("value, expected", [("true", True), ("0", False)])
+    def test_env_flags(self, tmp_path, monkeypatch, value, expected):
+        monkeypatch.setenv("LLM_CACHE_ENABLED", value)
+        monkeypatch.setenv("LLM_SEMANTIC_CACHE", value)
+        settings = Settings.load(paths=WingmanPaths(config_dir=tmp_path, data_dir=tmp_path))
+        assert settings.cache_enabled is expected
+        assert settings.semantic_cache is expected
+
+    def test_yaml_flags(self, tmp_path):
+        paths = WingmanPaths(config_dir=tmp_path, data_dir=tmp_path)
+        paths.config_file.write_text("openai:\n  cache_enabled: true\n  semantic_cache: false\n")
+        settings = Settings.load(paths=paths)
+        assert settings.cache_enabled is True
+        assert settings.semantic_cache is False
@@ -0,0 +1,96 @@
+"""Tests for streamed replies in MessageProcessor."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from wingman.core.message_processor import MessageProcessor, _sentences
+from wingman.core.transports.base import MessageEvent, Platform
+
+
+async def _deltas(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(aiter):
+    return [item async for item in aiter]
+
+
+class TestSentences:
+    def test_splits_on_sentence_end(self):
+        deltas = _deltas("hey the", "re! how are", " you? all go", "od")
+        result = asyncio.run(_collect(_sentences(deltas)))
+        assert result == ["hey there!", "how are you?", "all good"]
+
+    def test_keeps_decimals_and_ellipses_together(self):
+        deltas = _deltas("it's 3.", "5 degrees... ", "brr")
+        result = asyncio.run(_collect(_sentences(deltas)))
+        assert result == ["it's 3.5 degrees...", "brr"]
+
+
+class TestStreamResponse:
+    def setup_method(self):
+        self.llm = MagicMock()
+        self.processor = MessageProcessor(
+            store=MagicMock(),
+            llm=self.llm,
+            contact_registry=MagicMock(),
+            group_registry=MagicMock(),
+            policy_evaluator=MagicMock(),
+            stream_replies=True,
+        )
+        self.processor.context_builder.abuild_context = AsyncMock(return_value=[])
+        self.event = MessageEvent(
+            chat_id="chat", sender_id="alice", text="hi", timestamp=0.0, platform=Platform.WHATSAPP
+        )
+
+    def test_sends_each_sentence(self):
+        self.llm.generate_response_stream = MagicMock(
+            return_value=_deltas("One. ", "Two! ", "Three")
+        )
+        sender = AsyncMock(return_value=True)
+        self.processor.set_sender(sender)
+
+        response = asyncio.run(self.processor._stream_response("whatsapp", "chat", self.event))
+        assert response == "One. Two! Three"
+        assert [c.args[2] for c in sender.await_args_list] == ["One.", "Two!", "Three"]
+
+    def test_stops_after_failed_send(self):
+        self.llm.generate_response_stream = MagicMock(return_value=_deltas("One. ", "Two. "))
+        sender = AsyncMock(side_effect=[True, False])
+        self.processor.set_sender(sender)
+
+        response = asyncio.run(self.processor._stream_response("whatsapp", "chat", self.event))
+        assert response == "One."
+
+
+class TestRateLimiterClock:
+    def test_check_and_record_share_one_reading(self):
+        store = MagicMock()
+        store.astore_message = AsyncMock()
+        policy = MagicMock()
+        policy.evaluate.return_value.should_respond = True
+        contacts = MagicMock()
+        contacts.resolve.return_value.cooldown_override = None
+        processor = MessageProcessor(
+            store=store,
+            llm=MagicMock(),
+            contact_registry=contacts,
+            group_registry=MagicMock(),
+            policy_evaluator=policy,
+        )
+        processor.context_builder.alast_is_self = AsyncMock(return_value=False)
+        processor._generate_response = AsyncMock(return_value="hello")
+        processor.set_sender(AsyncMock(return_value=True))
+        processor.quiet_hours.is_quiet_time = MagicMock(return_value=False)
+        processor.rate_limiter = MagicMock()
+        processor.rate_limiter.can_reply.return_value = True
+
+        event = MessageEvent(
+            chat_id="chat", sender_id="alice", text="hi", timestamp=0.0, platform=Platform.WHATSAPP
+        )
+        asyncio.run(processor.process_message(event))
+
+        (checked,) = processor.rate_limiter.can_reply.call_args.args
+        (recorded,) = processor.rate_limiter.record_reply.call_args.args
+        assert checked is recorded
@@ -0,0 +1,184 @@
+"""Tests for the SQLite message store."""
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from wingman.core.memory.models import FLUSH_BATCH_SIZE, Message, MessageStore
+
+
+def _msg(chat_id="chat", text="hi", ts=1.0, is_self=False):
+    return Message(
+        id=None,
+        chat_id=chat_id,
+        sender_id="alice",
+        sender_name="Alice",
+        text=text,
+        timestamp=ts,
+        is_self=is_self,
+    )
+
+
+class TestMessageStore:
+    def test_store_and_read_back(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        store.store_message(_msg(text="one", ts=1.0))
+        store.store_message(_msg(text="two", ts=2.0, is_self=True))
+
+        messages = store.get_recent_messages("chat")
+        assert [m.text for m in messages] == ["one", "two"]
+        assert store.get_last_sender("chat") == "self"
+        assert store.was_last_message_from_self("chat")
+        assert store.get_message_count() == 2
+        store.close()
+
+    def test_recent_messages_columns(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        store.store_message(_msg(text="one", ts=1.0))
+        store.store_message(_msg(text="two", ts=2.0, is_self=True))
+
+        assert store.get_recent_messages_columns("chat") == {
+            "is_self": [False, True],
+            "sender_id": ["alice", "alice"],
+            "sender_name": ["Alice", "Alice"],
+            "text": ["one", "two"],
+        }
+        store.close()
+
+    def test_chat_state(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        assert store.get_chat_state("chat")[1:] == (None, False)
+
+        store.store_message(_msg(text="one", ts=1.0))
+        store.store_message(_msg(text="two", ts=2.0, is_self=True))
+        columns, last_sender, last_is_self = store.get_chat_state("chat")
+        assert columns["text"] == ["one", "two"]
+        assert (last_sender, last_is_self) == ("alice", True)
+        store.close()
+
+    def test_last_message_meta(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        assert store.get_last_message_meta("chat") == (None, False)
+        assert store.get_last_sender("chat") is None
+
+        store.store_message(_msg(ts=1.0))
+        assert store.get_last_message_meta("chat") == ("alice", False)
+        assert store.get_last_sender("chat") == "alice"
+        store.close()
+
+    def test_wal_mode(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        store.close()
+
+    def test_visible_to_other_connections(self, tmp_path):
+        db_path = tmp_path / "wingman.db"
+        writer = MessageStore(db_path)
+        writer.store_message(_msg())
+        writer.flush()
+
+        reader = MessageStore(db_path)
+        assert reader.get_message_count("chat") == 1
+        writer.close()
+        reader.close()
+
+    def test_shared_across_threads(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        threads = [
+            threading.Thread(target=store.store_message, args=(_msg(ts=float(i)),))
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert store.get_message_count("chat") == 8
+        store.close()
+
+    def test_writes_are_batched(self, tmp_path):
+        db_path = tmp_path / "wingman.db"
+        store = MessageStore(db_path)
+        other = MessageStore(db_path)
+
+        store.store_message(_msg())
+        assert other.get_message_count() == 0
+        store.flush()
+        assert other.get_message_count() == 1
+
+        for i in range(FLUSH_BATCH_SIZE):
+            store.store_message(_msg(ts=float(i)))
+        assert other.get_message_count() == 1 + FLUSH_BATCH_SIZE
+        store.close()
+        other.close()
+
+    def test_close_flushes(self, tmp_path):
+        db_path = tmp_path / "wingman.db"
+        store = MessageStore(db_path)
+        store.store_message(_msg())
+        store.close()
+
+        reopened = MessageStore(db_path)
+        assert reopened.get_message_count() == 1
+        reopened.close()
+
+    def test_bad_row_is_dropped_alone(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+        store.store_message(_msg(text="one", ts=1.0))
+        store.store_message(_msg(text=None, ts=2.0))  # violates NOT NULL
+        store.store_message(_msg(text="three", ts=3.0))
+
+        assert [m.text for m in store.get_recent_messages("chat")] == ["one", "three"]
+        store.close()
+
+    def test_locked_database_keeps_rows_queued(self, tmp_path):
+        db_path = tmp_path / "wingman.db"
+        store = MessageStore(db_path)
+        store._conn.execute("PRAGMA busy_timeout=0")
+        blocker = sqlite3.connect(str(db_path), isolation_level=None)
+        blocker.execute("BEGIN IMMEDIATE")
+
+        store.store_message(_msg())
+        # Reads report what is on disk instead of raising the flush error
+        assert store.get_message_count() == 0
+        with pytest.raises(sqlite3.OperationalError):
+            store.flush()
+
+        blocker.execute("ROLLBACK")
+        blocker.close()
+        assert store.get_message_count() == 1
+        store.close()
+
+    def test_run_flusher(self, tmp_path):
+        db_path = tmp_path / "wingman.db"
+        store = MessageStore(db_path)
+        other = MessageStore(db_path)
+
+        async def run():
+            task = asyncio.create_task(store.run_flusher(interval=0.01))
+            store.store_message(_msg())
+            # Wait for the flusher to commit the buffered row
+            for _ in range(200):
+                await asyncio.sleep(0.01)
+                if other.get_message_count() == 1:
+                    break
+            task.cancel()
+
+        asyncio.run(run())
+        assert other.get_message_count() == 1
+        store.close()
+        other.close()
+
+    def test_async_variants(self, tmp_path):
+        store = MessageStore(tmp_path / "wingman.db")
+
+        async def run():
+            await store.astore_message(_msg(text="one", ts=1.0))
+            await store.astore_message(_msg(text="two", ts=2.0, is_self=True))
+            messages = await store.aget_recent_messages("chat")
+            return [m.text for m in messages], await store.awas_last_message_from_self("chat")
+
+        assert asyncio.run(run()) == (["one", "two"], True)
+        store.close()
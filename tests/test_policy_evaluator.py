@@ -0,0 +1,145 @@
+"""Tests for PolicyEvaluator rule loading and matching."""
+
+import os
+
+from wingman.config.registry import (
+    ContactProfile,
+    ContactRole,
+    ContactTone,
+    GroupCategory,
+    GroupConfig,
+    ReplyPolicy,
+)
+from wingman.core.policy import evaluator as evaluator_module
+from wingman.core.policy.evaluator import PolicyEvaluator, PolicyRule
+
+POLICIES = """\
+rules:
+  - name: work_groups
+    conditions:
+      is_group: true
+      group_category: work
+    action: never
+  - name: friend_dms
+    conditions:
+      is_dm: true
+      role: friend
+    action: always
+fallback:
+  action: selective
+"""
+
+
+def _contact(role=ContactRole.FRIEND):
+    return ContactProfile(jid="alice", name="Alice", role=role, tone=ContactTone.CASUAL)
+
+
+def _group(category=GroupCategory.WORK):
+    return GroupConfig(
+        jid="group", name="Group", category=category, reply_policy=ReplyPolicy.SELECTIVE
+    )
+
+
+class TestPolicyEvaluator:
+    def setup_method(self):
+        evaluator_module._CONFIG_CACHE.clear()
+
+    def _evaluator(self, tmp_path, text=POLICIES):
+        path = tmp_path / "policies.yaml"
+        path.write_text(text)
+        return PolicyEvaluator(path, bot_name="Maximus")
+
+    def test_rules_match_in_order(self, tmp_path):
+        evaluator = self._evaluator(tmp_path)
+
+        context = evaluator.create_context("group", "alice", "hi", True, _contact(), _group())
+        decision = evaluator.evaluate(context)
+        assert decision.rule_name == "work_groups"
+        assert not decision.should_respond
+
+        context = evaluator.create_context("alice", "alice", "hi", False, _contact())
+        decision = evaluator.evaluate(context)
+        assert decision.rule_name == "friend_dms"
+        assert decision.should_respond
+
+    def test_fallback_responds_when_mentioned(self, tmp_path):
+        evaluator = self._evaluator(tmp_path)
+        group = _group(GroupCategory.FRIENDS)
+
+        context = evaluator.create_context("group", "alice", "hello all", True, _contact(), group)
+        decision = evaluator.evaluate(context)
+        assert decision.reason == "fallback"
+        assert not decision.should_respond
+
+        context = evaluator.create_context(
+            "group", "alice", "hey @maximus?", True, _contact(), group
+        )
+        assert evaluator.evaluate(context).should_respond
+
+    def test_unchanged_config_is_parsed_once(self, tmp_path):
+        first = self._evaluator(tmp_path)
+        second = PolicyEvaluator(tmp_path / "policies.yaml")
+        assert first._rules is not second._rules
+        assert all(a is b for a, b in zip(first._rules, second._rules, strict=True))
+
+    def test_edited_config_is_reparsed(self, tmp_path):
+        first = self._evaluator(tmp_path)
+        path = tmp_path / "policies.yaml"
+        path.write_text(POLICIES.replace("action: never", "action: always"))
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        second = PolicyEvaluator(path)
+        assert first._rules[0].action == ReplyPolicy.NEVER
+        assert second._rules[0].action == ReplyPolicy.ALWAYS
+
+    def test_compiled_conditions(self):
+        evaluator = PolicyEvaluator()
+        rule = PolicyRule.from_dict(
+            {"conditions": {"group_category": "work", "unknown_key": 1}, "action": "never"}
+        )
+        assert rule.match(evaluator.create_context("g", "a", "", True, _contact(), _group()))
+        assert not rule.match(evaluator.create_context("a", "a", "", False, _contact()))
+        assert PolicyRule.from_dict({"name": "any"}).match(
+            evaluator.create_context("a", "a", "", False, _contact())
+        )
+
+    def test_condition_values_are_not_code(self):
+        evaluator = PolicyEvaluator()
+        rule = PolicyRule.from_dict({"conditions": {"platform": "x' or True or '"}})
+        assert not rule.match(evaluator.create_context("a", "a", "", False, _contact()))
+
+    def test_mentions_match_whole_words(self):
+        evaluator = PolicyEvaluator(bot_name="Maximus")
+        assert evaluator.check_mentioned("hey Maximus, you there?")
+        assert evaluator.check_mentioned("@maximus ping")
+        assert not evaluator.check_mentioned("maximusfan was here")
+        assert not evaluator.check_mentioned("")
+
+    def test_mention_scan_skipped_when_not_needed(self, tmp_path):
+        evaluator = self._evaluator(tmp_path)
+        scans = []
+        evaluator.check_mentioned = lambda text: scans.append(text) or True
+
+        # ALWAYS rule: no scan
+        context = evaluator.create_context("alice", "alice", "hi", False, _contact())
+        assert evaluator.evaluate(context).should_respond
+        assert scans == []
+
+        # SELECTIVE fallback: scanned on demand
+        group = _group(GroupCategory.FRIENDS)
+        context = evaluator.create_context("group", "alice", "hi max", True, _contact(), group)
+        assert evaluator.evaluate(context).should_respond
+        assert scans == ["hi max"]
+        assert context.is_mentioned
+
+    def test_mention_condition_checked_before_rules(self, tmp_path):
+        evaluator = self._evaluator(
+            tmp_path,
+            "rules:\n  - name: mentioned\n    conditions:\n      is_mentioned: true\n"
+            "    action: always\nfallback:\n  action: never\n",
+        )
+        context = evaluator.create_context("g", "a", "ok Maximus", True, _contact(), _group())
+        assert evaluator.evaluate(context).rule_name == "mentioned"
+        context = evaluator.create_context("g", "a", "ok", True, _contact(), _group())
+        assert evaluator.evaluate(context).reason == "fallback"
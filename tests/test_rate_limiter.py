@@ -0,0 +1,41 @@
+"""Tests for the token-bucket RateLimiter."""
+
+import pytest
+
+from wingman.core.safety import RateLimiter
+
+
+class TestRateLimiter:
+    def test_burst_is_capped(self):
+        limiter = RateLimiter(max_replies_per_hour=3)
+        for _ in range(3):
+            assert limiter.can_reply()
+            limiter.record_reply()
+        assert not limiter.can_reply()
+        assert limiter.get_remaining() == 0
+        assert limiter.get_reset_time() > 0
+
+    def test_tokens_refill_over_time(self):
+        limiter = RateLimiter(max_replies_per_hour=3)
+        now = limiter._last_refill
+        for _ in range(3):
+            limiter.record_reply(now=now)
+        assert limiter.get_reset_time(now=now) == pytest.approx(1200)
+
+        now += 1500
+        assert limiter.can_reply(now=now)
+        assert limiter.get_remaining(now=now) == 1
+        assert limiter.get_reset_time(now=now) == 0
+
+        # Refill never exceeds the hourly maximum
+        now += 10 * 3600
+        assert limiter.get_remaining(now=now) == 3
+
+    def test_earlier_reading_does_not_rewind_clock(self):
+        limiter = RateLimiter(max_replies_per_hour=3)
+        start = limiter._last_refill
+        limiter.record_reply(now=start + 100)
+        # A handler that read the clock before that reply records with its reading
+        limiter.record_reply(now=start + 50)
+        assert limiter._last_refill == start + 100
+        assert limiter.get_remaining(now=start + 100) == 1
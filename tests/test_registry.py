@@ -0,0 +1,149 @@
+"""Tests for ContactRegistry and GroupRegistry resolution and reloading."""
+
+import dataclasses
+import os
+
+import pytest
+
+from wingman.config.registry import (
+    ContactRegistry,
+    ContactRole,
+    ContactTone,
+    GroupCategory,
+    GroupRegistry,
+    ReplyPolicy,
+)
+
+CONTACTS = """\
+contacts:
+  "+15550001111@s.whatsapp.net":
+    name: Alice
+    role: girlfriend
+    tone: affectionate
+    imessage_id: "+15550001111"
+  "imessage:+15550002222":
+    name: Bob
+    role: friend
+    tone: casual
+  "+15550002222@s.whatsapp.net":
+    name: Bob WhatsApp
+    role: friend
+    tone: sarcastic
+    imessage_id: "+15550002222"
+  "+15550003333@s.whatsapp.net":
+    name: Carol
+    role: colleague
+    tone: neutral
+    imessage_id: carol@icloud.com
+defaults:
+  role: unknown
+  tone: neutral
+"""
+
+GROUPS = """\
+groups:
+  "123@g.us":
+    name: Family
+    category: family
+    reply_policy: always
+defaults:
+  category: unknown
+  reply_policy: never
+"""
+
+
+def _write(path, text):
+    path.write_text(text)
+    # Make sure the reload check sees a new mtime even on coarse filesystems
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def contacts(tmp_path):
+    path = tmp_path / "contacts.yaml"
+    _write(path, CONTACTS)
+    return ContactRegistry(path, auto_reload=False)
+
+
+class TestContactRegistry:
+    def test_whatsapp_jid(self, contacts):
+        assert contacts.resolve("+15550001111@s.whatsapp.net").name == "Alice"
+
+    def test_linked_imessage_id_prefixed_and_bare(self, contacts):
+        assert contacts.resolve("imessage:+15550001111").name == "Alice"
+        assert contacts.resolve("+15550001111").name == "Alice"
+        assert contacts.resolve("imessage:carol@icloud.com").name == "Carol"
+
+    def test_direct_imessage_contact_beats_linked_id(self, contacts):
+        # "imessage:+15550002222" is both a contact key and a linked iMessage ID
+        assert contacts.resolve("imessage:+15550002222").name == "Bob"
+        assert contacts.resolve("+15550002222").name == "Bob"
+        assert contacts.resolve("+15550002222@s.whatsapp.net").name == "Bob WhatsApp"
+
+    def test_bare_email_is_not_prefixed(self, contacts):
+        # Identifiers containing "@" are never retried with the imessage: prefix
+        profile = contacts.resolve("carol@icloud.com")
+        assert profile.name == "Unknown"
+
+    def test_unknown_jid_gets_defaults(self, contacts):
+        profile = contacts.resolve("+19990000000@s.whatsapp.net")
+        assert profile.jid == "+19990000000@s.whatsapp.net"
+        assert profile.name == "Unknown"
+        assert profile.role == ContactRole.UNKNOWN
+        assert profile.tone == ContactTone.NEUTRAL
+        assert not contacts.is_known(profile.jid)
+
+    def test_unknown_profile_is_immutable(self, contacts):
+        profile = contacts.resolve("stranger")
+        assert contacts.resolve("stranger") == profile
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            profile.name = "Mallory"
+
+    def test_resolve_many_matches_resolve(self, contacts):
+        jids = [
+            "+15550001111@s.whatsapp.net",
+            "+15550001111",
+            "imessage:+15550002222",
+            "carol@icloud.com",
+            "nobody",
+        ]
+        assert contacts.resolve_many(jids) == [contacts.resolve(jid) for jid in jids]
+
+    def test_reload_swaps_index(self, contacts, tmp_path):
+        path = tmp_path / "contacts.yaml"
+        _write(
+            path,
+            CONTACTS.replace("name: Alice", "name: Alicia").replace(
+                "role: unknown", "role: friend"
+            ),
+        )
+        contacts._reload()
+
+        assert contacts.resolve("+15550001111").name == "Alicia"
+        assert contacts.resolve("imessage:+15550001111").name == "Alicia"
+        # New defaults apply to unknown contacts resolved after the reload
+        assert contacts.resolve("stranger").role == ContactRole.FRIEND
+
+    def test_unchanged_file_is_not_reloaded(self, contacts):
+        tables = contacts._tables
+        contacts._reload()
+        assert contacts._tables is tables
+
+
+class TestGroupRegistry:
+    def test_known_and_unknown_groups(self, tmp_path):
+        path = tmp_path / "groups.yaml"
+        _write(path, GROUPS)
+        groups = GroupRegistry(path, auto_reload=False)
+
+        family = groups.resolve("123@g.us")
+        assert family.category == GroupCategory.FAMILY
+        assert family.reply_policy == ReplyPolicy.ALWAYS
+
+        unknown = groups.resolve("999@g.us")
+        assert unknown.name == "Unknown Group"
+        assert unknown.reply_policy == ReplyPolicy.NEVER
+
+        jids = ["123@g.us", "999@g.us"]
+        assert groups.resolve_many(jids) == [groups.resolve(jid) for jid in jids]
@@ -1,13 +1,18 @@
 """Tests for RPC client and server."""
 
+import asyncio
 import json
 import os
 import socket
 import tempfile
 import threading
 from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
 
 from wingman.core.rpc_client import RPCClient, RPCError
+from wingman.core.rpc_server import RPCServer
 
 
 def _short_sock_path():
@@ -18,6 +23,19 @@ def _short_sock_path():
     return Path(path)
 
 
+def _recv_frame(conn):
+    """Read one length-prefixed message from a socket."""
+    data = b""
+    while len(data) < 4 or len(data) < 4 + int.from_bytes(data[:4], "big"):
+        data += conn.recv(4096)
+    return data[4:]
+
+
+def _send_frame(conn, payload):
+    """Write one length-prefixed message to a socket."""
+    conn.sendall(len(payload).to_bytes(4, "big") + payload)
+
+
 class TestRPCClient:
     def test_not_available(self, tmp_path):
         client = RPCClient(tmp_path / "nonexistent.sock")
@@ -50,18 +68,16 @@ class TestRPCClient:
 
             def mock_server():
                 conn, _ = server_sock.accept()
-                data = b""
-                while b"\0" not in data:
-                    data += conn.recv(4096)
+                data = _recv_frame(conn)
 
                 # Parse request
-                request = json.loads(data.split(b"\0")[0])
+                request = json.loads(data)
                 response = {
                     "id": request["id"],
                     "result": {"pong": True},
                     "error": None,
                 }
-                conn.sendall(json.dumps(response).encode() + b"\0")
+                _send_frame(conn, json.dumps(response).encode())
                 response_sent.set()
                 conn.close()
 
@@ -91,17 +107,15 @@ class TestRPCClient:
 
             def mock_server():
                 conn, _ = server_sock.accept()
-                data = b""
-                while b"\0" not in data:
-                    data += conn.recv(4096)
+                data = _recv_frame(conn)
 
-                request = json.loads(data.split(b"\0")[0])
+                request = json.loads(data)
                 response = {
                     "id": request["id"],
                     "result": None,
                     "error": "Test error message",
                 }
-                conn.sendall(json.dumps(response).encode() + b"\0")
+                _send_frame(conn, json.dumps(response).encode())
                 conn.close()
 
             thread = threading.Thread(target=mock_server, daemon=True)
@@ -126,3 +140,135 @@ class TestRPCClientMethods:
         assert hasattr(client, "resume")
         assert hasattr(client, "get_status")
         assert hasattr(client, "list_active_chats")
+
+
+class TestRPCServer:
+    def _roundtrip(self, *calls, chats=None):
+        """Run RPCServer and make blocking client calls against it."""
+        sock_path = _short_sock_path()
+        agent = MagicMock()
+        agent.processor.store.get_recent_chats.return_value = chats or [{"chat_id": "c", "n": 1}]
+
+        def run_calls():
+            results = []
+            with RPCClient(sock_path, timeout=5.0) as client:
+                for method, params in calls:
+                    try:
+                        results.append(client.call(method, params))
+                    except RPCError as e:
+                        results.append(e)
+            return results
+
+        async def main():
+            server = RPCServer(sock_path, agent)
+            await server.start()
+            try:
+                return await asyncio.to_thread(run_calls)
+            finally:
+                await server.stop()
+
+        return asyncio.run(main())
+
+    def test_calls_roundtrip(self):
+        ping, chats = self._roundtrip(("ping", None), ("list_active_chats", {"limit": 5}))
+        assert ping["pong"] is True
+        assert chats == {"chats": [{"chat_id": "c", "n": 1}]}
+
+    @pytest.mark.parametrize("count", [200, 1000])
+    def test_large_messages_span_reads(self, count):
+        # 1000 chats don't fit the client's reusable receive buffer
+        chats = [{"chat_id": f"chat-{i}", "text": "x" * 100} for i in range(count)]
+        result, ping = self._roundtrip(
+            ("list_active_chats", {"limit": count, "pad": "y" * 10000}),
+            ("ping", None),
+            chats=chats,
+        )
+        assert result == {"chats": chats}
+        assert ping["pong"] is True
+
+    def test_stdlib_json_fallback(self, monkeypatch):
+        monkeypatch.setattr("wingman.core.rpc_client.orjson", None)
+        monkeypatch.setattr("wingman.core.rpc_server.orjson", None)
+        (ping,) = self._roundtrip(("ping", None))
+        assert ping["pong"] is True
+
+    def test_unknown_method(self):
+        (error,) = self._roundtrip(("nope", None))
+        assert isinstance(error, RPCError)
+        assert "Unknown method" in str(error)
+
+    def test_connection_is_reused_and_reopened(self):
+        sock_path = _short_sock_path()
+        agent = MagicMock()
+        client = RPCClient(sock_path, timeout=5.0)
+
+        async def main():
+            server = RPCServer(sock_path, agent)
+            await server.start()
+            await asyncio.to_thread(client.ping)
+            first = client._sock
+            await asyncio.to_thread(client.ping)
+            assert client._sock is first
+            await server.stop()
+
+            # A restarted daemon is reached on a fresh connection
+            server = RPCServer(sock_path, agent)
+            await server.start()
+            try:
+                assert await asyncio.to_thread(client.ping)
+                assert client._sock is not first
+            finally:
+                client.close()
+                await server.stop()
+
+        asyncio.run(main())
+
+    def _drop_after_request(self, method):
+        """Call `method` on a reused connection that the daemon closes after reading it."""
+        sock_path = _short_sock_path()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(sock_path))
+        server.listen(2)
+        received = []
+
+        def serve():
+            conn, _ = server.accept()
+            with conn:
+                request = json.loads(_recv_frame(conn))
+                _send_frame(conn, json.dumps({"id": request["id"], "result": {}}).encode())
+                received.append(json.loads(_recv_frame(conn))["method"])
+            # A retry arrives on a second connection
+            server.settimeout(1.0)
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                return
+            with conn:
+                request = json.loads(_recv_frame(conn))
+                received.append(request["method"])
+                _send_frame(conn, json.dumps({"id": request["id"], "result": {"ok": 1}}).encode())
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+        try:
+            with RPCClient(sock_path, timeout=5.0) as client:
+                client.call("ping")
+                try:
+                    result = client.call(method, {})
+                except RPCError as e:
+                    result = e
+        finally:
+            thread.join()
+            server.close()
+            sock_path.unlink()
+        return result, received
+
+    def test_non_idempotent_call_is_not_resent(self):
+        result, received = self._drop_after_request("send_message")
+        assert isinstance(result, RPCError)
+        assert received == ["send_message"]
+
+    def test_idempotent_call_is_retried(self):
+        result, received = self._drop_after_request("get_status")
+        assert result == {"ok": 1}
+        assert received == ["get_status", "get_status"]
@@ -0,0 +1,33 @@
+"""Tests for TriggerDetector."""
+
+from unittest.mock import patch
+
+from wingman.core.safety import TriggerDetector
+
+
+class TestTriggerDetector:
+    def test_has_trigger_ignores_case(self):
+        detector = TriggerDetector("Maximus", additional_triggers=["Hey Bot"])
+        assert detector.has_trigger("so MAXIMUS what now")
+        assert detector.has_trigger("hey bot!")
+        assert not detector.has_trigger("maximusfan")
+        assert not detector.has_trigger("")
+
+    def test_is_direct_mention(self):
+        detector = TriggerDetector("Maximus")
+        assert detector.is_direct_mention("  @Maximus ping")
+        assert detector.is_direct_mention("Maximus, hi")
+        assert not detector.is_direct_mention("hi maximus")
+
+    def test_add_and_remove_recompile_lazily(self):
+        detector = TriggerDetector("Maximus")
+        with patch.object(detector, "_compile_patterns", wraps=detector._compile_patterns) as c:
+            for trigger in ("Hey Bot", "yo bot", "max"):
+                detector.add_trigger(trigger)
+            detector.remove_trigger("max")
+            c.assert_not_called()
+
+            assert detector.has_trigger("YO BOT, help")
+            assert not detector.has_trigger("max?")
+            assert detector.is_direct_mention("hey bot what's up")
+            c.assert_called_once()
@@ -1,5 +1,7 @@
 """Tests for the YAML writer utility."""
 
+import math
+import stat
 import tempfile
 from pathlib import Path
 
@@ -8,6 +10,7 @@ import yaml
 from wingman.config.yaml_writer import (
     _coerce_value,
     get_nested_value,
+    load_yaml,
     read_yaml,
     set_nested_value,
     write_yaml,
@@ -42,6 +45,27 @@ class TestReadYaml:
         result = read_yaml(f)
         assert result == {}
 
+    def test_no_cache_file_written(self, tmp_path):
+        f = tmp_path / "test.yaml"
+        f.write_text("api_key: secret\n")
+        assert read_yaml(f) == {"api_key": "secret"}
+        assert load_yaml(f) == {"api_key": "secret"}
+        assert [p.name for p in tmp_path.iterdir()] == ["test.yaml"]
+
+
+class TestLoadYaml:
+    def test_unchanged_file_reuses_parse(self, tmp_path):
+        f = tmp_path / "test.yaml"
+        f.write_text("key: value\n")
+        assert load_yaml(f) is load_yaml(f)
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        f = tmp_path / "test.yaml"
+        f.write_text("key: value\n")
+        assert load_yaml(f) == {"key": "value"}
+        f.write_text("key: other value\n")
+        assert load_yaml(f) == {"key": "other value"}
+
 
 class TestWriteYaml:
     def test_write_creates_file(self, tmp_path):
@@ -63,6 +87,28 @@ class TestWriteYaml:
         result = read_yaml(f)
         assert result == data
 
+    def test_write_keeps_file_mode(self, tmp_path):
+        f = tmp_path / "config.yaml"
+        f.write_text("openai:\n  api_key: old\n")
+        f.chmod(0o600)
+        write_yaml(f, {"openai": {"api_key": "new"}})
+        assert stat.S_IMODE(f.stat().st_mode) == 0o600
+        assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+    def test_new_file_is_private(self, tmp_path):
+        f = tmp_path / "config.yaml"
+        write_yaml(f, {"a": 1})
+        assert stat.S_IMODE(f.stat().st_mode) == 0o600
+
+    def test_write_through_symlink(self, tmp_path):
+        target = tmp_path / "real.yaml"
+        target.write_text("a: 1\n")
+        link = tmp_path / "config.yaml"
+        link.symlink_to(target)
+        write_yaml(link, {"a": 2})
+        assert link.is_symlink()
+        assert read_yaml(target) == {"a": 2}
+
 
 class TestSetNestedValue:
     def test_simple_key(self):
@@ -109,6 +155,10 @@ class TestGetNestedValue:
     def test_empty_data(self):
         assert get_nested_value({}, "key") is None
 
+    def test_non_dict_data(self):
+        assert get_nested_value(["item"], "key") is None
+        assert get_nested_value("scalar", "openai.model") is None
+
 
 class TestCoerceValue:
     def test_bool_true(self):
@@ -131,6 +181,12 @@ class TestCoerceValue:
         assert _coerce_value("3.14") == 3.14
         assert _coerce_value("0.8") == 0.8
 
+    def test_float_specials(self):
+        assert _coerce_value("inf") == float("inf")
+        assert _coerce_value("-Infinity") == float("-inf")
+        assert math.isnan(_coerce_value("NaN"))
+        assert _coerce_value("info") == "info"
+
     def test_string(self):
         assert _coerce_value("hello") == "hello"
         assert _coerce_value("gpt-4o") == "gpt-4o"